@@ -0,0 +1,63 @@
+import random
+from pathlib import Path
+
+# Frequência aproximada das letras em textos em português (%)
+LETTER_FREQUENCIES = {
+    "a": 14.6, "e": 12.6, "o": 10.7, "s": 7.8, "r": 6.5, "i": 6.2, "n": 5.0,
+    "d": 5.0, "m": 4.7, "u": 4.6, "t": 4.3, "c": 3.9, "l": 2.8, "p": 2.5,
+    "v": 1.7, "g": 1.3, "h": 1.3, "q": 1.2, "b": 1.0, "f": 1.0, "z": 0.5,
+    "j": 0.4, "x": 0.2, "k": 0.02, "w": 0.01, "y": 0.01,
+}
+
+# Variantes acentuadas sorteadas no lugar da letra base
+ACCENTS = {"a": "áãâà", "e": "éê", "i": "í", "o": "óõô", "u": "úü", "c": "ç"}
+
+# Distribuição de tamanhos (3 a 15 letras), com pico em 7-8
+LENGTH_WEIGHTS = {3: 2, 4: 5, 5: 9, 6: 13, 7: 15, 8: 15, 9: 12, 10: 10,
+                  11: 7, 12: 5, 13: 3, 14: 2, 15: 2}
+
+
+def generate_words(count, seed=0, accent_rate=0.03, chunk_size=100000):
+    """Gera palavras sintéticas em blocos (listas de até chunk_size palavras)"""
+    rng = random.Random(seed)
+    letters = list(LETTER_FREQUENCIES)
+    weights = list(LETTER_FREQUENCIES.values())
+    lengths = list(LENGTH_WEIGHTS)
+    length_weights = list(LENGTH_WEIGHTS.values())
+
+    remaining = count
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        sizes = rng.choices(lengths, length_weights, k=size)
+        stream = rng.choices(letters, weights, k=sum(sizes))
+        # Acentos em uma fração das vogais (e do c), como no dicionário real
+        for position in range(len(stream)):
+            variants = ACCENTS.get(stream[position])
+            if variants and rng.random() < accent_rate:
+                stream[position] = rng.choice(variants)
+
+        words = []
+        start = 0
+        for length in sizes:
+            words.append("".join(stream[start:start + length]))
+            start += length
+        yield words
+        remaining -= size
+
+
+def generate_dictionary(path, count, seed=0, accent_rate=0.03):
+    """Grava um dicionário sintético de count palavras (uma por linha)"""
+    path = Path(path)
+    with open(path, 'w', encoding='utf-8') as file:
+        for words in generate_words(count, seed, accent_rate):
+            file.write("\n".join(words))
+            file.write("\n")
+    return path
+
+
+def dictionary_for(directory, count, seed=0):
+    """Caminho do dicionário sintético de count palavras, gerado se necessário"""
+    path = Path(directory) / f"sintetico_{count}_{seed}.txt"
+    if not path.exists():
+        generate_dictionary(path, count, seed)
+    return path
@@ -0,0 +1,376 @@
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.generator import dictionary_for
+from game.difficulty import Difficulty
+from game.engine import RoundState, calculate_score
+from game.player import Player
+from game.player_table import PlayerTable
+from game.random_service import RandomService
+from game.simulation import FrequencyStrategy, play_headless
+from game.word_index import WordIndex
+from utils.compiled_words import CompiledWordStore, compile_words
+from utils.display import Display
+from utils.word_store import WordStore
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+DEFAULT_CACHE = Path(tempfile.gettempdir()) / "forca-benchmarks"
+
+# Registro: nome -> (função de preparo, depende do tamanho do dicionário)
+BENCHMARKS = {}
+
+
+def benchmark(name, sized=False):
+    """Registra uma função de preparo que devolve (chamada, operações por chamada)"""
+    def decorator(function):
+        BENCHMARKS[name] = (function, sized)
+        return function
+    return decorator
+
+
+class Workload:
+    """Dicionário sintético e estruturas derivadas, montadas sob demanda
+
+    O próprio dicionário só é gerado (ou lido do cache) no primeiro acesso
+    a path, então benchmarks que não o usam não pagam a geração. Sem size
+    não há dicionário.
+    """
+
+    def __init__(self, directory, size=None, seed=0):
+        self.directory = Path(directory)
+        self.size = size
+        self.seed = seed
+        self._path = None
+        self._words = None
+        self._index = None
+        self._compiled_path = None
+
+    @property
+    def path(self):
+        if self._path is None:
+            if self.size is None:
+                raise ValueError("Benchmark sem dicionário não pode usar workload.path")
+            self._path = dictionary_for(self.directory, self.size, self.seed)
+        return self._path
+
+    @property
+    def words(self):
+        if self._words is None:
+            self._words = WordStore(self.path)
+        return self._words
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = WordIndex.from_store(self.words)
+        return self._index
+
+    @property
+    def compiled_path(self):
+        if self._compiled_path is None:
+            self._compiled_path = self.path.with_suffix(".bin")
+            if not self._compiled_path.exists():
+                compile_words(self.path, self._compiled_path)
+        return self._compiled_path
+
+    def close(self):
+        if self._words is not None:
+            self._words.close()
+            self._words = None
+
+
+# Dicionário
+
+@benchmark("load_text", sized=True)
+def bench_load_text(workload):
+    def run():
+        WordStore(workload.path).close()
+    return run, 1
+
+
+@benchmark("load_compiled", sized=True)
+def bench_load_compiled(workload):
+    path = workload.compiled_path
+
+    def run():
+        CompiledWordStore(path).close()
+    return run, 1
+
+
+@benchmark("index_build", sized=True)
+def bench_index_build(workload):
+    words = workload.words
+    return lambda: WordIndex.from_store(words), 1
+
+
+@benchmark("choose_word", sized=True)
+def bench_choose_word(workload, ops=1000):
+    """Mesmo caminho de HangmanGame.choose_word: sequência pré-sorteada + leitura"""
+    words = workload.words
+    index = workload.index
+    service = RandomService(workload.seed)
+    rng = service.stream("palavras")
+    difficulties = list(Difficulty)
+
+    def run():
+        for step in range(ops):
+            position = service.next_word(index, difficulties[step & 3])
+            if position is None:
+                position = rng.randrange(len(words))
+            words[position]
+    return run, ops
+
+
+@benchmark("headless_round", sized=True)
+def bench_headless_round(workload, ops=200):
+    words = workload.words
+    index = workload.index
+    strategy = FrequencyStrategy()
+    service = RandomService(workload.seed)
+    rng = service.stream("jogadas")
+
+    def run():
+        for _ in range(ops):
+            position = service.next_word(index, Difficulty.NORMAL)
+            if position is None:
+                position = service.stream("palavras").randrange(len(words))
+            state = RoundState(words[position], Difficulty.NORMAL.max_errors, 2,
+                               position, words.mask(position))
+            play_headless(state, strategy, rng)
+    return run, ops
+
+
+# Pontuação, jogadores e tela
+
+@benchmark("calculate_score")
+def bench_calculate_score(workload, ops=10000):
+    cases = [("programacao", errors, hints, difficulty)
+             for difficulty in Difficulty for errors in range(4) for hints in range(3)]
+
+    def run():
+        for step in range(ops):
+            calculate_score(*cases[step % len(cases)])
+    return run, ops
+
+
+@benchmark("player_aggregate")
+def bench_player_aggregate(workload, ops=1000):
+    rng = random.Random(workload.seed)
+    results = [rng.random() < 0.6 for _ in range(ops)]
+
+    def run():
+        players = [Player("Ana") for _ in range(10)]
+        for step, won in enumerate(results):
+            player = players[step % 10]
+            if won:
+                player.add_win(50)
+            else:
+                player.add_loss(6, 1)
+        total = players[0]
+        for player in players[1:]:
+            total = total + player
+        return total.win_rate, total.average_errors
+    return run, ops
+
+
+@benchmark("player_table")
+def bench_player_table(workload, ops=100000):
+    """Agrupamento por nome, taxas e top-K em colunas (ops = linhas)"""
+    rng = random.Random(workload.seed)
+    table = PlayerTable()
+    for step in range(ops):
+        played = rng.randrange(1, 50)
+        table.append(f"Jogador{step % (ops // 4)}", rng.randrange(5000), played,
+                     rng.randrange(played + 1), rng.randrange(played * 6), rng.randrange(played),
+                     step, step)
+
+    def run():
+        grouped = table.group_by_name()
+        grouped.top(10, grouped.win_rates())
+        grouped.average_errors()
+        return grouped.top(10)
+    return run, ops
+
+
+@benchmark("show_game_state")
+def bench_show_game_state(workload, ops=1000):
+    word = "paralelepipedo"
+    correct = set("pale")
+    used = set("paleszx")
+    sink = io.StringIO()
+
+    def run():
+        with contextlib.redirect_stdout(sink):
+            for step in range(ops):
+                Display.show_game_state(word, correct, used, step % 7, 6)
+        sink.seek(0)
+        sink.truncate()
+    return run, ops
+
+
+@benchmark("render_cached")
+def bench_render_cached(workload, ops=1000):
+    word = "paralelepipedo"
+    states = []
+    state = RoundState(word, 6)
+    for letter in "paleszxdo":
+        state.apply_guess(letter)
+        states.append((state.correct_mask, state.used_mask, state.errors))
+
+    def run():
+        cache = Display.render_cache
+        for step in range(ops):
+            correct_mask, used_mask, errors = states[step % len(states)]
+            cache.state_lines(word, correct_mask, used_mask, errors, 6)
+    return run, ops
+
+
+def measure(run, ops, repeat, min_time=0.2):
+    """Tempos por operação (ns) de repeat amostras de pelo menos min_time segundos"""
+    run()  # aquecimento
+    samples = []
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter_ns()
+        elapsed = 0
+        while not calls or elapsed < min_time * 1e9:
+            run()
+            calls += 1
+            elapsed = time.perf_counter_ns() - start
+        samples.append(elapsed / (calls * ops))
+    return {
+        "ns_per_op": statistics.median(samples),
+        "min_ns_per_op": min(samples),
+        "samples": len(samples),
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, names=None, repeat=5, min_time=0.2,
+              cache_dir=DEFAULT_CACHE, seed=0, log=print):
+    """Executa os benchmarks e devolve o resultado em forma de dicionário (JSON)"""
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    selected = {name: entry for name, entry in BENCHMARKS.items() if not names or name in names}
+    if not selected:
+        raise ValueError(f"Nenhum benchmark encontrado: {', '.join(names)}")
+
+    results = {}
+
+    def record(key, setup, workload):
+        run, ops = setup(workload)
+        results[key] = measure(run, ops, repeat, min_time)
+        log(f"  {key:<32}{results[key]['ns_per_op']:>14,.0f} ns/op")
+
+    workloads = []
+    try:
+        sized = [(name, setup) for name, (setup, by_size) in selected.items() if by_size]
+        if sized:
+            for size in sizes:
+                log(f"Dicionário sintético: {size} palavras")
+                workload = Workload(cache_dir, size, seed)
+                workloads.append(workload)
+                for name, setup in sized:
+                    record(f"{name}[{size}]", setup, workload)
+
+        fixed = [(name, setup) for name, (setup, by_size) in selected.items() if not by_size]
+        if fixed:
+            log("Sem dicionário")
+            for name, setup in fixed:
+                record(name, setup, Workload(cache_dir, seed=seed))
+    finally:
+        for workload in workloads:
+            workload.close()
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "repeat": repeat,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=0.10):
+    """Compara com uma linha de base; devolve (linhas do relatório, regressões)"""
+    lines = [f"{'benchmark':<32}{'base ns/op':>14}{'atual ns/op':>14}{'variação':>10}"]
+    regressions = []
+    for key, result in current["results"].items():
+        reference = baseline.get("results", {}).get(key)
+        if reference is None:
+            lines.append(f"{key:<32}{'-':>14}{result['ns_per_op']:>14,.0f}{'novo':>10}")
+            continue
+        change = result["ns_per_op"] / reference["ns_per_op"] - 1
+        marker = " ❌" if change > threshold else ""
+        lines.append(f"{key:<32}{reference['ns_per_op']:>14,.0f}{result['ns_per_op']:>14,.0f}"
+                     f"{change:>+10.1%}{marker}")
+        if change > threshold:
+            regressions.append(key)
+    return lines, regressions
+
+
+def save_results(results, path):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
+
+
+def load_results(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmarks do Jogo da Forca")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Tamanhos dos dicionários sintéticos (10000 a 10000000)")
+    parser.add_argument("--only", nargs="+", metavar="NOME", help="Executa só estes benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="Amostras por benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Segundos mínimos por amostra")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE),
+                        help="Onde guardar os dicionários gerados")
+    parser.add_argument("--output", "-o", help="Grava o resultado em JSON")
+    parser.add_argument("--baseline", help="JSON de referência para comparação")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Piora relativa que conta como regressão (padrão: 0.10)")
+    parser.add_argument("--list", action="store_true", help="Lista os benchmarks e sai")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, sized) in BENCHMARKS.items():
+            print(f"{name}{' (por tamanho)' if sized else ''}")
+        return 0
+
+    results = run_suite(args.sizes, args.only, args.repeat, args.min_time, args.cache_dir, args.seed)
+    if args.output:
+        save_results(results, args.output)
+        print(f"✅ Resultado gravado em {args.output}")
+
+    if args.baseline:
+        lines, regressions = compare(results, load_results(args.baseline), args.threshold)
+        print("\n".join(lines))
+        if regressions:
+            print(f"❌ {len(regressions)} regressão(ões) acima de {args.threshold:.0%}: "
+                  f"{', '.join(regressions)}")
+            return 1
+        print("✅ Nenhuma regressão acima do limite")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,249 @@
-import random
 import sys
+import threading
+import time
 from utils.file_manager import FileManager
 from utils.display import Display
 from game.player import Player
 from game.difficulty import Difficulty
+from game.engine import RoundState, calculate_score, validate_guess
+from game.random_service import RandomService
+from utils.profiler import PROFILER, timed
+from utils.startup_trace import TRACE
 
 class HangmanGame:
-    """Classe principal do jogo da forca com todos os recursos avançados"""
+    """Classe principal do jogo da forca com todos os recursos avançados
+
+    Só o necessário para a tela de boas-vindas é importado e aberto no
+    construtor. Dicionário, perfis (SQLite) e log de eventos são abertos
+    pela thread de carga; categorias e fotografias, no primeiro uso.
+    """
     
-    def __init__(self):
+    def __init__(self, shared_dict=None, event_log=False, watch=False, category=None,
+                 resume=None, seed=None):
         self.file_manager = FileManager("palavras.txt")
-        self.words = self.file_manager.read_words()
+        self.words = None
+        self.word_index = None
+        self.difficulty_table = None
+        
+        # Sorteios da sessão (palavras e dicas); a mesma semente repete a sessão
+        self.random = RandomService(seed)
         self.player = None
         self.difficulty = Difficulty.NORMAL
-        self.hints_used = 0
+        self.round = None
         self.max_hints = 2
+        
+        # Perfis persistentes (estatísticas de todas as sessões) e eventos
+        # estruturados de cada rodada (data/eventos.log): abertos pela thread de carga
+        self.players = None
+        self.events = None
+        self.session_id = 0
+        self.round_number = 0
+        
+        # Recarga do dicionário quando o arquivo muda (não se aplica ao compartilhado)
+        self.reloader = None
+        self.dictionary_version = 0
+        
+        # Outros dicionários de data/ (categorias), carregados só quando escolhidos
+        self._registry = None
+        self._registry_lock = threading.Lock()
+        self.default_category = self.category = self.file_manager.filepath.stem
+        self.fixed_category = category is not None
+        if category is not None:
+            self.registry.info(category)  # categoria inexistente falha já aqui
+            self.category = category
+        
+        # O dicionário (o padrão ou o de --category) carrega em segundo plano
+        # enquanto a tela de boas-vindas pede o nome; wait_dictionary() o aguarda
+        self._load_error = None
+        self._loader = threading.Thread(target=self._load_dictionary,
+                                        args=(shared_dict, watch, category, event_log),
+                                        name="dicionario", daemon=True)
+        self._loader.start()
+        
+        # Fotografias da sessão (data/sessoes/), para retomar após uma queda;
+        # resume: None = sessão nova, "" = a mais recente, ou o nome do jogador
+        self.snapshot_dir = self.file_manager.data_dir / "sessoes"
+        self.snapshots = None
+        self.resume = resume
+    
+    @property
+    def registry(self):
+        """Dicionários de data/, descobertos no primeiro uso (de qualquer thread)"""
+        with self._registry_lock:
+            if self._registry is None:
+                from game.dictionary_registry import DictionaryRegistry
+                self._registry = DictionaryRegistry(self.file_manager.data_dir)
+            return self._registry
+    
+    def _open_stores(self, event_log):
+        """Abre o banco de perfis e o log de eventos (thread de carga)"""
+        from game.events import EventLog, NullEventLog
+        from game.player_store import PlayerStore
+        
+        self.players = PlayerStore(self.file_manager.data_dir / "jogadores.db")
+        self.events = EventLog(self.file_manager.data_dir / "eventos.log") if event_log else NullEventLog()
+        self.session_id = self.events.new_session()
+    
+    def _load_dictionary(self, shared_dict, watch, category, event_log):
+        """Carrega palavras, índice e tabela de dificuldade (thread de carga)"""
+        try:
+            with TRACE.phase("perfis e eventos (segundo plano)"):
+                self._open_stores(event_log)
+            with TRACE.phase("dicionário (segundo plano)"):
+                if category is not None and category != self.default_category:
+                    self.words, self.word_index = self.registry.get(category)
+                    return
+                
+                from game.difficulty_table import DifficultyTable
+                from game.word_index import WordIndex
+                
+                # Com --watch o texto pode ser reescrito no lugar: cópia própria em vez de mmap
+                words = self.file_manager.read_words(shared_dict, private=watch and not shared_dict)
+                word_index = WordIndex.from_store(words)
+                self.difficulty_table = DifficultyTable.load_for(words)
+                if self.difficulty_table is not None:
+                    word_index.add_values(WordIndex.DIFFICULTY, self.difficulty_table.percentiles)
+                self.registry.adopt(self.default_category, words, word_index)
+                if watch and not shared_dict:
+                    from game.hot_reload import DictionaryReloader
+                    self.reloader = DictionaryReloader(self.file_manager, words, word_index).start()
+                self.words, self.word_index = words, word_index
+        except Exception as e:
+            self._load_error = e
+        finally:
+            TRACE.mark("dicionário pronto")
+    
+    def wait_dictionary(self):
+        """Aguarda o carregamento em segundo plano (repassando o erro, se houve)"""
+        if self._loader is not None:
+            if self._loader.is_alive():
+                Display.show_message("Carregando o dicionário...", "info")
+            self._loader.join()
+            self._loader = None
+        if self._load_error is not None:
+            raise self._load_error
+    
+    def refresh_dictionary(self):
+        """Adota a versão mais nova do dicionário, se houver (chamado entre rodadas)"""
+        if self.reloader is None or self.category != self.default_category:
+            return False
+        current = self.reloader.current
+        if current.version == self.dictionary_version:
+            return False
+        
+        self.words = current.words
+        self.word_index = current.word_index
+        self.dictionary_version = current.version
+        self.registry.adopt(self.default_category, self.words, self.word_index)
+        if current.full:
+            Display.show_message(f"📚 Dicionário recarregado: {len(self.words)} palavras", "info")
+        elif current.added:
+            Display.show_message(f"📚 Dicionário atualizado: +{current.added} palavras", "info")
+        return True
     
     def setup_game(self):
         """Configura o jogo com interface avançada"""
+        from game.snapshot import SnapshotWriter, snapshot_path
+        
         Display.show_welcome()
+        TRACE.mark("tela de boas-vindas")
         
         # Configuração do jogador
         name = Display.get_input("Digite seu nome: ", required=True)
-        self.player = Player(name if name else "Jogador")
+        name = name if name else "Jogador"
+        saved = snapshot_path(self.snapshot_dir, name)
+        if saved.exists() and Display.get_yes_no_input("Você tem uma partida interrompida. Deseja continuar?"):
+            if self.resume_session(saved):
+                return
+        self.player = Player(name)
+        self.snapshots = SnapshotWriter(saved)
         
-        # Seleção de dificuldade
+        # Seleção de categoria (se houver mais de um dicionário) e dificuldade
+        if len(self.registry) > 1 and not self.fixed_category:
+            self.choose_category()
         self.choose_difficulty()
         
         Display.show_message(f"Bem-vindo, {self.player.name}! Dificuldade: {self.difficulty.name}", "info")
+        self.save_snapshot()
+    
+    def save_snapshot(self):
+        """Agenda a gravação do estado da sessão (não espera pelo disco)"""
+        if self.snapshots is not None:
+            from game.snapshot import SessionSnapshot
+            self.snapshots.save(SessionSnapshot(self.player, self.difficulty, self.category,
+                                                self.round_number, self.round))
+    
+    @timed("resume_session")
+    def resume_session(self, path):
+        """Restaura jogador, dificuldade, categoria e rodada de uma fotografia"""
+        from game.snapshot import SessionSnapshot, SnapshotWriter
+        try:
+            snapshot = SessionSnapshot.load(path)
+        except (OSError, ValueError) as e:
+            Display.show_message(f"Não foi possível retomar a sessão: {e}", "warning")
+            return False
+        
+        self.wait_dictionary()
+        if snapshot.category != self.category:
+            try:
+                self.set_category(snapshot.category)
+            except ValueError:
+                print(f"⚠️  Aviso: categoria '{snapshot.category}' não encontrada; usando {self.category}")
+        
+        # A palavra é buscada direto pelo id; se o dicionário mudou, vale o texto salvo
+        state = snapshot.round
+        if state is not None and state.word_id is not None:
+            if state.word_id >= len(self.words) or self.words[state.word_id] != state.word:
+                state.word_id = None
+        
+        self.player = snapshot.player
+        self.difficulty = snapshot.difficulty
+        self.round_number = snapshot.round_number
+        self.round = state
+        self.snapshots = SnapshotWriter(path)
+        Display.show_message(f"Sessão de {self.player.name} retomada! Dificuldade: {self.difficulty.name}", "info")
+        return True
+    
+    def resume_requested(self):
+        """Retoma a sessão pedida em --resume; False se não houver fotografia"""
+        from game.snapshot import latest_snapshot, snapshot_path
+        if self.resume:
+            path = snapshot_path(self.snapshot_dir, self.resume)
+        else:
+            path = latest_snapshot(self.snapshot_dir)
+        if path is None or not path.exists():
+            print("⚠️  Aviso: nenhuma sessão salva encontrada; iniciando uma nova")
+            return False
+        return self.resume_session(path)
+    
+    def set_category(self, name):
+        """Troca o dicionário em uso pelo da categoria (carregado sob demanda)"""
+        self.wait_dictionary()
+        self.words, self.word_index = self.registry.get(name)
+        self.category = name
+    
+    def choose_category(self):
+        """Permite ao jogador escolher a categoria de palavras"""
+        Display.show_title("SELECIONE A CATEGORIA")
+        names = self.registry.names()
+        for number, name in enumerate(names, 1):
+            info = self.registry.info(name)
+            stats = info.stats()
+            count = f"{stats['words']}" if stats["exact"] else f"~{stats['words']}"
+            Display.show_message(f"{number} - {info.title} ({count} palavras)", "menu")
+        
+        while True:
+            choice = Display.get_input(f"Escolha (1-{len(names)}): ")
+            try:
+                name = names[int(choice) - 1]
+                if not self.registry.is_loaded(name):
+                    Display.show_message(f"Carregando {self.registry.info(name).title}...", "info")
+                self.set_category(name)
+                break
+            except (IndexError, ValueError):
+                Display.show_message(f"Opção inválida! Escolha entre 1-{len(names)}.", "error")
+            except Exception as e:
+                Display.show_message(str(e), "error")
     
     def choose_difficulty(self):
         """Permite ao jogador escolher a dificuldade"""
@@ -56,155 +272,199 @@ class HangmanGame:
             except (KeyError, ValueError):
                 Display.show_message("Opção inválida! Escolha entre 1-4.", "error")
     
-    def choose_word(self):
-        """Escolhe uma palavra baseada na dificuldade"""
+    @timed("choose_word")
+    def choose_word_index(self):
+        """Escolhe o índice de uma palavra baseada na dificuldade"""
         if not self.words:
             raise ValueError("Nenhuma palavra disponível no dicionário!")
         
-        # Filtra palavras por dificuldade
-        filtered_words = [word for word in self.words if self.difficulty.is_word_suitable(word)]
+        # Próxima palavra da sequência pré-sorteada da dificuldade (sem repetição)
+        index = self.random.next_word(self.word_index, self.difficulty)
         
-        if not filtered_words:
-            # Fallback para palavras do nível normal se não houver para a dificuldade
-            filtered_words = self.words
+        if index is None:
+            # Fallback para qualquer palavra se não houver para a dificuldade
+            index = self.random.stream("palavras").randrange(len(self.words))
         
-        return random.choice(filtered_words)
+        return index
     
-    def get_hint(self, word, correct_letters, used_letters):
+    def choose_word(self):
+        """Escolhe uma palavra baseada na dificuldade"""
+        return self.words[self.choose_word_index()]
+    
+    def get_hint(self, state):
         """Fornece uma dica ao jogador"""
-        if self.hints_used >= self.max_hints:
-            Display.show_message("Você já usou todas as dicas disponíveis!", "warning")
+        if state.hints_left <= 0:
+            Display.show_status("Você já usou todas as dicas disponíveis!", "warning")
             return False
         
-        # Encontra letras não descobertas e não tentadas
-        available_letters = [letter for letter in set(word) 
-                           if letter not in correct_letters and letter not in used_letters]
-        
-        if not available_letters:
-            Display.show_message("Não há dicas disponíveis para esta palavra!", "info")
+        hint_letter = state.take_hint(self.random.stream("dicas"))
+        if hint_letter is None:
+            Display.show_status("Não há dicas disponíveis para esta palavra!", "info")
             return False
         
-        hint_letter = random.choice(available_letters)
-        self.hints_used += 1
-        Display.show_message(f"💡 DICA: A palavra contém a letra '{hint_letter.upper()}'!", "hint")
-        Display.show_message(f"Dicas restantes: {self.max_hints - self.hints_used}", "info")
+        self.events.hint(self.session_id, self.round_number, hint_letter)
+        PROFILER.count("hints")
+        Display.show_status(f"💡 DICA: A palavra contém a letra '{hint_letter.upper()}'!", "hint")
+        Display.show_status(f"Dicas restantes: {state.hints_left}", "info")
         return True
     
     def validate_guess(self, guess, used_letters):
         """Valida robustamente o palpite do jogador"""
-        if not guess:
-            raise ValueError("Entrada vazia! Digite uma letra.")
-        
-        if len(guess) != 1:
-            raise ValueError("Digite apenas UMA letra!")
-        
-        if not guess.isalpha():
-            raise ValueError("Entrada inválida! Use apenas letras do alfabeto.")
-        
-        if guess in used_letters:
-            raise ValueError(f"Você já tentou a letra '{guess.upper()}'!")
-        
-        return guess.lower()
+        return validate_guess(guess, used_letters)
     
     def calculate_score(self, word, errors, hints_used):
         """Calcula a pontuação baseada no desempenho"""
-        base_points = len(word) * 10
-        error_penalty = errors * 5
-        hint_penalty = hints_used * 15
-        difficulty_bonus = self.difficulty.value * 20
-        
-        score = base_points - error_penalty - hint_penalty + difficulty_bonus
-        return max(score, 10)  # Pontuação mínima
+        return calculate_score(word, errors, hints_used, self.difficulty)
     
     def play_round(self):
-        """Executa uma rodada completa do jogo"""
-        try:
-            word = self.choose_word()
-        except ValueError as e:
-            Display.show_message(str(e), "error")
-            return
-        
-        correct_letters = set()
-        used_letters = set()
-        errors = 0
-        self.hints_used = 0
+        """Executa uma rodada completa do jogo (ou continua a retomada em self.round)
+
+        Retorna a pontuação da rodada (0 na derrota) ou None se nenhuma
+        rodada foi jogada.
+        """
+        self.wait_dictionary()
+        state = self.round
+        if state is None:
+            self.refresh_dictionary()
+            try:
+                word_id = self.choose_word_index()
+            except ValueError as e:
+                Display.show_message(str(e), "error")
+                return None
+            
+            # Toda a lógica da rodada fica no RoundState; aqui só entrada e saída
+            state = RoundState(self.words[word_id], self.difficulty.max_errors, self.max_hints,
+                               word_id, self.words.mask(word_id))
+            self.round = state
+            self.round_number += 1
+        word = state.word
+        PROFILER.count("rounds")
+        started = time.monotonic()
+        self.events.round_start(self.session_id, self.round_number, state.word_id, self.difficulty,
+                                len(word), state.max_errors)
+        self.save_snapshot()
         
         Display.clear_screen()
-        Display.show_title("JOGO DA FORCA")
-        Display.show_message(f"Palavra: {len(word)} letras | Dificuldade: {self.difficulty.name}", "info")
-        Display.show_message(f"Dicas disponíveis: {self.max_hints}", "info")
+        header = Display.title_lines("JOGO DA FORCA") + [
+            Display.message_line(f"Palavra: {len(word)} letras | Dificuldade: {self.difficulty.name}", "info"),
+            Display.message_line(f"Dicas disponíveis: {self.max_hints}", "info")
+        ]
         
-        while errors < self.difficulty.max_errors:
-            # Exibe estado atual do jogo
-            Display.show_game_state(word, correct_letters, used_letters, errors, self.difficulty.max_errors)
+        while not state.is_lost:
+            # Exibe estado atual do jogo (só as linhas alteradas são redesenhadas)
+            Display.render_round(header, state)
             
             # Verifica vitória
-            if all(letter in correct_letters for letter in word):
-                score = self.calculate_score(word, errors, self.hints_used)
-                self.player.add_win(score)
+            if state.is_won:
+                score = state.score(self.difficulty)
+                self.events.round_end(self.session_id, self.round_number, True, score, state.errors,
+                                      state.hints_used, (time.monotonic() - started) * 1000)
+                self.player.add_win(score, state.errors, state.hints_used)
+                self.players.record(self.player.name, True, score, state.errors, state.hints_used)
                 Display.show_victory(word, score)
-                break
+                self.round = None
+                self.save_snapshot()
+                return score
             
             # Obtém ação do jogador
             action = Display.get_input("\nDigite uma letra, 'dica' ou '?' para ajuda: ").lower().strip()
             
             try:
                 if action == 'dica' or action == '?':
-                    self.get_hint(word, correct_letters, used_letters)
+                    if self.get_hint(state):
+                        self.save_snapshot()
                     continue
                 
-                guess = self.validate_guess(action, used_letters)
-                used_letters.add(guess)
+                guess = self.validate_guess(action, state.used_letters)
                 
-                if guess in word:
-                    Display.show_message(f"✅ Letra '{guess.upper()}' correta!", "success")
-                    correct_letters.add(guess)
+                hit = state.apply_guess(guess)
+                self.events.guess(self.session_id, self.round_number, guess, hit, state.errors)
+                PROFILER.count("guesses")
+                self.save_snapshot()
+                if hit:
+                    Display.show_status(f"✅ Letra '{guess.upper()}' correta!", "success")
                 else:
-                    errors += 1
-                    Display.show_message(f"❌ Letra '{guess.upper()}' incorreta! Erros: {errors}/{self.difficulty.max_errors}", "error")
+                    Display.show_status(f"❌ Letra '{guess.upper()}' incorreta! Erros: {state.errors}/{state.max_errors}", "error")
                     
             except ValueError as e:
-                Display.show_message(str(e), "error")
+                Display.show_status(str(e), "error")
                 continue
             except Exception as e:
-                Display.show_message(f"Erro inesperado: {e}", "error")
+                Display.show_status(f"Erro inesperado: {e}", "error")
                 continue
         
         else:
             # Game Over
+            Display.render_round(header, state)
+            self.events.round_end(self.session_id, self.round_number, False, 0, state.errors,
+                                  state.hints_used, (time.monotonic() - started) * 1000)
             Display.show_game_over(word)
-            self.player.add_loss()
+            self.player.add_loss(state.errors, state.hints_used)
+            self.players.record(self.player.name, False, 0, state.errors, state.hints_used)
+            self.round = None
+            self.save_snapshot()
+            return 0
     
     def show_stats(self):
         """Mostra estatísticas detalhadas"""
         Display.show_title("ESTATÍSTICAS")
         print(self.player.get_detailed_stats())
         
-        # Mostra placar geral
-        scores = self.file_manager.read_scores()
+        # Histórico de todas as sessões deste jogador
+        profile = self.players.load(self.player.name)
+        if profile and profile.games_played > self.player.games_played:
+            print(f"📚 Histórico: {profile.games_played} partidas | {profile.win_rate:.1f}% vitórias | "
+                  f"{profile.score} pontos desde {profile.created_at.strftime('%d/%m/%Y')}")
+        
+        # Placares em memória: geral e de hoje na dificuldade atual
+        scores = self.file_manager.read_leaderboard(limit=10)
         if scores:
             Display.show_leaderboard(scores)
+        today = self.file_manager.read_leaderboard("day", self.difficulty.name, limit=5)
+        if today:
+            Display.show_leaderboard(today, f"HOJE - {str(self.difficulty).upper()} - TOP 5")
     
     def run(self):
         """Loop principal do jogo"""
         try:
-            self.setup_game()
+            if self.resume is None or not self.resume_requested():
+                self.setup_game()
             
             while True:
-                self.play_round()
-                self.file_manager.save_score(self.player.name, self.player.score)
+                # O placar guarda a pontuação da rodada, na dificuldade em que foi jogada
+                score = self.play_round()
+                if score is not None:
+                    self.file_manager.save_score(self.player.name, score, self.difficulty.name)
                 self.show_stats()
                 
                 if not Display.get_yes_no_input("\nDeseja jogar novamente?"):
                     Display.show_message("Obrigado por jogar! Até a próxima! 🎮", "info")
+                    self.snapshots.discard()
                     break
                 
-                # Oferece mudar dificuldade
+                # Oferece mudar categoria e dificuldade
+                if len(self.registry) > 1 and not self.fixed_category and \
+                        Display.get_yes_no_input("Deseja trocar de categoria?"):
+                    self.choose_category()
                 if Display.get_yes_no_input("Deseja alterar a dificuldade?"):
                     self.choose_difficulty()
+                self.save_snapshot()
                 
                 Display.clear_screen()
                 
         except Exception as e:
             Display.show_message(f"Erro crítico: {e}", "error")
-            sys.exit(1)
\ No newline at end of file
+            sys.exit(1)
+        finally:
+            if self._loader is not None:
+                self._loader.join()
+            # Saída interrompida (EOF, Ctrl+C, erro): a última fotografia fica no disco
+            if self.snapshots is not None and self.snapshots.close():
+                Display.show_message("💾 Sessão salva. Para continuar: python main.py --resume", "info")
+            if self.reloader is not None:
+                self.reloader.close()
+            if self.events is not None:
+                self.events.close()
+            if self.players is not None:
+                self.players.close()
+            self.file_manager.close()
\ No newline at end of file
@@ -0,0 +1,150 @@
+from collections import OrderedDict
+from pathlib import Path
+from utils.file_manager import FileManager
+
+# Arquivos .txt de data/ que não são dicionários
+IGNORED = {"placar.txt"}
+IGNORED_PREFIXES = ("backup_",)
+
+
+class DictionaryInfo:
+    """Dados de um dicionário descoberto em data/ (sem carregar as palavras)"""
+
+    __slots__ = ("name", "filename", "path", "_stats")
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.filename = self.path.name
+        self.name = self.path.stem
+        self._stats = None
+
+    @property
+    def title(self):
+        return self.name.replace("_", " ").title()
+
+    def stats(self):
+        """Palavras, bytes e tamanhos, lidos do .bin compilado ou contando linhas
+
+        Com o dicionário compilado e atualizado, só o cabeçalho e o diretório
+        de baldes são lidos (contagem exata e palavras por tamanho); senão o
+        texto é percorrido em blocos contando linhas, sem decodificar nada.
+        """
+        info = self.path.stat()
+        signature = (info.st_size, info.st_mtime_ns)
+        if self._stats is not None and self._stats["signature"] == signature:
+            return self._stats
+
+        stats = {"signature": signature, "bytes": info.st_size, "exact": False, "lengths": None}
+        compiled = self.path.with_suffix(".bin")
+        if compiled.exists() and compiled.stat().st_mtime_ns >= info.st_mtime_ns:
+            stats.update(self._compiled_stats(compiled) or {})
+        if "words" not in stats:
+            stats["words"] = self._count_lines()
+        self._stats = stats
+        return stats
+
+    @staticmethod
+    def _compiled_stats(path):
+        from utils.compiled_words import BUCKET, HEADER, MAGIC
+
+        with open(path, 'rb') as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return None
+            magic, _, count, bucket_count, _ = HEADER.unpack(header)
+            if magic != MAGIC:
+                return None
+            directory = file.read(BUCKET.size * bucket_count)
+        lengths = {length: size for length, _, size in BUCKET.iter_unpack(directory)}
+        return {"words": count, "exact": True, "lengths": lengths}
+
+    def _count_lines(self, chunk_size=1 << 20):
+        lines = 0
+        last = b"\n"
+        with open(self.path, 'rb') as file:
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    break
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+        return lines + (last != b"\n")
+
+    def __repr__(self):
+        return f"DictionaryInfo('{self.filename}')"
+
+
+class DictionaryRegistry:
+    """Dicionários (categorias, idiomas, temas) encontrados em data/*.txt
+
+    A descoberta só lista os arquivos; cada dicionário é carregado (palavras
+    e índice) no primeiro uso. No máximo max_loaded ficam residentes: o
+    menos usado recentemente sai do cache. Ele não é fechado à força,
+    porque um jogo ainda pode estar usando; o mapeamento é liberado quando
+    a última referência some.
+    """
+
+    def __init__(self, data_dir, max_loaded=3):
+        self.data_dir = Path(data_dir)
+        self.max_loaded = max_loaded
+        self._dictionaries = {}
+        self._loaded = OrderedDict()
+        self.loads = 0
+        self.discover()
+
+    def discover(self):
+        """Atualiza a lista de dicionários disponíveis"""
+        found = {}
+        for path in sorted(self.data_dir.glob("*.txt")):
+            if path.name in IGNORED or path.name.startswith(IGNORED_PREFIXES):
+                continue
+            found[path.stem] = self._dictionaries.get(path.stem) or DictionaryInfo(path)
+        self._dictionaries = found
+        return list(found)
+
+    def names(self):
+        return list(self._dictionaries)
+
+    def info(self, name):
+        try:
+            return self._dictionaries[name]
+        except KeyError:
+            raise ValueError(f"Dicionário não encontrado: {name}")
+
+    def stats(self, name):
+        return self.info(name).stats()
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
+    def adopt(self, name, words, word_index):
+        """Registra um dicionário já carregado por outra via (ex.: o padrão do jogo)"""
+        self._store(name, (words, word_index))
+
+    def get(self, name):
+        """(palavras, índice) do dicionário, carregando-o se preciso"""
+        loaded = self._loaded.get(name)
+        if loaded is not None:
+            self._loaded.move_to_end(name)
+            return loaded
+
+        from game.hot_reload import index_words
+
+        info = self.info(name)
+        words = FileManager(info.filename).read_words()
+        loaded = (words, index_words(words))
+        self.loads += 1
+        self._store(name, loaded)
+        return loaded
+
+    def _store(self, name, loaded):
+        self._loaded[name] = loaded
+        self._loaded.move_to_end(name)
+        while len(self._loaded) > self.max_loaded:
+            self._loaded.popitem(last=False)
+
+    def __len__(self):
+        return len(self._dictionaries)
+
+    def __repr__(self):
+        return f"DictionaryRegistry({len(self)} dicionários, {len(self._loaded)} carregados)"
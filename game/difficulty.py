@@ -21,17 +21,51 @@ class Difficulty(Enum):
     @property
     def word_length_range(self):
         """Faixa de tamanho de palavras para esta dificuldade"""
-        return {
-            Difficulty.EASY: (3, 6),
-            Difficulty.NORMAL: (5, 8),
-            Difficulty.HARD: (7, 10),
-            Difficulty.EXPERT: (9, 15)
-        }[self]
+        return _WORD_LENGTH_RANGES[self.value]
+    
+    @property
+    def score_range(self):
+        """Faixa de percentis da tabela de dificuldade para este nível"""
+        return _SCORE_RANGES[self.value]
     
     def is_word_suitable(self, word):
         """Verifica se uma palavra é adequada para esta dificuldade"""
         min_len, max_len = self.word_length_range
         return min_len <= len(word) <= max_len
     
+    @classmethod
+    def from_solver_errors(cls, errors):
+        """Classifica uma palavra pelos erros que o solver ótimo comete nela
+
+        Quanto mais o solver erra, mais difícil o nível: 0 erros é Fácil,
+        1 é Normal, 2 é Difícil e 3 ou mais é Especialista. O nível não
+        garante vitória: no Especialista (3 erros) essas palavras exigem
+        acertar mais que o solver guloso.
+        """
+        if errors <= 0:
+            return cls.EASY
+        if errors == 1:
+            return cls.NORMAL
+        if errors == 2:
+            return cls.HARD
+        return cls.EXPERT
+    
     def __str__(self):
-        return self.name.title()
\ No newline at end of file
+        return self.name.title()
+
+
+# Tabela criada uma única vez (evita recriar o dicionário a cada consulta)
+_WORD_LENGTH_RANGES = {
+    Difficulty.EASY.value: (3, 6),
+    Difficulty.NORMAL.value: (5, 8),
+    Difficulty.HARD.value: (7, 10),
+    Difficulty.EXPERT.value: (9, 15)
+}
+
+# Percentis (0-100) da tabela de dificuldade por palavra
+_SCORE_RANGES = {
+    Difficulty.EASY.value: (0, 40),
+    Difficulty.NORMAL.value: (25, 65),
+    Difficulty.HARD.value: (50, 85),
+    Difficulty.EXPERT.value: (75, 100)
+}
\ No newline at end of file
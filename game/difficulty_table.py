@@ -0,0 +1,243 @@
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from utils.alphabet import LETTER_BITS, mask_size
+
+# Formato do arquivo <dicionário>.dif (little-endian):
+#   cabeçalho    -> mágica, versão, nº de palavras, impressão digital da fonte, ordem dos ids
+#   brutos       -> nº de palavras x uint16, pontuação bruta de dificuldade
+#   percentis    -> nº de palavras x uint8, posição 0-100 da palavra no dicionário
+MAGIC = b"FORCADIF"
+VERSION = 3  # 2: solver com letras acentuadas reveladas pela base; 3: ordem dos ids
+HEADER = struct.Struct("<8sHxxIQQIB3x")
+CHUNK_SIZE = 1 << 20
+
+# Ordem das palavras à qual os ids da tabela se referem
+ORDER_TEXT = 0    # ordem das linhas do .txt (WordStore)
+ORDER_LENGTH = 1  # ordenadas por tamanho (imagem compilada ou compartilhada)
+
+
+def word_order(words):
+    """Ordem dos ids do dicionário carregado
+
+    Imagens compiladas (CompiledWordStore, SharedWordStore) guardam as
+    palavras ordenadas por tamanho; o SharedWordStore criado de um .txt
+    aponta para o texto, mas seus ids não seguem as linhas dele.
+    """
+    return ORDER_LENGTH if hasattr(words, "length_buckets") else ORDER_TEXT
+
+
+def file_crc(path, size):
+    """CRC32 dos primeiros size bytes do arquivo"""
+    crc = 0
+    with open(path, 'rb') as file:
+        remaining = size
+        while remaining > 0:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            remaining -= len(chunk)
+    return crc
+
+
+class DifficultyTable:
+    """Tabela pré-calculada de dificuldade por palavra
+
+    A pontuação bruta combina os erros do solver ótimo, a raridade das
+    letras da palavra e o número de letras distintas. Cada palavra recebe
+    também seu percentil (0-100) no dicionário, que é o valor usado pelas
+    faixas de Difficulty.score_range. A tabela fica em arrays, na mesma
+    ordem do dicionário carregado.
+    """
+
+    def __init__(self, raw=None, percentiles=None, source_size=0, source_mtime_ns=0, source_crc=0,
+                 order=ORDER_TEXT):
+        self.raw = raw if raw is not None else array('H')
+        self.percentiles = percentiles if percentiles is not None else array('B')
+        self.source_size = source_size
+        self.source_mtime_ns = source_mtime_ns
+        self.source_crc = source_crc
+        self.order = order
+
+    @staticmethod
+    def path_for(words):
+        """Caminho da tabela ao lado do arquivo do dicionário"""
+        return Path(f"{words.filepath}.dif")
+
+    # ------------------------------------------------------------------
+    # Cálculo
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def letter_rarity(masks):
+        """Raridade (0-1) de cada bit de letra: 1 - fração de palavras com a letra"""
+        counts = dict.fromkeys(LETTER_BITS.values(), 0)
+        for mask in masks:
+            for bit in counts:
+                if mask & bit:
+                    counts[bit] += 1
+        total = len(masks) or 1
+        return {bit: 1 - count / total for bit, count in counts.items()}
+
+    @staticmethod
+    def raw_score(errors, mask, rarity):
+        """Pontuação bruta: erros do solver pesam mais; letras raras e poucas
+        letras distintas (menos chances de acerto) também dificultam"""
+        distinct = mask_size(mask) or 1
+        rare = sum(value for bit, value in rarity.items() if mask & bit) / distinct
+        return min(int(errors * 1000 + rare * 500 + 400 / distinct), 0xFFFF)
+
+    def _score(self, solver, rarity, indices):
+        for index in indices:
+            self.raw.append(self.raw_score(solver.solve(index), solver.masks[index], rarity))
+
+    def _rank_all(self):
+        """Recalcula os percentis de todas as palavras"""
+        ordered = sorted(self.raw)
+        top = max(len(ordered) - 1, 1)
+        self.percentiles = array('B', (
+            min(100, (bisect_right(ordered, value) - 1) * 100 // top) for value in self.raw
+        ))
+
+    def _rank_appended(self, start):
+        """Percentis só das palavras novas, contra a distribuição existente"""
+        ordered = sorted(self.raw[:start])
+        top = max(len(ordered) - 1, 1)
+        for value in self.raw[start:]:
+            self.percentiles.append(min(100, max(bisect_right(ordered, value) - 1, 0) * 100 // top))
+
+    def _fingerprint(self, words):
+        stat = os.stat(words.filepath)
+        self.source_size = stat.st_size
+        self.source_mtime_ns = stat.st_mtime_ns
+        self.source_crc = file_crc(words.filepath, stat.st_size)
+        self.order = word_order(words)
+
+    @classmethod
+    def build(cls, words):
+        """Calcula a tabela completa para o dicionário"""
+        from game.solver import Solver
+
+        table = cls()
+        solver = Solver(words)
+        rarity = cls.letter_rarity(solver.masks)
+        table._score(solver, rarity, range(len(words)))
+        table._rank_all()
+        table._fingerprint(words)
+        return table
+
+    def extend(self, words):
+        """Pontua apenas as palavras acrescentadas ao final do dicionário"""
+        from game.solver import Solver
+
+        start = len(self.raw)
+        solver = Solver(words)
+        rarity = self.letter_rarity(solver.masks)
+        self._score(solver, rarity, range(start, len(words)))
+        self._rank_appended(start)
+        self._fingerprint(words)
+        return len(words) - start
+
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+
+    def save(self, path):
+        """Grava a tabela de forma atômica"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, len(self.raw), self.source_size,
+                                   self.source_mtime_ns, self.source_crc, self.order))
+            file.write(self.raw.tobytes())
+            file.write(self.percentiles.tobytes())
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Lê uma tabela gravada por save()"""
+        with open(path, 'rb') as file:
+            header = file.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"Tabela de dificuldade inválida: {path}")
+            magic, version, count, size, mtime_ns, crc, order = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Tabela de dificuldade inválida: {path}")
+
+            raw = array('H')
+            raw.frombytes(file.read(2 * count))
+            percentiles = array('B')
+            percentiles.frombytes(file.read(count))
+        if len(raw) != count or len(percentiles) != count:
+            raise ValueError(f"Tabela de dificuldade truncada: {path}")
+        return cls(raw, percentiles, size, mtime_ns, crc, order)
+
+    def is_fresh(self, words):
+        """Tabela feita deste arquivo, sem mudanças (só um stat, sem ler o texto)"""
+        stat = os.stat(words.filepath)
+        return (stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+                and len(self.raw) == len(words))
+
+    def status(self, words):
+        """Compara a tabela com o dicionário: 'fresh', 'appended' ou 'stale'"""
+        if self.is_fresh(words):
+            return "fresh"
+        stat = os.stat(words.filepath)
+        if (stat.st_size > self.source_size and len(words) >= len(self.raw)
+                and file_crc(words.filepath, self.source_size) == self.source_crc):
+            return "appended"
+        return "stale"
+
+    @classmethod
+    def load_for(cls, words, build=False, max_appended=0.05):
+        """Carrega a tabela do dicionário, atualizando-a só com build=True
+
+        Sem build (carga do jogo, recarga com --watch, servidor) nada é
+        calculado: só uma tabela em dia é usada, e uma ausente ou
+        desatualizada retorna None (o jogo usa o critério por tamanho até o
+        próximo build-difficulty). Com build=True, palavras acrescentadas ao
+        final (até max_appended do total) são pontuadas de forma
+        incremental e o resto é recalculado por completo.
+
+        Uma tabela feita para outra ordem de ids (ex.: a do .txt diante do
+        dicionário compartilhado, ordenado por tamanho) nunca é aplicada nem
+        sobrescrita: os percentis cairiam nas palavras erradas.
+        """
+        path = cls.path_for(words)
+        table = None
+        if path.exists():
+            try:
+                table = cls.load(path)
+            except (OSError, ValueError):
+                table = None
+
+        if table is not None and table.order != word_order(words):
+            if build:
+                raise ValueError(f"Tabela de dificuldade em outra ordem de palavras: {path}")
+            return None
+
+        if not build:
+            return table if table is not None and table.is_fresh(words) else None
+
+        if table is not None:
+            state = table.status(words)
+            if state == "fresh":
+                return table
+            appended = len(words) - len(table.raw)
+            if state == "appended" and appended <= max(1, len(words) * max_appended):
+                table.extend(words)
+                table.save(path)
+                return table
+
+        table = cls.build(words)
+        table.save(path)
+        return table
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __repr__(self):
+        return f"DifficultyTable(words={len(self.raw)})"
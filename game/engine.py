@@ -0,0 +1,188 @@
+import unicodedata
+from utils.alphabet import (ALPHABET, GROUP_BITS, LETTER_BITS, OTHER_BIT, fold_letter, fold_mask,
+                            letter_bit, letter_mask, mask_letters, mask_size)
+
+
+def calculate_score(word, errors, hints_used, difficulty):
+    """Calcula a pontuação baseada no desempenho"""
+    base_points = len(word) * 10
+    error_penalty = errors * 5
+    hint_penalty = hints_used * 15
+    difficulty_bonus = difficulty.value * 20
+
+    score = base_points - error_penalty - hint_penalty + difficulty_bonus
+    return max(score, 10)  # Pontuação mínima
+
+
+def validate_guess(guess, used_letters):
+    """Valida o palpite do jogador e o retorna em minúsculas, sem acento
+
+    Variantes acentuadas valem pela letra base ('ã' é o mesmo palpite que
+    'a' e revela todas as variantes da palavra).
+    """
+    if not guess:
+        raise ValueError("Entrada vazia! Digite uma letra.")
+
+    if len(guess) != 1:
+        # Letra acentuada digitada em forma decomposta (a + til combinante)
+        guess = unicodedata.normalize("NFC", guess)
+        if len(guess) != 1:
+            raise ValueError("Digite apenas UMA letra!")
+    guess = fold_letter(guess.lower())
+
+    if not guess.isalpha():
+        raise ValueError("Entrada inválida! Use apenas letras do alfabeto.")
+
+    if guess in used_letters:
+        raise ValueError(f"Você já tentou a letra '{guess.upper()}'!")
+
+    return guess.lower()
+
+
+class RoundState:
+    """Estado puro de uma rodada, sem nenhuma entrada ou saída
+
+    Usado pelo jogo interativo (play_round) e pelos simuladores: quem chama
+    decide como obter palpites e como exibir o resultado. As letras ficam em
+    máscaras de bits (ver utils.alphabet), então aplicar um palpite, checar
+    vitória e escolher dica são operações de bits, sem percorrer a palavra.
+
+    Palpites valem pela letra base: used_mask guarda só bases, e um acerto
+    liga em correct_mask os bits de todas as variantes (GROUP_BITS) que a
+    palavra tem, então 'a' revela 'ã' com um único AND.
+    """
+
+    def __init__(self, word, max_errors, max_hints=2, word_id=None, word_mask=None):
+        self.word = word
+        self.word_id = word_id
+        self.max_errors = max_errors
+        self.max_hints = max_hints
+        self.word_mask = letter_mask(word) if word_mask is None else word_mask
+        self.correct_mask = 0
+        self.used_mask = 0
+        self.errors = 0
+        self.hints_used = 0
+
+        # Letras fora do alfabeto dividem um único bit; são tratadas à parte
+        self._other_missing = set()
+        self._other_used = set()
+        if self.word_mask & OTHER_BIT:
+            self._other_missing = {letter for letter in word if letter not in LETTER_BITS}
+
+    @classmethod
+    def resumed(cls, word, max_errors, max_hints, word_id, used_mask, correct_mask, errors,
+                hints_used, other_used=""):
+        """Recria uma rodada em andamento a partir das máscaras salvas"""
+        state = cls(word, max_errors, max_hints, word_id)
+        state.used_mask = used_mask
+        state.correct_mask = correct_mask
+        state.errors = errors
+        state.hints_used = hints_used
+        state._other_used = set(other_used)
+        state._other_missing -= state._other_used
+        return state
+
+    @property
+    def correct_letters(self):
+        """Letras descobertas (conjunto, para exibição)"""
+        letters = mask_letters(self.correct_mask & ~OTHER_BIT)
+        if self._other_used:
+            letters |= self._other_used & set(self.word)
+        return letters
+
+    @property
+    def used_letters(self):
+        """Letras já tentadas (conjunto, para exibição)"""
+        return mask_letters(self.used_mask & ~OTHER_BIT) | self._other_used
+
+    @property
+    def is_won(self):
+        """Todas as letras da palavra foram descobertas"""
+        return self.correct_mask == self.word_mask and not self._other_missing
+
+    @property
+    def is_lost(self):
+        """Limite de erros atingido"""
+        return self.errors >= self.max_errors
+
+    @property
+    def is_over(self):
+        return self.is_won or self.is_lost
+
+    @property
+    def hints_left(self):
+        return self.max_hints - self.hints_used
+
+    def pattern(self, hidden="_"):
+        """Palavra com as letras ainda não descobertas escondidas"""
+        correct = self.correct_mask
+        return "".join(
+            letter if LETTER_BITS.get(letter, 0) & correct or letter in self._other_used else hidden
+            for letter in self.word
+        )
+
+    def is_used(self, letter):
+        """Indica se a letra (ou outra variante da mesma base) já foi tentada"""
+        bit = letter_bit(fold_letter(letter))
+        if bit == OTHER_BIT:
+            return letter in self._other_used
+        return bool(self.used_mask & bit)
+
+    def apply_guess(self, letter):
+        """Aplica um palpite já validado; retorna True se a letra existe"""
+        letter = fold_letter(letter)
+        bit = letter_bit(letter)
+        if bit == OTHER_BIT:
+            return self._apply_other(letter)
+
+        self.used_mask |= bit
+        revealed = self.word_mask & GROUP_BITS[letter]
+        if revealed:
+            self.correct_mask |= revealed
+            return True
+        self.errors += 1
+        return False
+
+    def _apply_other(self, letter):
+        """Palpite com letra fora do alfabeto (caminho raro, via conjuntos)"""
+        self._other_used.add(letter)
+        self.used_mask |= OTHER_BIT
+        if letter in self.word:
+            self._other_missing.discard(letter)
+            if not self._other_missing:
+                self.correct_mask |= OTHER_BIT
+            return True
+        self.errors += 1
+        return False
+
+    def hint_mask(self):
+        """Máscara das letras base da palavra ainda não tentadas"""
+        return fold_mask(self.word_mask) & ~self.used_mask & ~OTHER_BIT
+
+    def hint_candidates(self):
+        """Letras base da palavra ainda não tentadas"""
+        candidates = self.hint_mask()
+        return [letter for letter in ALPHABET if candidates & LETTER_BITS[letter]]
+
+    def take_hint(self, rng):
+        """Consome uma dica e retorna a letra sugerida (None se não houver)"""
+        if self.hints_left <= 0:
+            return None
+        candidates = self.hint_mask()
+        if not candidates:
+            return None
+        self.hints_used += 1
+
+        # Sorteia o k-ésimo bit ligado da máscara
+        skip = rng.randrange(mask_size(candidates))
+        for _ in range(skip):
+            candidates &= candidates - 1
+        return ALPHABET[(candidates & -candidates).bit_length() - 1]
+
+    def score(self, difficulty):
+        """Pontuação da rodada para a dificuldade informada"""
+        return calculate_score(self.word, self.errors, self.hints_used, difficulty)
+
+    def __repr__(self):
+        return (f"RoundState(word='{self.word}', errors={self.errors}/{self.max_errors}, "
+                f"hints={self.hints_used}/{self.max_hints})")
@@ -0,0 +1,292 @@
+import os
+import queue
+import struct
+import threading
+import time
+from collections import Counter, namedtuple
+from utils.alphabet import ALPHABET
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem travas entre processos
+    fcntl = None
+
+# Log binário só-de-acréscimo:
+#   arquivo  -> mágica + versão, seguidos de registros
+#   registro -> tamanho (uint16) + cabeçalho comum + campos do tipo
+MAGIC = b"FORCALOG"
+VERSION = 2  # 2: sessão em 64 bits (pid << 32 | contador)
+FILE_HEADER = struct.Struct("<8sH6x")
+LENGTH = struct.Struct("<H")
+COMMON = struct.Struct("<BQIq")  # tipo, sessão, rodada, instante (µs desde a época)
+# Cabeçalho comum de cada versão do arquivo (a 1 tinha sessão de 32 bits)
+COMMONS = {1: struct.Struct("<BIIq"), VERSION: COMMON}
+
+ROUND_START = 1
+GUESS = 2
+HINT = 3
+ROUND_END = 4
+
+PAYLOADS = {
+    ROUND_START: struct.Struct("<IBBB"),  # id da palavra, dificuldade, tamanho, erros máximos
+    GUESS: struct.Struct("<BBB"),         # letra, acertou, erros após o palpite
+    HINT: struct.Struct("<B"),            # letra sugerida
+    ROUND_END: struct.Struct("<BiBBI"),   # venceu, pontos, erros, dicas, duração (ms)
+}
+KIND_NAMES = {ROUND_START: "start", GUESS: "guess", HINT: "hint", ROUND_END: "end"}
+
+NO_WORD = 0xFFFFFFFF
+OTHER_LETTER = 0xFF
+
+Event = namedtuple("Event", "kind session round time_us values")
+
+
+def letter_code(letter):
+    """Índice da letra no alfabeto (1 byte)"""
+    position = ALPHABET.find(letter)
+    return OTHER_LETTER if position < 0 else position
+
+
+def code_letter(code):
+    return "?" if code >= len(ALPHABET) else ALPHABET[code]
+
+
+class EventLog:
+    """Gravador de eventos de rodada com escrita em segundo plano
+
+    emit() só monta uma tupla e a coloca em uma fila limitada: o loop do
+    jogo nunca espera pelo disco. Uma thread auxiliar codifica os eventos
+    e grava em lotes. Se a fila encher, o evento é descartado e contado
+    em dropped; eventos que não puderam ser gravados também (o erro fica
+    em last_error).
+    """
+
+    def __init__(self, path, max_pending=65536, batch_size=1024):
+        self.path = path
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.last_error = None
+        self._queue = queue.Queue(max_pending)
+        self._sessions = 0
+        self._lock = threading.Lock()
+
+        self._file = open(path, 'ab')
+        self._write_header()
+
+        self._thread = threading.Thread(target=self._run, name="eventos", daemon=True)
+        self._thread.start()
+
+    def _write_header(self):
+        """Grava o cabeçalho se o arquivo está vazio, sob trava exclusiva
+
+        Com dois processos abrindo o mesmo log novo, o segundo espera a
+        trava e já encontra o cabeçalho; verificar o tamanho antes de abrir
+        deixaria os dois gravá-lo. Um log de outra versão é renomeado
+        (eventos.log.v1) e um novo é começado, para não misturar formatos.
+        """
+        while True:
+            if fcntl is not None:
+                fcntl.flock(self._file, fcntl.LOCK_EX)
+            try:
+                info = os.fstat(self._file.fileno())
+                current = os.stat(self.path)
+                if (info.st_dev, info.st_ino) == (current.st_dev, current.st_ino):
+                    if info.st_size == 0:
+                        self._file.write(FILE_HEADER.pack(MAGIC, VERSION))
+                        self._file.flush()
+                        return
+                    version = self._file_version()
+                    if version == VERSION:
+                        return
+                    os.replace(self.path, f"{self.path}.v{version}")
+            except FileNotFoundError:
+                pass  # renomeado por outro processo entre o open e o stat
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._file, fcntl.LOCK_UN)
+            # O arquivo aberto não é mais o do caminho: abre o atual
+            self._file.close()
+            self._file = open(self.path, 'ab')
+
+    def _file_version(self):
+        with open(self.path, 'rb') as file:
+            header = file.read(FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size:
+            return 0
+        magic, version = FILE_HEADER.unpack(header)
+        return version if magic == MAGIC else 0
+
+    def new_session(self):
+        """Identificador para uma nova sessão de jogo (pid << 32 | contador)"""
+        with self._lock:
+            self._sessions += 1
+            return os.getpid() << 32 | self._sessions & 0xFFFFFFFF
+
+    def emit(self, kind, session, round_number, *values):
+        """Enfileira um evento sem bloquear"""
+        try:
+            self._queue.put_nowait((kind, session, round_number, time.time_ns() // 1000, values))
+        except queue.Full:
+            self.dropped += 1
+
+    def round_start(self, session, round_number, word_id, difficulty, length, max_errors):
+        self.emit(ROUND_START, session, round_number,
+                  NO_WORD if word_id is None else word_id, difficulty.value, min(length, 255), max_errors)
+
+    def guess(self, session, round_number, letter, hit, errors):
+        self.emit(GUESS, session, round_number, letter_code(letter), int(hit), errors)
+
+    def hint(self, session, round_number, letter):
+        self.emit(HINT, session, round_number, letter_code(letter))
+
+    def round_end(self, session, round_number, won, score, errors, hints, duration_ms):
+        self.emit(ROUND_END, session, round_number, int(won), score, errors, hints, int(duration_ms))
+
+    @staticmethod
+    def encode(kind, session, round_number, time_us, values):
+        body = COMMON.pack(kind, session, round_number, time_us) + PAYLOADS[kind].pack(*values)
+        return LENGTH.pack(len(body)) + body
+
+    def _run(self):
+        """Thread de gravação: esvazia a fila em lotes"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            items = [item]
+            stop = False
+            while len(items) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                items.append(item)
+            # Um erro (disco cheio, valor fora do formato) perde o lote, não a thread
+            try:
+                self._file.write(b"".join(self.encode(*item) for item in items))
+                self._file.flush()
+            except (OSError, ValueError, struct.error) as e:
+                self.last_error = e
+                self.dropped += len(items)
+            if stop:
+                break
+
+    def close(self, timeout=5.0):
+        """Grava os eventos pendentes e fecha o arquivo
+
+        Espera a thread de gravação por no máximo timeout segundos (para
+        enfileirar o fim e para terminar): se ela morreu ou travou no disco,
+        o jogo sai mesmo assim e o que ficou na fila conta em dropped.
+        """
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        if thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            thread.join(timeout)
+        self.dropped += self._queue.qsize()
+        if thread.is_alive():
+            # Ainda gravando: o arquivo fica com ela (daemon, termina com o processo)
+            return
+        self._file.close()
+
+    def __repr__(self):
+        return f"EventLog('{self.path}', dropped={self.dropped})"
+
+
+class NullEventLog:
+    """Substituto sem efeito quando o log de eventos está desligado"""
+
+    def new_session(self):
+        return 0
+
+    def emit(self, *args):
+        pass
+
+    round_start = guess = hint = round_end = emit
+
+    def close(self):
+        pass
+
+
+def read_events(path, chunk_size=1 << 20):
+    """Lê o log em blocos e gera Event em ordem de gravação"""
+    with open(path, 'rb') as file:
+        header = file.read(FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size:
+            return
+        magic, version = FILE_HEADER.unpack(header)
+        common = COMMONS.get(version)
+        if magic != MAGIC or common is None:
+            raise ValueError(f"Log de eventos inválido: {path}")
+
+        pending = b""
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            data = pending + chunk
+            position = 0
+            end = len(data)
+            while position + LENGTH.size <= end:
+                (size,) = LENGTH.unpack_from(data, position)
+                start = position + LENGTH.size
+                if start + size > end:
+                    break
+                kind, session, round_number, time_us = common.unpack_from(data, start)
+                payload = PAYLOADS.get(kind)
+                values = payload.unpack_from(data, start + common.size) if payload else ()
+                yield Event(kind, session, round_number, time_us, values)
+                position = start + size
+            pending = data[position:]
+
+
+def replay(path, handler):
+    """Entrega cada evento do log a handler(evento); retorna quantos foram lidos"""
+    count = 0
+    for event in read_events(path):
+        handler(event)
+        count += 1
+    return count
+
+
+def summarize(path):
+    """Resumo analítico de um log: rodadas, vitórias, duração e letras"""
+    from game.difficulty import Difficulty
+
+    rounds = Counter()
+    wins = Counter()
+    difficulty_of = {}
+    misses = Counter()
+    durations = []
+
+    def handle(event):
+        key = (event.session, event.round)
+        if event.kind == ROUND_START:
+            difficulty_of[key] = Difficulty(event.values[1])
+        elif event.kind == GUESS and not event.values[1]:
+            misses[code_letter(event.values[0])] += 1
+        elif event.kind == ROUND_END:
+            difficulty = difficulty_of.pop(key, None)
+            rounds[difficulty] += 1
+            if event.values[0]:
+                wins[difficulty] += 1
+            durations.append(event.values[4])
+
+    events = replay(path, handle)
+    lines = [f"Eventos: {events} | Rodadas: {sum(rounds.values())}"]
+    for difficulty, total in rounds.items():
+        name = difficulty.name if difficulty else "?"
+        lines.append(f"  {name}: {total} rodadas, {wins[difficulty] * 100 / total:.1f}% vitórias")
+    if durations:
+        lines.append(f"Duração média: {sum(durations) / len(durations) / 1000:.1f}s")
+    if misses:
+        worst = ", ".join(f"{letter.upper()}({count})" for letter, count in misses.most_common(5))
+        lines.append(f"Letras mais erradas: {worst}")
+    return "\n".join(lines)
@@ -0,0 +1,88 @@
+import threading
+from game.difficulty_table import DifficultyTable
+from game.word_index import WordIndex
+from utils.file_watcher import FileWatcher
+from utils.word_store import WordStore
+
+
+class DictionaryVersion:
+    """Dicionário pronto para uso: palavras, índice e número da versão"""
+
+    __slots__ = ("words", "word_index", "version", "added", "full")
+
+    def __init__(self, words, word_index, version=0, added=0, full=False):
+        self.words = words
+        self.word_index = word_index
+        self.version = version
+        self.added = added
+        self.full = full
+
+
+def index_words(words, word_index=None):
+    """Completa o índice com a tabela de dificuldade, se houver"""
+    if word_index is None:
+        word_index = WordIndex.from_store(words)
+    table = DifficultyTable.load_for(words)
+    if table is not None:
+        word_index.add_values(WordIndex.DIFFICULTY, table.percentiles)
+    return word_index
+
+
+class DictionaryReloader:
+    """Recarrega o dicionário em segundo plano quando o arquivo muda
+
+    O FileWatcher chama rebuild() na própria thread: se o arquivo só
+    cresceu, as palavras novas são validadas e indexadas a partir do fim
+    anterior (WordStore.appended / WordIndex.extended); senão tudo é
+    recarregado. O resultado é publicado em current com uma única
+    atribuição, e cada jogo o adota entre rodadas, comparando a versão.
+    """
+
+    def __init__(self, file_manager, words, word_index, interval=1.0):
+        self.file_manager = file_manager
+        self.current = DictionaryVersion(words, word_index)
+        self.last_error = None
+        self._lock = threading.Lock()
+        if isinstance(words, WordStore):
+            words.prefix_crc()
+        self.watcher = FileWatcher(file_manager.filepath, self.rebuild, interval)
+
+    def start(self):
+        self.watcher.start()
+        return self
+
+    def rebuild(self):
+        """Monta a próxima versão do dicionário (chamado pelo observador)"""
+        with self._lock:
+            current = self.current
+            try:
+                words, word_index, added, full = self._build(current)
+            except Exception as e:
+                self.last_error = e
+                return None
+            self.last_error = None
+            self.current = DictionaryVersion(words, word_index, current.version + 1, added, full)
+            return self.current
+
+    def _build(self, current):
+        previous = current.words
+        if isinstance(previous, WordStore):
+            words = WordStore.appended(previous)
+            if words is not None:
+                start = previous.complete_words
+                word_index = current.word_index.extended(words, start, words.lengths)
+                return words, index_words(words, word_index), len(words) - start, False
+
+        # Arquivo reescrito: recarrega tudo (o texto é mais novo que qualquer .bin)
+        words = WordStore(self.file_manager.filepath, private=True)
+        if not len(words):
+            words.close()
+            raise ValueError(f"Arquivo de palavras vazio: {self.file_manager.filename}")
+        words.prefix_crc()
+        return words, index_words(words), len(words), True
+
+    def close(self):
+        self.watcher.stop()
+
+    def __repr__(self):
+        return f"DictionaryReloader(version={self.current.version}, {self.watcher!r})"
@@ -1,7 +1,16 @@
+import time
 from datetime import datetime
 
 class Player:
-    """Representa um jogador com estatísticas avançadas"""
+    """Representa um jogador com estatísticas avançadas
+    
+    Registro compacto (__slots__); as datas ficam em segundos desde a época
+    (created_ts, last_played_ts) e created_at/last_played as expõem como
+    datetime.
+    """
+    
+    __slots__ = ("name", "score", "games_played", "games_won", "total_errors",
+                 "total_hints_used", "created_ts", "last_played_ts")
     
     def __init__(self, name):
         self.name = name
@@ -10,22 +19,39 @@ class Player:
         self.games_won = 0
         self.total_errors = 0
         self.total_hints_used = 0
-        self.created_at = datetime.now()
-        self.last_played = datetime.now()
+        self.created_ts = self.last_played_ts = int(time.time())
+    
+    @property
+    def created_at(self):
+        return datetime.fromtimestamp(self.created_ts)
+    
+    @created_at.setter
+    def created_at(self, value):
+        self.created_ts = int(value.timestamp())
+    
+    @property
+    def last_played(self):
+        return datetime.fromtimestamp(self.last_played_ts)
     
-    def add_win(self, points=10):
+    @last_played.setter
+    def last_played(self, value):
+        self.last_played_ts = int(value.timestamp())
+    
+    def add_win(self, points=10, errors=0, hints_used=0):
         """Adiciona uma vitória"""
         self.score += points
         self.games_played += 1
         self.games_won += 1
-        self.last_played = datetime.now()
+        self.total_errors += errors
+        self.total_hints_used += hints_used
+        self.last_played_ts = int(time.time())
     
     def add_loss(self, errors=0, hints_used=0):
         """Adiciona uma derrota"""
         self.games_played += 1
         self.total_errors += errors
         self.total_hints_used += hints_used
-        self.last_played = datetime.now()
+        self.last_played_ts = int(time.time())
     
     def __str__(self):
         return f"{self.name} - Pontuação: {self.score} | Vitórias: {self.win_rate:.1f}%"
@@ -50,16 +76,27 @@ class Player:
             raise ValueError("Só é possível combinar jogadores com o mesmo nome")
         
         combined = Player(self.name)
-        combined.score = self.score + other.score
-        combined.games_played = self.games_played + other.games_played
-        combined.games_won = self.games_won + other.games_won
-        combined.total_errors = self.total_errors + other.total_errors
-        combined.total_hints_used = self.total_hints_used + other.total_hints_used
-        combined.created_at = min(self.created_at, other.created_at)
-        combined.last_played = max(self.last_played, other.last_played)
+        combined.created_ts = self.created_ts
+        combined.last_played_ts = self.last_played_ts
+        combined += self
+        combined += other
         
         return combined
     
+    def __iadd__(self, other):
+        """Acumula as estatísticas de other neste jogador, sem criar outro objeto"""
+        if not isinstance(other, Player) or self.name != other.name:
+            raise ValueError("Só é possível combinar jogadores com o mesmo nome")
+        
+        self.score += other.score
+        self.games_played += other.games_played
+        self.games_won += other.games_won
+        self.total_errors += other.total_errors
+        self.total_hints_used += other.total_hints_used
+        self.created_ts = min(self.created_ts, other.created_ts)
+        self.last_played_ts = max(self.last_played_ts, other.last_played_ts)
+        return self
+    
     @property
     def win_rate(self):
         """Taxa de vitórias em porcentagem"""
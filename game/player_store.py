@@ -0,0 +1,176 @@
+import sqlite3
+import threading
+import time
+from game.player import Player
+from game.player_table import PlayerTable
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    name_key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL DEFAULT 0,
+    games_played INTEGER NOT NULL DEFAULT 0,
+    games_won INTEGER NOT NULL DEFAULT 0,
+    total_errors INTEGER NOT NULL DEFAULT 0,
+    total_hints_used INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_played REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS players_score ON players (score DESC);
+CREATE INDEX IF NOT EXISTS players_last_played ON players (last_played DESC);
+"""
+
+# Instruções fixas: o sqlite3 reaproveita a compilação pelo texto (cached_statements)
+UPSERT = """
+INSERT INTO players (name_key, name, score, games_played, games_won, total_errors,
+                     total_hints_used, created_at, last_played)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (name_key) DO UPDATE SET
+    name = excluded.name,
+    score = score + excluded.score,
+    games_played = games_played + excluded.games_played,
+    games_won = games_won + excluded.games_won,
+    total_errors = total_errors + excluded.total_errors,
+    total_hints_used = total_hints_used + excluded.total_hints_used,
+    created_at = min(created_at, excluded.created_at),
+    last_played = max(last_played, excluded.last_played)
+"""
+COLUMNS = "name, score, games_played, games_won, total_errors, total_hints_used, created_at, last_played"
+SELECT_ONE = f"SELECT {COLUMNS} FROM players WHERE name_key = ?"
+SELECT_TOP = f"SELECT {COLUMNS} FROM players ORDER BY score DESC LIMIT ?"
+SELECT_RECENT = f"SELECT {COLUMNS} FROM players ORDER BY last_played DESC LIMIT ?"
+SELECT_ALL = f"SELECT {COLUMNS} FROM players"
+COUNT = "SELECT count(*) FROM players"
+
+# Posições no acumulador de uma rodada pendente (mesma ordem de UPSERT)
+NAME, SCORE, PLAYED, WON, ERRORS, HINTS, CREATED, LAST = range(8)
+
+
+def name_key(name):
+    """Chave do jogador: mesmo critério de Player.__eq__ (sem diferenciar maiúsculas)"""
+    return name.lower()
+
+
+def _player(row):
+    """Monta um Player a partir de uma linha (ou acumulador) no formato de COLUMNS"""
+    player = Player(row[NAME])
+    player.score = row[SCORE]
+    player.games_played = row[PLAYED]
+    player.games_won = row[WON]
+    player.total_errors = row[ERRORS]
+    player.total_hints_used = row[HINTS]
+    player.created_ts = int(row[CREATED])
+    player.last_played_ts = int(row[LAST])
+    return player
+
+
+class PlayerStore:
+    """Perfis persistentes dos jogadores em SQLite (modo WAL, só local)
+
+    Cada rodada vira um acumulador em memória por jogador (write-behind);
+    os acumuladores são gravados juntos, em uma transação com UPSERT, ao
+    chegar a batch_size jogadores pendentes, a cada flush_interval
+    segundos ou no close(). As consultas juntam o que está no banco com o
+    que ainda está pendente, então nada parece perdido entre gravações.
+    """
+
+    def __init__(self, path, batch_size=256, flush_interval=2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+        try:
+            self._db = sqlite3.connect(str(path), check_same_thread=False, cached_statements=64)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            raise Exception(f"Erro ao abrir o banco de jogadores: {e}")
+
+    def record(self, name, won, points=0, errors=0, hints_used=0, timestamp=None):
+        """Acumula o resultado de uma rodada (gravado no próximo flush)"""
+        timestamp = time.time() if timestamp is None else timestamp
+        key = name_key(name)
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = self._pending[key] = [name, 0, 0, 0, 0, 0, timestamp, timestamp]
+            entry[NAME] = name
+            entry[SCORE] += points if won else 0
+            entry[PLAYED] += 1
+            entry[WON] += 1 if won else 0
+            entry[ERRORS] += errors
+            entry[HINTS] += hints_used
+            entry[LAST] = max(entry[LAST], timestamp)
+
+            due = (len(self._pending) >= self.batch_size
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Grava todos os acumuladores pendentes em uma única transação"""
+        with self._lock:
+            if not self._pending:
+                self._last_flush = time.monotonic()
+                return 0
+            rows = [(key, *entry) for key, entry in self._pending.items()]
+            with self._db:
+                self._db.executemany(UPSERT, rows)
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+            return len(rows)
+
+    def _merged(self, row, key):
+        """Linha do banco somada ao acumulador pendente do mesmo jogador"""
+        entry = self._pending.get(key)
+        if entry is None:
+            return row
+        if row is None:
+            return entry
+        return (entry[NAME], *(row[field] + entry[field] for field in (SCORE, PLAYED, WON, ERRORS, HINTS)),
+                min(row[CREATED], entry[CREATED]), max(row[LAST], entry[LAST]))
+
+    def load(self, name):
+        """Perfil do jogador (Player) ou None se nunca jogou"""
+        key = name_key(name)
+        with self._lock:
+            row = self._merged(self._db.execute(SELECT_ONE, (key,)).fetchone(), key)
+        return None if row is None else _player(row)
+
+    def top(self, limit=10):
+        """Maiores pontuações acumuladas (usa o índice de score)"""
+        self.flush()
+        with self._lock:
+            return [_player(row) for row in self._db.execute(SELECT_TOP, (limit,))]
+
+    def recent(self, limit=10):
+        """Jogadores mais recentes (usa o índice de last_played)"""
+        self.flush()
+        with self._lock:
+            return [_player(row) for row in self._db.execute(SELECT_RECENT, (limit,))]
+
+    def table(self):
+        """Todos os perfis em uma PlayerTable (sem criar um Player por jogador)"""
+        self.flush()
+        with self._lock:
+            return PlayerTable.from_rows(self._db.execute(SELECT_ALL))
+
+    def __len__(self):
+        self.flush()
+        with self._lock:
+            return self._db.execute(COUNT).fetchone()[0]
+
+    def close(self):
+        """Grava o que estiver pendente e fecha o banco"""
+        if self._db is None:
+            return
+        self.flush()
+        self._db.close()
+        self._db = None
+
+    def __repr__(self):
+        return f"PlayerStore('{self.path}', pending={len(self._pending)})"
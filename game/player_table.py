@@ -0,0 +1,129 @@
+import heapq
+from array import array
+from game.player import Player
+
+# Colunas numéricas, na mesma ordem dos atributos de Player
+COLUMNS = ("score", "games_played", "games_won", "total_errors", "total_hints_used",
+           "created_ts", "last_played_ts")
+SUMMED = COLUMNS[:5]
+
+
+class PlayerTable:
+    """Estatísticas de muitos jogadores em colunas (arrays paralelos)
+
+    Cada coluna é um array('q') e os nomes ficam em uma lista; uma linha
+    corresponde a um jogador. Taxas, agrupamento por nome e top-K operam
+    direto nas colunas, sem criar um Player por linha: objetos só são
+    montados sob demanda em player(row).
+    """
+
+    def __init__(self):
+        self.names = []
+        for column in COLUMNS:
+            setattr(self, column, array('q'))
+
+    @classmethod
+    def from_players(cls, players):
+        table = cls()
+        for player in players:
+            table.add_player(player)
+        return table
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Cria a tabela a partir de tuplas (nome, score, ..., last_played_ts)"""
+        table = cls()
+        for row in rows:
+            table.append(*row)
+        return table
+
+    def append(self, name, score=0, games_played=0, games_won=0, total_errors=0,
+               total_hints_used=0, created_ts=0, last_played_ts=0):
+        self.names.append(name)
+        self.score.append(score)
+        self.games_played.append(games_played)
+        self.games_won.append(games_won)
+        self.total_errors.append(total_errors)
+        self.total_hints_used.append(total_hints_used)
+        self.created_ts.append(int(created_ts))
+        self.last_played_ts.append(int(last_played_ts))
+
+    def add_player(self, player):
+        self.append(player.name, *(getattr(player, column) for column in COLUMNS))
+
+    def __len__(self):
+        return len(self.names)
+
+    def player(self, row):
+        """Materializa a linha como Player"""
+        player = Player(self.names[row])
+        for column in COLUMNS:
+            setattr(player, column, getattr(self, column)[row])
+        return player
+
+    def __iter__(self):
+        return (self.player(row) for row in range(len(self)))
+
+    def win_rates(self):
+        """Taxa de vitórias (%) de todas as linhas"""
+        return array('d', [won * 100 / played if played else 0.0
+                           for won, played in zip(self.games_won, self.games_played)])
+
+    def average_errors(self):
+        """Média de erros por jogo de todas as linhas"""
+        return array('d', [errors / played if played else 0.0
+                           for errors, played in zip(self.total_errors, self.games_played)])
+
+    def group_by_name(self):
+        """Nova tabela com uma linha por jogador (nomes sem diferenciar maiúsculas)
+
+        Mesmo critério de Player.__eq__; vale o nome da primeira ocorrência.
+        Contadores são somados, created_ts fica com o mínimo e
+        last_played_ts com o máximo.
+        """
+        grouped = PlayerTable()
+        groups = {}
+        group_of = array('q')
+        for name in self.names:
+            key = name.lower()
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = len(grouped.names)
+                grouped.names.append(name)
+            group_of.append(group)
+
+        # Uma passada por coluna: soma, mínimo ou máximo por grupo
+        size = len(grouped.names)
+        for column in SUMMED:
+            totals = array('q', bytes(8 * size))
+            for group, value in zip(group_of, getattr(self, column)):
+                totals[group] += value
+            setattr(grouped, column, totals)
+
+        first = array('q', [2 ** 63 - 1]) * size
+        for group, value in zip(group_of, self.created_ts):
+            if value < first[group]:
+                first[group] = value
+        grouped.created_ts = first
+
+        last = array('q', [-2 ** 63]) * size
+        for group, value in zip(group_of, self.last_played_ts):
+            if value > last[group]:
+                last[group] = value
+        grouped.last_played_ts = last
+        return grouped
+
+    def top(self, k=10, column="score"):
+        """Linhas das k maiores entradas da coluna (ordem decrescente)"""
+        values = getattr(self, column) if isinstance(column, str) else column
+        return heapq.nlargest(k, range(len(values)), key=values.__getitem__)
+
+    def top_players(self, k=10, column="score"):
+        return [self.player(row) for row in self.top(k, column)]
+
+    def totals(self):
+        """Soma de cada contador em todas as linhas"""
+        return {column: sum(getattr(self, column)) for column in SUMMED}
+
+    def __repr__(self):
+        return f"PlayerTable(rows={len(self)})"
@@ -0,0 +1,47 @@
+import os
+import random
+
+
+class RandomService:
+    """Geradores com semente de uma sessão de jogo
+
+    Tudo o que a sessão sorteia sai de um gerador nomeado (stream),
+    derivado da semente: a mesma semente repete a sessão, e sessões
+    diferentes não dividem estado nenhum (nada usa o random global). As
+    palavras de cada dificuldade vêm de um WordSchedule sorteado em blocos
+    e sem repetição, criado no primeiro uso e recriado quando o índice de
+    palavras muda (troca de categoria ou recarga do dicionário).
+    """
+
+    def __init__(self, seed=None, block_size=256):
+        self.seed = int.from_bytes(os.urandom(8), "little") if seed is None else seed
+        self.block_size = block_size
+        self._streams = {}
+        self._schedules = {}
+
+    def stream(self, name):
+        """Gerador nomeado; cada nome tem sua sequência, fixada pela semente"""
+        rng = self._streams.get(name)
+        if rng is None:
+            # Semente texto: derivação estável entre processos (sem hash aleatório)
+            rng = self._streams[name] = random.Random(f"{self.seed}:{name}")
+        return rng
+
+    def session(self, name):
+        """Serviço filho com semente derivada (ex.: uma sessão do servidor)"""
+        return RandomService(self.stream(f"sessao:{name}").getrandbits(64), self.block_size)
+
+    def schedule(self, word_index, difficulty):
+        """Sequência de palavras da dificuldade sobre o índice atual"""
+        schedule = self._schedules.get(difficulty)
+        if schedule is None or schedule.word_index is not word_index:
+            rng = self.stream(f"palavras:{difficulty.name}")
+            schedule = self._schedules[difficulty] = word_index.schedule_for(difficulty, rng, self.block_size)
+        return schedule
+
+    def next_word(self, word_index, difficulty):
+        """Índice da próxima palavra da dificuldade (None se não houver)"""
+        return self.schedule(word_index, difficulty).next()
+
+    def __repr__(self):
+        return f"RandomService(seed={self.seed}, schedules={len(self._schedules)})"
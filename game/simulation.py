@@ -0,0 +1,194 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from game.difficulty import Difficulty
+from game.engine import RoundState
+from game.hot_reload import index_words
+from game.random_service import RandomService
+from utils.alphabet import BASE_LETTERS
+from utils.file_manager import FileManager
+
+
+class RandomStrategy:
+    """Chuta letras do alfabeto em ordem aleatória"""
+
+    name = "random"
+
+    def next_guess(self, state, rng):
+        return rng.choice([letter for letter in BASE_LETTERS if not state.is_used(letter)])
+
+
+class FrequencyStrategy:
+    """Chuta letras pela frequência no português"""
+
+    name = "frequency"
+    ORDER = "aeosrindmutclpvghqbfzjxkwyçãéáíóêõâúôàü"
+
+    def next_guess(self, state, rng):
+        for letter in self.ORDER:
+            if not state.is_used(letter):
+                return letter
+        return None
+
+
+class HintFirstStrategy(FrequencyStrategy):
+    """Usa as dicas logo no início e depois segue a frequência"""
+
+    name = "hint-first"
+    use_hints = True
+
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (RandomStrategy, FrequencyStrategy, HintFirstStrategy)
+}
+
+
+def play_headless(state, strategy, rng):
+    """Joga uma rodada inteira sem terminal; retorna o RoundState final"""
+    use_hints = getattr(strategy, "use_hints", False)
+    while not state.is_over:
+        if use_hints and state.hints_left > 0:
+            hint = state.take_hint(rng)
+            if hint is not None:
+                state.apply_guess(hint)
+                continue
+
+        guess = strategy.next_guess(state, rng)
+        if guess is None:
+            break
+        state.apply_guess(guess)
+    return state
+
+
+class SimulationReport:
+    """Resultados agregados de um lote de partidas para uma dificuldade"""
+
+    def __init__(self, difficulty, strategy):
+        self.difficulty = difficulty
+        self.strategy = strategy
+        self.games = 0
+        self.wins = 0
+        self.total_errors = 0
+        self.total_hints = 0
+        self.scores = Counter()
+
+    def add(self, state):
+        """Contabiliza uma rodada finalizada"""
+        self.games += 1
+        self.total_errors += state.errors
+        self.total_hints += state.hints_used
+        if state.is_won:
+            self.wins += 1
+            self.scores[state.score(self.difficulty)] += 1
+
+    def merge(self, other):
+        """Soma os resultados de outro relatório (mesma dificuldade)"""
+        self.games += other.games
+        self.wins += other.wins
+        self.total_errors += other.total_errors
+        self.total_hints += other.total_hints
+        self.scores.update(other.scores)
+        return self
+
+    @property
+    def win_rate(self):
+        return (self.wins / self.games) * 100 if self.games else 0.0
+
+    @property
+    def average_errors(self):
+        return self.total_errors / self.games if self.games else 0.0
+
+    @property
+    def average_score(self):
+        """Média de pontos por partida (derrotas valem zero)"""
+        if not self.games:
+            return 0.0
+        return sum(score * count for score, count in self.scores.items()) / self.games
+
+    def score_percentile(self, percent):
+        """Percentil da pontuação entre as vitórias"""
+        target = self.wins * percent / 100
+        seen = 0
+        for score in sorted(self.scores):
+            seen += self.scores[score]
+            if seen >= target:
+                return score
+        return 0
+
+    def __str__(self):
+        return (f"{self.difficulty.name:<7} | {self.strategy:<10} | partidas: {self.games} | "
+                f"vitórias: {self.win_rate:.1f}% | erros médios: {self.average_errors:.2f} | "
+                f"pontos médios: {self.average_score:.1f} | "
+                f"p50/p90: {self.score_percentile(50)}/{self.score_percentile(90)}")
+
+
+# Estado de cada processo do pool: dicionário carregado uma vez por worker
+_worker_words = None
+_worker_index = None
+
+
+def _init_worker(filename, shared_name=None):
+    global _worker_words, _worker_index
+    _worker_words = FileManager(filename).read_words(shared_name)
+    # Mesmo índice do jogo: percentis da tabela de dificuldade, se em dia
+    _worker_index = index_words(_worker_words)
+
+
+def _run_batch(difficulty_value, strategy_name, games, seed, batch, max_hints):
+    """Joga um lote de partidas dentro de um worker
+
+    As palavras saem do mesmo caminho do jogo (RandomService.next_word,
+    sem repetição no lote), com um serviço derivado de (seed, lote).
+    """
+    difficulty = Difficulty(difficulty_value)
+    strategy = STRATEGIES[strategy_name]()
+    service = RandomService(seed).session(f"{difficulty.name}:{batch}")
+    rng = service.stream("jogadas")
+    report = SimulationReport(difficulty, strategy_name)
+
+    for _ in range(games):
+        index = service.next_word(_worker_index, difficulty)
+        if index is None:
+            index = service.stream("palavras").randrange(len(_worker_words))
+        state = RoundState(_worker_words[index], difficulty.max_errors, max_hints,
+                           index, _worker_words.mask(index))
+        report.add(play_headless(state, strategy, rng))
+    return report
+
+
+def simulate(games, difficulties=None, strategy="frequency", filename="palavras.txt",
+             workers=None, seed=0, batch_size=10000, max_hints=2, shared_name=None):
+    """Simula partidas em paralelo e retorna um relatório por dificuldade
+
+    As partidas são divididas em lotes distribuídos em um pool de processos;
+    cada lote tem geradores próprios derivados de seed, então o resultado é
+    reproduzível para o mesmo número de lotes. As palavras são sorteadas
+    como no jogo: por percentil quando há tabela de dificuldade em dia. Com shared_name os workers
+    usam o dicionário em memória compartilhada em vez de carregar o arquivo.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Estratégia desconhecida: {strategy}")
+
+    difficulties = list(difficulties or Difficulty)
+    workers = workers or os.cpu_count() or 1
+    reports = {difficulty: SimulationReport(difficulty, strategy) for difficulty in difficulties}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(filename, shared_name)) as pool:
+        futures = []
+        for difficulty in difficulties:
+            remaining = games
+            batch = 0
+            while remaining > 0:
+                size = min(batch_size, remaining)
+                futures.append(pool.submit(_run_batch, difficulty.value, strategy,
+                                           size, seed, batch, max_hints))
+                remaining -= size
+                batch += 1
+
+        for future in futures:
+            report = future.result()
+            reports[report.difficulty].merge(report)
+
+    return reports
@@ -0,0 +1,213 @@
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from game.difficulty import Difficulty
+from game.engine import RoundState
+from game.player import Player
+from game.player_table import COLUMNS
+
+# Fotografia binária de uma sessão:
+#   cabeçalho -> mágica, versão, CRC32 do corpo
+#   corpo     -> sessão + jogador + nome, categoria [+ rodada + palavra + letras extras]
+MAGIC = b"FORCASNP"
+VERSION = 1
+HEADER = struct.Struct("<8sHxxI")
+SESSION = struct.Struct("<qIB?")       # instante (s), rodada, dificuldade, rodada em andamento
+PLAYER = struct.Struct(f"<{len(COLUMNS)}q")
+ROUND = struct.Struct("<IQQBBBB")      # id da palavra, usadas, descobertas, erros, máx., dicas, máx.
+TEXT = struct.Struct("<H")
+
+NO_WORD = 0xFFFFFFFF
+
+
+def _pack_text(text):
+    data = text.encode('utf-8')
+    return TEXT.pack(len(data)) + data
+
+
+def _unpack_text(data, position):
+    size, = TEXT.unpack_from(data, position)
+    start = position + TEXT.size
+    return data[start:start + size].decode('utf-8'), start + size
+
+
+class SessionSnapshot:
+    """Estado de uma sessão interrompível: jogador, dificuldade e rodada atual
+
+    A rodada é guardada como o id da palavra e as máscaras de letras do
+    RoundState, então retomar é um acesso direto ao dicionário (words[id]),
+    sem procurar a palavra. O texto da palavra também vai junto, para
+    conferir que o dicionário não mudou.
+    """
+
+    __slots__ = ("player", "difficulty", "category", "round_number", "round", "saved_at")
+
+    def __init__(self, player, difficulty, category, round_number=0, round=None, saved_at=None):
+        self.player = player
+        self.difficulty = difficulty
+        self.category = category
+        self.round_number = round_number
+        self.round = round
+        self.saved_at = int(time.time()) if saved_at is None else saved_at
+
+    def pack(self):
+        """Serializa a fotografia (alguns bytes; barato o bastante para cada jogada)"""
+        state = self.round
+        parts = [
+            SESSION.pack(self.saved_at, self.round_number, self.difficulty.value, state is not None),
+            PLAYER.pack(*(getattr(self.player, column) for column in COLUMNS)),
+            _pack_text(self.player.name),
+            _pack_text(self.category),
+        ]
+        if state is not None:
+            parts.append(ROUND.pack(NO_WORD if state.word_id is None else state.word_id,
+                                    state.used_mask, state.correct_mask, state.errors,
+                                    state.max_errors, state.hints_used, state.max_hints))
+            parts.append(_pack_text(state.word))
+            parts.append(_pack_text("".join(sorted(state._other_used))))
+        body = b"".join(parts)
+        return HEADER.pack(MAGIC, VERSION, zlib.crc32(body)) + body
+
+    @classmethod
+    def unpack(cls, data):
+        if len(data) < HEADER.size:
+            raise ValueError("Fotografia da sessão incompleta")
+        magic, version, crc = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Arquivo não é uma fotografia de sessão")
+        if version != VERSION:
+            raise ValueError(f"Versão de fotografia não suportada: {version}")
+        body = data[HEADER.size:]
+        if zlib.crc32(body) != crc:
+            raise ValueError("Fotografia da sessão corrompida")
+
+        saved_at, round_number, difficulty, has_round = SESSION.unpack_from(body)
+        position = SESSION.size
+        values = PLAYER.unpack_from(body, position)
+        position += PLAYER.size
+        name, position = _unpack_text(body, position)
+        category, position = _unpack_text(body, position)
+
+        player = Player(name)
+        for column, value in zip(COLUMNS, values):
+            setattr(player, column, value)
+
+        state = None
+        if has_round:
+            word_id, used, correct, errors, max_errors, hints, max_hints = ROUND.unpack_from(body, position)
+            position += ROUND.size
+            word, position = _unpack_text(body, position)
+            other_used, position = _unpack_text(body, position)
+            state = RoundState.resumed(word, max_errors, max_hints,
+                                       None if word_id == NO_WORD else word_id,
+                                       used, correct, errors, hints, other_used)
+        return cls(player, Difficulty(difficulty), category, round_number, state, saved_at)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            return cls.unpack(file.read())
+
+    def __repr__(self):
+        return (f"SessionSnapshot('{self.player.name}', {self.difficulty.name}, "
+                f"round={'sim' if self.round else 'não'})")
+
+
+def snapshot_path(directory, name):
+    """Arquivo da fotografia de um jogador (nome sem diferenciar maiúsculas)"""
+    key = re.sub(r"[^\w-]", "_", name.lower())
+    return Path(directory) / f"{key}.snap"
+
+
+def latest_snapshot(directory):
+    """Fotografia mais recente do diretório, ou None"""
+    paths = list(Path(directory).glob("*.snap")) if Path(directory).is_dir() else []
+    return max(paths, key=lambda path: path.stat().st_mtime_ns, default=None)
+
+
+class SnapshotWriter:
+    """Grava fotografias da sessão em segundo plano, de forma atômica
+
+    save() só guarda os bytes mais recentes e acorda a thread, então o
+    jogo não espera pelo disco. A thread grava em um arquivo temporário,
+    faz fsync e o renomeia por cima do anterior (os.replace): quem lê vê a
+    fotografia antiga ou a nova, nunca uma pela metade. Entre gravações
+    ela espera interval segundos, e fotografias intermediárias são
+    descartadas (vale a última).
+    """
+
+    def __init__(self, path, interval=0.5):
+        self.path = Path(path)
+        self.interval = interval
+        self.writes = 0
+        self.last_error = None
+        self._pending = None
+        self._discard = False
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="fotografias", daemon=True)
+        self._thread.start()
+
+    def save(self, snapshot):
+        """Agenda a gravação da fotografia sem bloquear"""
+        data = snapshot.pack()
+        with self._lock:
+            self._pending = data
+            self._discard = False
+        self._wake.set()
+
+    def discard(self):
+        """Apaga a fotografia (sessão encerrada normalmente)"""
+        with self._lock:
+            self._pending = None
+            self._discard = True
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            self._flush()
+            # No máximo uma gravação por intervalo; close() interrompe a espera
+            self._stop.wait(self.interval)
+        self._flush()
+
+    def _flush(self):
+        with self._lock:
+            data, discard = self._pending, self._discard
+            self._pending = None
+            self._discard = False
+        try:
+            if discard:
+                self.path.unlink(missing_ok=True)
+            elif data is not None:
+                self._write(data)
+        except OSError as e:
+            self.last_error = e
+
+    def _write(self, data):
+        self.path.parent.mkdir(exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temporary, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+        self.writes += 1
+
+    def close(self):
+        """Grava o que estiver pendente; retorna True se a fotografia ficou no disco"""
+        if self._thread is not None:
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        return self.path.exists()
+
+    def __repr__(self):
+        return f"SnapshotWriter('{self.path}', writes={self.writes})"
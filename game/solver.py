@@ -0,0 +1,162 @@
+from array import array
+from collections import OrderedDict
+from utils.alphabet import BASE_LETTERS, LETTER_BITS, fold_letter, fold_mask, letter_mask
+
+
+class Solver:
+    """Adivinhador ótimo (guloso) com índice de partições por padrão
+
+    Um estado de jogo visto pelo adivinhador é a chave
+    (tamanho, padrão revelado, máscara de letras erradas). Para cada chave o
+    solver guarda os candidatos do dicionário e, ao chutar uma letra, divide
+    esses candidatos pelos padrões que a letra revelaria. As partições e a
+    melhor letra de cada estado ficam em caches LRU (cache_size entradas
+    cada), então palavras que seguem o mesmo caminho de chutes compartilham
+    todo o trabalho.
+
+    A letra escolhida é a presente no maior número de candidatos, o que
+    minimiza a probabilidade de erro no próximo chute. Como no jogo, cada
+    chute é uma letra base e revela as variantes acentuadas: as máscaras
+    guardadas são as dobradas (fold_mask).
+    """
+
+    HIDDEN = "_"
+
+    def __init__(self, words, cache_size=200000):
+        self.words = words
+        self.cache_size = cache_size
+        mask_of = getattr(words, "mask", None)
+        if mask_of is None:
+            self.masks = array('Q', (fold_mask(letter_mask(word)) for word in words))
+        else:
+            self.masks = array('Q', (fold_mask(mask_of(index)) for index in range(len(words))))
+
+        self._by_length = {}
+        for index in range(len(words)):
+            self._by_length.setdefault(len(words[index]), array('I')).append(index)
+
+        self._partitions = OrderedDict()
+        self._best = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def initial_key(self, length):
+        """Chave do estado inicial para palavras de um tamanho"""
+        return (length, self.HIDDEN * length, 0)
+
+    def candidates(self, key):
+        """Candidatos de um estado (apenas estados iniciais ou já particionados)"""
+        length, pattern, excluded = key
+        if not excluded and pattern == self.HIDDEN * length:
+            return self._by_length.get(length, array('I'))
+        raise KeyError("Estado não particionado; use partition() a partir do estado anterior")
+
+    def letter_counts(self, candidates, guessed_mask):
+        """Quantos candidatos contêm cada letra ainda não chutada
+
+        Contagem feita sobre o array de máscaras dos candidatos, sem
+        decodificar nenhuma palavra.
+        """
+        masks = self.masks
+        counts = {}
+        for letter in BASE_LETTERS:
+            bit = LETTER_BITS[letter]
+            if guessed_mask & bit:
+                continue
+            total = sum(1 for index in candidates if masks[index] & bit)
+            if total:
+                counts[letter] = total
+        return counts
+
+    def best_letter(self, key, candidates):
+        """Letra que melhor divide os candidatos do estado"""
+        best = self._best.get(key)
+        if best is not None:
+            self._best.move_to_end(key)
+        else:
+            guessed = key[2] | self._revealed_mask(key[1])
+            counts = self.letter_counts(candidates, guessed)
+            if not counts:
+                return None
+            # Mais candidatos contendo a letra; empate pela ordem do alfabeto
+            best = max(BASE_LETTERS, key=lambda letter: counts.get(letter, 0))
+            self._best[key] = best
+            if len(self._best) > self.cache_size:
+                self._best.popitem(last=False)
+        return best
+
+    def _revealed_mask(self, pattern):
+        mask = 0
+        for letter in pattern:
+            if letter != self.HIDDEN:
+                mask |= LETTER_BITS.get(fold_letter(letter), 0)
+        return mask
+
+    def pattern_for(self, word, pattern, letter):
+        """Padrão resultante de revelar letter (e suas variantes) em word"""
+        return "".join(char if fold_letter(char) == letter else shown
+                       for char, shown in zip(word, pattern))
+
+    def partition(self, key, candidates, letter):
+        """Divide os candidatos pelo padrão que a letra revela
+
+        Retorna {chave_filha: candidatos}. Candidatos que não contêm a letra
+        vão para a chave com a letra adicionada às erradas.
+        """
+        cache_key = (key, letter)
+        cached = self._partitions.get(cache_key)
+        if cached is not None:
+            self._partitions.move_to_end(cache_key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        length, pattern, excluded = key
+        bit = LETTER_BITS[letter]
+        miss_key = (length, pattern, excluded | bit)
+        groups = {}
+        for index in candidates:
+            if self.masks[index] & bit:
+                child = (length, self.pattern_for(self.words[index], pattern, letter), excluded)
+            else:
+                child = miss_key
+            groups.setdefault(child, array('I')).append(index)
+
+        self._partitions[cache_key] = groups
+        if len(self._partitions) > self.cache_size:
+            self._partitions.popitem(last=False)
+        return groups
+
+    def solve(self, index):
+        """Chutes errados do solver até descobrir a palavra de índice index"""
+        word = self.words[index]
+        key = self.initial_key(len(word))
+        candidates = self.candidates(key)
+        errors = 0
+
+        while self.HIDDEN in key[1] and len(candidates) > 1:
+            letter = self.best_letter(key, candidates)
+            if letter is None:
+                break
+            groups = self.partition(key, candidates, letter)
+            if self.masks[index] & LETTER_BITS[letter]:
+                key = (key[0], self.pattern_for(word, key[1], letter), key[2])
+            else:
+                key = (key[0], key[1], key[2] | LETTER_BITS[letter])
+                errors += 1
+            candidates = groups[key]
+
+        # Um único candidato restante: o solver já sabe a palavra
+        return errors
+
+    def solve_all(self):
+        """Erros do solver para cada palavra do dicionário (array por índice)"""
+        errors = array('B', bytes(len(self.words)))
+        for length in sorted(self._by_length):
+            for index in self._by_length[length]:
+                errors[index] = min(self.solve(index), 255)
+        return errors
+
+    def __repr__(self):
+        return (f"Solver(words={len(self.words)}, partitions={len(self._partitions)}, "
+                f"hits={self.hits}, misses={self.misses})")
@@ -0,0 +1,177 @@
+import os
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from game.difficulty import Difficulty
+from game.engine import RoundState
+from game.hot_reload import index_words
+from game.player import Player
+from game.random_service import RandomService
+from game.simulation import STRATEGIES, play_headless
+from utils.file_manager import FileManager
+
+# Resultado de uma rodada de um participante (pequeno para voltar do worker)
+RoundResult = namedtuple("RoundResult", "entrant difficulty round word_id won score errors hints")
+
+
+def deal(words, word_index, difficulties, rounds, seed):
+    """Sequência de palavras (ids) de cada dificuldade, igual para todos
+
+    As palavras saem das mesmas sequências pré-sorteadas do jogo
+    (RandomService), sem repetição, com a semente do torneio.
+    """
+    service = RandomService(seed)
+    fallback = service.stream("palavras")
+    schedule = {}
+    for difficulty in difficulties:
+        dealt = []
+        for _ in range(rounds):
+            index = service.next_word(word_index, difficulty)
+            dealt.append(fallback.randrange(len(words)) if index is None else index)
+        schedule[difficulty] = dealt
+    return schedule
+
+
+# Dicionário de cada processo do pool, carregado uma vez por worker
+_worker_words = None
+
+
+def _init_worker(filename, shared_name=None):
+    global _worker_words
+    _worker_words = FileManager(filename).read_words(shared_name)
+
+
+def _play_batch(entrant, strategy_name, difficulty_value, first_round, word_ids, seed, max_hints):
+    """Joga uma sequência de palavras com uma estratégia dentro de um worker
+
+    O gerador de cada rodada depende só de (seed, participante,
+    dificuldade, rodada), então o resultado não muda com o tamanho dos
+    lotes nem com a ordem em que os workers terminam.
+    """
+    difficulty = Difficulty(difficulty_value)
+    strategy = STRATEGIES[strategy_name]()
+    results = []
+    for round_number, word_id in enumerate(word_ids, first_round):
+        rng = random.Random(hash((seed, entrant, difficulty_value, round_number)))
+        state = RoundState(_worker_words[word_id], difficulty.max_errors, max_hints,
+                           word_id, _worker_words.mask(word_id))
+        play_headless(state, strategy, rng)
+        score = state.score(difficulty) if state.is_won else 0
+        results.append(RoundResult(entrant, difficulty_value, round_number, word_id, state.is_won,
+                                   score, state.errors, state.hints_used))
+    return results
+
+
+class Tournament:
+    """Torneio entre estratégias nas mesmas palavras, em um pool de processos
+
+    Cada participante joga a mesma sequência de palavras em cada
+    dificuldade (deal). As rodadas vão para os workers em lotes e os
+    resultados são consumidos à medida que ficam prontos (run() é um
+    gerador); a classificação acumula estatísticas em objetos Player, um
+    por participante e outro por participante e dificuldade.
+    """
+
+    def __init__(self, entrants, rounds=100, difficulties=None, filename="palavras.txt",
+                 seed=0, workers=None, batch_size=250, max_hints=2, shared_name=None):
+        unknown = [name for name in entrants if name not in STRATEGIES]
+        if unknown:
+            raise ValueError(f"Estratégia desconhecida: {', '.join(unknown)}")
+        if len(set(entrants)) != len(entrants):
+            raise ValueError("Participantes repetidos no torneio")
+
+        self.entrants = list(entrants)
+        self.rounds = rounds
+        self.difficulties = list(difficulties or Difficulty)
+        self.filename = filename
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.max_hints = max_hints
+        self.shared_name = shared_name
+
+        self.players = {name: Player(name) for name in self.entrants}
+        self.by_difficulty = {(name, difficulty): Player(name)
+                              for name in self.entrants for difficulty in self.difficulties}
+        self._round_scores = {}
+        self.completed = 0
+
+    @property
+    def total_rounds(self):
+        return len(self.entrants) * len(self.difficulties) * self.rounds
+
+    def schedule(self):
+        """Palavras de cada dificuldade, sorteadas a partir da semente"""
+        words = FileManager(self.filename).read_words(self.shared_name)
+        try:
+            return deal(words, index_words(words), self.difficulties, self.rounds, self.seed)
+        finally:
+            words.close()
+
+    def run(self):
+        """Joga o torneio, devolvendo os lotes de RoundResult conforme terminam"""
+        schedule = self.schedule()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.filename, self.shared_name)) as pool:
+            futures = []
+            for entrant_number, entrant in enumerate(self.entrants):
+                for difficulty in self.difficulties:
+                    word_ids = schedule[difficulty]
+                    for start in range(0, len(word_ids), self.batch_size):
+                        futures.append(pool.submit(
+                            _play_batch, entrant_number, entrant, difficulty.value, start,
+                            word_ids[start:start + self.batch_size], self.seed, self.max_hints))
+
+            for future in as_completed(futures):
+                results = future.result()
+                for result in results:
+                    self.add(result)
+                yield results
+
+    def add(self, result):
+        """Contabiliza uma rodada na classificação"""
+        name = self.entrants[result.entrant]
+        difficulty = Difficulty(result.difficulty)
+        for player in (self.players[name], self.by_difficulty[(name, difficulty)]):
+            if result.won:
+                player.add_win(result.score, result.errors, result.hints)
+            else:
+                player.add_loss(result.errors, result.hints)
+        self._round_scores.setdefault((difficulty, result.round), {})[name] = result.score
+        self.completed += 1
+
+    def standings(self, difficulty=None):
+        """Participantes do melhor para o pior (pontos, depois vitórias)"""
+        if difficulty is None:
+            players = self.players.values()
+        else:
+            players = [self.by_difficulty[(name, difficulty)] for name in self.entrants]
+        return sorted(players, key=lambda player: (-player.score, -player.games_won, player.name))
+
+    def head_to_head(self):
+        """{(a, b): rodadas em que a fez mais pontos que b na mesma palavra}"""
+        wins = {(a, b): 0 for a in self.entrants for b in self.entrants if a != b}
+        for scores in self._round_scores.values():
+            for a, score_a in scores.items():
+                for b, score_b in scores.items():
+                    if score_a > score_b:
+                        wins[(a, b)] += 1
+        return wins
+
+    def report(self):
+        """Classificação geral, por dificuldade e confrontos diretos"""
+        lines = [f"🏆 Torneio: {len(self.entrants)} participantes, {self.rounds} palavras por "
+                 f"dificuldade, semente {self.seed}"]
+        for position, player in enumerate(self.standings(), 1):
+            lines.append(f"   {position}º {player} | erros médios: {player.average_errors:.2f} | "
+                         f"dicas: {player.total_hints_used}")
+        for difficulty in self.difficulties:
+            ranking = ", ".join(f"{player.name} ({player.score})" for player in self.standings(difficulty))
+            lines.append(f"   {difficulty.name:<7} {ranking}")
+        if len(self.entrants) > 1:
+            lines.append("   Confrontos (rodadas vencidas na mesma palavra):")
+            wins = self.head_to_head()
+            for index, a in enumerate(self.entrants):
+                for b in self.entrants[index + 1:]:
+                    lines.append(f"   {a} {wins[(a, b)]} x {wins[(b, a)]} {b}")
+        return "\n".join(lines)
@@ -0,0 +1,216 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class _ShuffledDraw:
+    """Sorteio sem reposição sobre um intervalo virtual 0..total-1
+
+    Usa Fisher-Yates preguiçoso: só as posições já trocadas ficam em memória,
+    então a lista de palavras nunca é copiada.
+    """
+
+    def __init__(self, total):
+        self.total = total
+        self.remaining = total
+        self.swaps = {}
+
+    def draw(self, rng):
+        """Retorna a próxima posição ainda não sorteada"""
+        if self.remaining == 0:
+            # Ciclo completo: recomeça o embaralhamento
+            self.remaining = self.total
+            self.swaps.clear()
+
+        last = self.remaining - 1
+        pick = rng.randrange(self.remaining)
+        value = self.swaps.get(pick, pick)
+        self.swaps[pick] = self.swaps.pop(last, last)
+        self.remaining = last
+        return value
+
+
+class WordSchedule:
+    """Índices de palavras de uma faixa, pré-sorteados em blocos sem repetição
+
+    Tem o próprio estado de sorteio (não o do WordIndex), então sessões
+    sobre o mesmo índice não interferem entre si, e um gerador próprio,
+    então a sequência é reproduzível pela semente. Cada bloco de
+    block_size índices é sorteado de uma vez; next() só avança uma posição.
+    Esgotada a faixa, um novo ciclo começa.
+    """
+
+    def __init__(self, word_index, key, low, high, rng, block_size=256):
+        self.word_index = word_index
+        self.rng = rng
+        self.block_size = block_size
+        self._selected, self._cumulative = word_index._range(key, low, high)
+        self.total = self._cumulative[-1] if self._cumulative else 0
+        self._draw = _ShuffledDraw(self.total)
+        self._block = array('I')
+        self._position = 0
+        self.drawn = 0
+
+    def _refill(self):
+        """Sorteia o próximo bloco de índices"""
+        locate = self.word_index._locate
+        selected, cumulative = self._selected, self._cumulative
+        draw, rng = self._draw.draw, self.rng
+        self._block = array('I', [locate(selected, cumulative, draw(rng))
+                                  for _ in range(self.block_size)])
+        self._position = 0
+
+    def next(self):
+        """Próximo índice da sequência (None se a faixa estiver vazia)"""
+        if not self.total:
+            return None
+        if self._position >= len(self._block):
+            self._refill()
+        index = self._block[self._position]
+        self._position += 1
+        self.drawn += 1
+        return index
+
+    def __repr__(self):
+        return f"WordSchedule(total={self.total}, drawn={self.drawn})"
+
+
+class WordIndex:
+    """Índice de palavras agrupadas por chave (tamanho, letras distintas...)
+
+    O índice guarda apenas posições das palavras na lista original, em
+    baldes por valor da chave. Sortear uma palavra em uma faixa de valores
+    (ex.: a faixa de tamanhos de uma Difficulty) custa O(1) após a primeira
+    consulta da faixa.
+    """
+
+    LENGTH = "length"
+    DISTINCT_LETTERS = "distinct_letters"
+    DIFFICULTY = "difficulty"
+
+    def __init__(self, words, lengths=None):
+        self.words = words
+        self._buckets = {}
+        self._ranges = {}
+
+        if lengths is None:
+            lengths = (len(word) for word in words)
+        self._buckets[self.LENGTH] = self._group(lengths)
+
+    @classmethod
+    def from_store(cls, words):
+        """Cria o índice a partir de um WordStore ou CompiledWordStore
+
+        Dicionários compilados já trazem os baldes de tamanho prontos,
+        então nenhuma palavra precisa ser percorrida.
+        """
+        if hasattr(words, "length_buckets"):
+            index = cls(words, lengths=())
+            index._buckets[cls.LENGTH] = dict(words.length_buckets())
+            return index
+        return cls(words, getattr(words, "lengths", None))
+
+    def extended(self, words, start, lengths=None):
+        """Novo índice para words, que mantém as start primeiras palavras deste
+
+        Só as palavras a partir de start são agrupadas; os baldes de
+        tamanho existentes são copiados (posições >= start descartadas).
+        Chaves extras não são copiadas e devem ser recriadas.
+        """
+        buckets = {}
+        for value, bucket in self._buckets[self.LENGTH].items():
+            kept = array('I', bucket[:bisect_left(bucket, start)])
+            if kept:
+                buckets[value] = kept
+        if lengths is None:
+            lengths = (len(words[position]) for position in range(start, len(words)))
+        else:
+            lengths = lengths[start:]
+        for position, value in enumerate(lengths, start):
+            bucket = buckets.get(value)
+            if bucket is None:
+                bucket = buckets[value] = array('I')
+            bucket.append(position)
+
+        index = WordIndex(words, lengths=())
+        index._buckets[self.LENGTH] = buckets
+        return index
+
+    @staticmethod
+    def _group(values):
+        """Agrupa posições de palavras pelo valor da chave"""
+        buckets = {}
+        for position, value in enumerate(values):
+            bucket = buckets.get(value)
+            if bucket is None:
+                bucket = buckets[value] = array('I')
+            bucket.append(position)
+        return buckets
+
+    def add_key(self, name, key_func):
+        """Cria uma chave extra do índice calculada por key_func(palavra)"""
+        self._buckets[name] = self._group(key_func(word) for word in self.words)
+        self._invalidate(name)
+
+    def add_values(self, name, values):
+        """Cria uma chave extra a partir de valores já calculados (um por palavra)"""
+        self._buckets[name] = self._group(values)
+        self._invalidate(name)
+
+    def has_key(self, name):
+        return name in self._buckets
+
+    def add_distinct_letters_key(self):
+        """Indexa as palavras pelo número de letras distintas"""
+        self.add_key(self.DISTINCT_LETTERS, lambda word: len(set(word)))
+
+    def _invalidate(self, key):
+        """Descarta faixas em cache de uma chave"""
+        for cached in [k for k in self._ranges if k[0] == key]:
+            del self._ranges[cached]
+
+    def _range(self, key, low, high):
+        """Retorna (baldes, acumulados) da união dos baldes em [low, high]"""
+        cache_key = (key, low, high)
+        cached = self._ranges.get(cache_key)
+        if cached is None:
+            buckets = self._buckets.get(key)
+            if buckets is None:
+                raise KeyError(f"Chave de índice desconhecida: {key}")
+
+            selected = [buckets[value] for value in sorted(buckets) if low <= value <= high]
+            cumulative = []
+            total = 0
+            for bucket in selected:
+                total += len(bucket)
+                cumulative.append(total)
+            cached = self._ranges[cache_key] = (selected, cumulative)
+        return cached
+
+    def _locate(self, selected, cumulative, position):
+        """Converte uma posição na união dos baldes em índice de palavra"""
+        slot = bisect_right(cumulative, position)
+        start = cumulative[slot - 1] if slot else 0
+        return selected[slot][position - start]
+
+    def count(self, low, high, key=LENGTH):
+        """Quantidade de palavras com valor da chave em [low, high]"""
+        _, cumulative = self._range(key, low, high)
+        return cumulative[-1] if cumulative else 0
+
+    def range_for(self, difficulty):
+        """(chave, mínimo, máximo) da dificuldade: tabela de dificuldade, se
+        indexada; senão faixa de tamanhos"""
+        if self.DIFFICULTY in self._buckets:
+            return (self.DIFFICULTY, *difficulty.score_range)
+        return (self.LENGTH, *difficulty.word_length_range)
+
+    def schedule_for(self, difficulty, rng, block_size=256):
+        """Sequência sem repetição das palavras da dificuldade (WordSchedule)"""
+        key, low, high = self.range_for(difficulty)
+        return WordSchedule(self, key, low, high, rng, block_size)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __repr__(self):
+        return f"WordIndex(words={len(self.words)}, keys={sorted(self._buckets)})"
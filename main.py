@@ -5,13 +5,304 @@ Autor: Margefson Barros
 Descrição: Jogo clássico da forca com interface colorida e recursos avançados
 """
 
-from game.core import HangmanGame
 import sys
 
-def main():
+# --startup-trace mede as importações, então o rastreador entra antes delas
+if "--startup-trace" in sys.argv:
+    from utils.startup_trace import TRACE
+    TRACE.install()
+
+# O jogo e os subcomandos importam o que usam dentro das próprias funções:
+# cada caminho (jogo, servidor, ferramentas) só paga pelas suas importações
+from game.difficulty import Difficulty
+import argparse
+
+def parse_args(argv=None):
+    """Interpreta os argumentos de linha de comando"""
+    parser = argparse.ArgumentParser(description="Jogo da Forca")
+    parser.add_argument("--shared-dict", metavar="NOME",
+                        help="Usa o dicionário em memória compartilhada criado por share-dict")
+    parser.add_argument("--no-events", action="store_true",
+                        help="Não grava o log de eventos das rodadas (data/eventos.log)")
+    parser.add_argument("--category", metavar="NOME",
+                        help="Joga com o dicionário data/NOME.txt (sem perguntar a categoria)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Recarrega o dicionário entre rodadas quando data/palavras.txt muda")
+    parser.add_argument("--seed", type=int, dest="game_seed", metavar="SEMENTE",
+                        help="Semente dos sorteios do jogo (mesma semente, mesmas palavras e dicas)")
+    parser.add_argument("--resume", nargs="?", const="", metavar="NOME",
+                        help="Retoma a sessão interrompida (a mais recente, ou a do jogador NOME)")
+    parser.add_argument("--startup-trace", action="store_true",
+                        help="Mostra o tempo de importação de cada módulo e das etapas de inicialização")
+    parser.add_argument("--profile", action="store_true",
+                        help="Mede as etapas do jogo e imprime um resumo ao sair")
+    parser.add_argument("--profile-prometheus", metavar="ARQUIVO",
+                        help="Com --profile, grava as métricas no formato texto do Prometheus")
+    parser.add_argument("--profile-pstats", metavar="ARQUIVO",
+                        help="Com --profile, roda o cProfile e grava a saída para o pstats")
+    commands = parser.add_subparsers(dest="command")
+    
+    compile_parser = commands.add_parser("compile-words", help="Compila o dicionário para o formato binário")
+    compile_parser.add_argument("arquivo", nargs="?", default="palavras.txt",
+                                help="Arquivo de palavras em data/ (padrão: palavras.txt)")
+    
+    simulate_parser = commands.add_parser("simulate", help="Simula partidas sem terminal em paralelo")
+    simulate_parser.add_argument("--games", type=int, default=10000, help="Partidas por dificuldade")
+    simulate_parser.add_argument("--strategy", default="frequency",
+                                 help="Estratégia de palpites (random, frequency, hint-first)")
+    simulate_parser.add_argument("--difficulty", choices=[d.name.lower() for d in Difficulty],
+                                 help="Simula apenas uma dificuldade")
+    simulate_parser.add_argument("--workers", type=int, help="Processos (padrão: nº de núcleos)")
+    simulate_parser.add_argument("--seed", type=int, default=0, help="Semente para reprodução")
+    
+    tournament_parser = commands.add_parser("tournament",
+                                            help="Torneio entre estratégias nas mesmas palavras")
+    tournament_parser.add_argument("entrants", nargs="*", default=["random", "frequency", "hint-first"],
+                                   metavar="ESTRATEGIA", help="Participantes (padrão: todas as estratégias)")
+    tournament_parser.add_argument("--rounds", type=int, default=200, help="Palavras por dificuldade")
+    tournament_parser.add_argument("--difficulty", choices=[d.name.lower() for d in Difficulty],
+                                   help="Joga apenas uma dificuldade")
+    tournament_parser.add_argument("--workers", type=int, help="Processos (padrão: nº de núcleos)")
+    tournament_parser.add_argument("--seed", type=int, default=0, help="Semente das palavras e das jogadas")
+    
+    solve_parser = commands.add_parser("solve", help="Mede os erros do solver ótimo em cada palavra")
+    solve_parser.add_argument("arquivo", nargs="?", default="palavras.txt",
+                              help="Arquivo de palavras em data/ (padrão: palavras.txt)")
+    
+    table_parser = commands.add_parser("build-difficulty",
+                                       help="Gera a tabela de dificuldade por palavra")
+    table_parser.add_argument("arquivo", nargs="?", default="palavras.txt",
+                              help="Arquivo de palavras em data/ (padrão: palavras.txt)")
+    table_parser.add_argument("--full", action="store_true",
+                              help="Recalcula tudo mesmo se só houver palavras novas")
+    
+    serve_parser = commands.add_parser("serve", help="Inicia o servidor multi-sessão")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=4000)
+    serve_parser.add_argument("--websocket-port", type=int, help="Ativa o adaptador WebSocket")
+    serve_parser.add_argument("--idle-timeout", type=float, default=300.0,
+                              help="Segundos sem comandos até desconectar")
+    serve_parser.add_argument("--max-sessions", type=int, default=10000)
+    
+    loadgen_parser = commands.add_parser("loadgen", help="Gera carga local contra o servidor")
+    loadgen_parser.add_argument("--host", default="127.0.0.1")
+    loadgen_parser.add_argument("--port", type=int, default=4000)
+    loadgen_parser.add_argument("--clients", type=int, default=1000)
+    loadgen_parser.add_argument("--concurrency", type=int, default=200)
+    loadgen_parser.add_argument("--rounds", type=int, default=3, help="Rodadas por sessão")
+    
+    share_parser = commands.add_parser("share-dict",
+                                       help="Carrega o dicionário em memória compartilhada")
+    share_parser.add_argument("--name", default="forca-palavras", help="Nome do segmento")
+    share_parser.add_argument("arquivo", nargs="?", default="palavras.txt",
+                              help="Arquivo de palavras em data/ (padrão: palavras.txt)")
+    
+    commands.add_parser("categories", help="Lista os dicionários de data/ com estatísticas")
+    
+    events_parser = commands.add_parser("events", help="Resume um log de eventos das rodadas")
+    events_parser.add_argument("arquivo", nargs="?", default="eventos.log",
+                               help="Log em data/ (padrão: eventos.log)")
+    
+    return parser.parse_args(argv)
+
+def compile_words(filename):
+    """Gera o dicionário compilado ao lado do arquivo de texto"""
+    from utils.file_manager import FileManager
+    
+    file_manager = FileManager(filename)
+    count = file_manager.compile_words()
+    print(f"✅ {count} palavras compiladas em {file_manager.compiled_path}")
+
+def simulate(args):
+    """Executa a simulação em lote e imprime o relatório"""
+    from game.simulation import simulate as run_simulation
+    
+    difficulties = [Difficulty[args.difficulty.upper()]] if args.difficulty else None
+    reports = run_simulation(args.games, difficulties, args.strategy,
+                             workers=args.workers, seed=args.seed, shared_name=args.shared_dict)
+    for report in reports.values():
+        print(report)
+
+def run_tournament(args):
+    """Executa o torneio mostrando o progresso e imprime a classificação"""
+    from game.tournament import Tournament
+    
+    difficulties = [Difficulty[args.difficulty.upper()]] if args.difficulty else None
+    tournament = Tournament(args.entrants, args.rounds, difficulties, seed=args.seed,
+                            workers=args.workers, shared_name=args.shared_dict)
+    for _ in tournament.run():
+        print(f"\r⏳ {tournament.completed}/{tournament.total_rounds} rodadas", end="", flush=True)
+    print()
+    print(tournament.report())
+
+def solve_words(filename):
+    """Roda o solver em todo o dicionário e mostra a classificação resultante"""
+    from collections import Counter
+    from game.solver import Solver
+    from utils.file_manager import FileManager
+    
+    words = FileManager(filename).read_words()
+    errors = Solver(words).solve_all()
+    
+    by_errors = Counter(errors)
+    for count in sorted(by_errors):
+        print(f"{count} erro(s): {by_errors[count]} palavras")
+    
+    by_difficulty = Counter(Difficulty.from_solver_errors(count) for count in errors)
+    for difficulty in Difficulty:
+        print(f"{difficulty}: {by_difficulty[difficulty]} palavras")
+
+def build_difficulty(filename, full=False):
+    """Gera ou atualiza a tabela de dificuldade ao lado do dicionário"""
+    from game.difficulty_table import DifficultyTable
+    from utils.file_manager import FileManager
+    
+    words = FileManager(filename).read_words()
+    path = DifficultyTable.path_for(words)
+    if full:
+        table = DifficultyTable.build(words)
+        table.save(path)
+    else:
+        table = DifficultyTable.load_for(words, build=True)
+    print(f"✅ Tabela de dificuldade com {len(table)} palavras em {path}")
+
+def serve(args):
+    """Executa o servidor assíncrono"""
+    from server.app import run_server
+    
+    run_server(host=args.host, port=args.port, websocket_port=args.websocket_port,
+               idle_timeout=args.idle_timeout, max_sessions=args.max_sessions, watch=args.watch,
+               seed=args.game_seed)
+
+def loadgen(args):
+    """Executa o gerador de carga e imprime as métricas"""
+    import asyncio
+    from server.loadgen import run_load
+    
+    report = asyncio.run(run_load(args.host, args.port, args.clients, args.concurrency, args.rounds))
+    print(report)
+
+def share_dictionary(filename, name):
+    """Mantém o dicionário em memória compartilhada até Ctrl+C"""
+    import signal
+    from utils.shared_dictionary import SharedWordStore
+    from utils.file_manager import FileManager
+    
+    words = FileManager(filename).read_words()
+    shared = SharedWordStore.create(words, name)
+    words.close()
+    print(f"✅ {len(shared)} palavras em memória compartilhada '{shared.name}'")
+    print(f"   Inicie os jogos com: python main.py --shared-dict {shared.name}")
+    try:
+        signal.pause() if hasattr(signal, "pause") else input()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shared.close()
+        print("\nDicionário compartilhado removido.")
+
+def list_categories():
+    """Lista os dicionários disponíveis sem carregá-los"""
+    from game.dictionary_registry import DictionaryRegistry
+    from utils.file_manager import FileManager
+    
+    registry = DictionaryRegistry(FileManager("palavras.txt").data_dir)
+    for name in registry.names():
+        info = registry.info(name)
+        stats = info.stats()
+        count = f"{stats['words']}" if stats["exact"] else f"~{stats['words']}"
+        line = f"{info.title:<20} {count:>10} palavras {stats['bytes'] / 1024:>10.1f} KiB"
+        if stats["lengths"]:
+            shortest, longest = min(stats["lengths"]), max(stats["lengths"])
+            line += f"  ({shortest}-{longest} letras)"
+        print(line)
+
+def summarize_events(filename):
+    """Relê o log de eventos e imprime o resumo"""
+    from game.events import summarize
+    from utils.file_manager import FileManager
+    
+    print(summarize(FileManager(filename).filepath))
+
+def report_profile(args):
+    """Imprime o resumo do profiler e grava os arquivos pedidos"""
+    from utils.display import Display
+    from utils.profiler import PROFILER
+    
+    PROFILER.disable()
+    renderer = Display.renderer
+    PROFILER.gauges.update(frames=renderer.frames, lines_written=renderer.lines_written)
+    for name, stats in Display.render_cache.stats().items():
+        PROFILER.gauges[f"render_cache_{name}_hits"] = stats["hits"]
+        PROFILER.gauges[f"render_cache_{name}_misses"] = stats["misses"]
+    
+    print()
+    print(PROFILER.summary())
+    if args.profile_prometheus:
+        PROFILER.write_prometheus(args.profile_prometheus)
+        print(f"   Métricas gravadas em {args.profile_prometheus}")
+    if args.profile_pstats:
+        PROFILER.write_pstats(args.profile_pstats)
+        print(f"   cProfile gravado em {args.profile_pstats} (python -m pstats {args.profile_pstats})")
+
+def main(argv=None):
     """Função principal do jogo"""
+    args = parse_args(argv)
+    args.profile = args.profile or bool(args.profile_prometheus or args.profile_pstats)
+    if args.profile:
+        from utils.profiler import PROFILER
+        PROFILER.enable(cprofile=bool(args.profile_pstats))
+    try:
+        run_command(args)
+    finally:
+        if args.profile:
+            report_profile(args)
+        if args.startup_trace:
+            from utils.startup_trace import TRACE
+            print()
+            print(TRACE.report())
+
+def run_command(args):
+    """Executa o subcomando pedido (ou o jogo interativo)"""
     try:
-        game = HangmanGame()
+        if args.command == "compile-words":
+            compile_words(args.arquivo)
+            return
+        if args.command == "build-difficulty":
+            build_difficulty(args.arquivo, args.full)
+            return
+        if args.command == "solve":
+            solve_words(args.arquivo)
+            return
+        if args.command == "share-dict":
+            share_dictionary(args.arquivo, args.name)
+            return
+        if args.command == "categories":
+            list_categories()
+            return
+        if args.command == "events":
+            summarize_events(args.arquivo)
+            return
+        if args.command == "serve":
+            serve(args)
+            return
+        if args.command == "loadgen":
+            loadgen(args)
+            return
+        if args.command == "tournament":
+            run_tournament(args)
+            return
+        if args.command == "simulate":
+            simulate(args)
+            return
+        
+        from game.core import HangmanGame
+        from utils.startup_trace import TRACE
+        
+        with TRACE.phase("HangmanGame()"):
+            game = HangmanGame(shared_dict=args.shared_dict, event_log=not args.no_events,
+                               watch=args.watch, category=args.category, resume=args.resume,
+                               seed=args.game_seed)
         game.run()
     except KeyboardInterrupt:
         print("\n\nJogo interrompido pelo usuário. Até mais!")
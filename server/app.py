@@ -0,0 +1,194 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from game.difficulty_table import DifficultyTable
+from game.events import EventLog
+from game.hot_reload import DictionaryReloader
+from game.player_store import PlayerStore
+from game.random_service import RandomService
+from game.word_index import WordIndex
+from server.session import GameSession
+from utils.display import Display
+from utils.leaderboard import WINDOWS
+from utils.file_manager import FileManager
+
+
+class SharedGame:
+    """Recursos compartilhados por todas as sessões de um servidor
+
+    O dicionário e o índice são carregados uma única vez. O placar é
+    gravado por uma única thread auxiliar, para que a E/S de arquivo não
+    bloqueie o loop de eventos. Os sorteios de cada sessão vêm de um
+    RandomService filho do servidor: com a mesma semente, a n-ésima sessão
+    recebe as mesmas palavras e dicas.
+    """
+
+    def __init__(self, filename="palavras.txt", watch=False, seed=None):
+        self.file_manager = FileManager(filename)
+        self.random = RandomService(seed)
+        self.sessions = 0
+        self.words = self.file_manager.read_words(private=watch)
+        self.word_index = WordIndex.from_store(self.words)
+        table = DifficultyTable.load_for(self.words)
+        if table is not None:
+            self.word_index.add_values(WordIndex.DIFFICULTY, table.percentiles)
+        self.events = EventLog(self.file_manager.data_dir / "eventos-servidor.log")
+        self.reloader = None
+        if watch:
+            self.reloader = DictionaryReloader(self.file_manager, self.words, self.word_index).start()
+        self.players = PlayerStore(self.file_manager.data_dir / "jogadores.db")
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="placar")
+        self._top_cache = self._rankings()
+
+    def session_random(self):
+        """Geradores da próxima sessão, derivados da semente do servidor"""
+        self.sessions += 1
+        return self.random.session(self.sessions)
+
+    def _rankings(self):
+        return {window: self.file_manager.read_leaderboard(window, limit=10) for window in WINDOWS}
+
+    def _save(self, player_name, score, difficulty):
+        self.file_manager.save_score(player_name, score, difficulty)
+        self._top_cache = self._rankings()
+
+    def record_score(self, player_name, score, difficulty=None):
+        """Agenda a gravação da pontuação (não bloqueia a sessão)"""
+        self._writer.submit(self._save, player_name, score, difficulty)
+
+    def refresh_dictionary(self):
+        """Adota a versão mais nova do dicionário (sessões chamam ao iniciar rodada)"""
+        if self.reloader is not None:
+            current = self.reloader.current
+            if current.words is not self.words:
+                self.words = current.words
+                self.word_index = current.word_index
+
+    def record_round(self, player_name, won, score, errors, hints_used):
+        """Agenda a atualização do perfil persistente do jogador"""
+        self._writer.submit(self.players.record, player_name, won, score, errors, hints_used)
+
+    def top_scores(self, limit=10, window="all"):
+        """Ranking por jogador, atualizado pela thread de gravação"""
+        if window not in self._top_cache:
+            raise ValueError(f"Janela inválida: {window} (use {', '.join(WINDOWS)})")
+        return self._top_cache[window][:limit]
+
+    def close(self):
+        if self.reloader is not None:
+            self.reloader.close()
+        self._writer.shutdown(wait=True)
+        self.events.close()
+        self.players.close()
+        self.file_manager.close()
+
+
+class GameServer:
+    """Servidor TCP assíncrono com milhares de sessões em um processo
+
+    Protocolo de linhas de texto (ver GameSession). Cada conexão tem tempo
+    máximo de inatividade; clientes lentos que não consomem as respostas
+    (buffer de escrita acima do limite por mais de write_timeout) são
+    desconectados.
+    """
+
+    def __init__(self, shared, host="127.0.0.1", port=4000, idle_timeout=300.0,
+                 write_timeout=10.0, max_sessions=10000, write_buffer_limit=64 * 1024):
+        self.shared = shared
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.write_timeout = write_timeout
+        self.max_sessions = max_sessions
+        self.write_buffer_limit = write_buffer_limit
+        self.active_sessions = 0
+        self.total_sessions = 0
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port,
+                                                  limit=4096)
+        sockets = self._server.sockets or []
+        if sockets:
+            self.port = sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _send(self, writer, lines):
+        """Escreve as respostas e aplica backpressure (drain com timeout)
+
+        As linhas (HIT/MISS com o padrão, ROUND, OK...) se repetem entre
+        sessões; os bytes vêm prontos do cache de renderização.
+        """
+        if lines:
+            line_bytes = Display.render_cache.line_bytes
+            writer.write(b"".join([line_bytes(line) for line in lines]))
+        await asyncio.wait_for(writer.drain(), self.write_timeout)
+
+    async def _handle_client(self, reader, writer):
+        writer.transport.set_write_buffer_limits(high=self.write_buffer_limit)
+        if self.active_sessions >= self.max_sessions:
+            writer.write(b"ERR servidor cheio\n")
+            writer.close()
+            return
+
+        self.active_sessions += 1
+        self.total_sessions += 1
+        session = GameSession(self.shared)
+        try:
+            await self._send(writer, ["HELLO forca 1"])
+            while not session.closed:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    await self._send(writer, ["BYE inatividade"])
+                    break
+                if not line:
+                    break
+                await self._send(writer, session.handle(line.decode('utf-8', 'replace')))
+        except (asyncio.TimeoutError, ConnectionError, ValueError, asyncio.LimitOverrunError):
+            # Cliente lento, conexão perdida ou linha longa demais
+            pass
+        finally:
+            session.abandon()
+            self.active_sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    def __repr__(self):
+        return (f"GameServer({self.host}:{self.port}, ativas={self.active_sessions}, "
+                f"total={self.total_sessions})")
+
+
+def run_server(filename="palavras.txt", host="127.0.0.1", port=4000, websocket_port=None,
+               watch=False, seed=None, **options):
+    """Carrega o dicionário uma vez e atende TCP (e WebSocket, se pedido)"""
+    shared = SharedGame(filename, watch, seed)
+
+    async def main():
+        server = await GameServer(shared, host, port, **options).start()
+        print(f"🎮 Servidor da forca em {host}:{server.port}")
+        tasks = [server.serve_forever()]
+        if websocket_port is not None:
+            from server.websocket import serve_websocket
+            tasks.append(serve_websocket(shared, host, websocket_port))
+            print(f"🌐 WebSocket em {host}:{websocket_port}")
+        await asyncio.gather(*tasks)
+
+    try:
+        asyncio.run(main())
+    finally:
+        shared.close()
@@ -0,0 +1,90 @@
+import asyncio
+import time
+from game.simulation import FrequencyStrategy
+
+
+class LoadReport:
+    """Métricas de uma execução do gerador de carga"""
+
+    def __init__(self):
+        self.sessions = 0
+        self.rounds = 0
+        self.guesses = 0
+        self.failures = 0
+        self.latencies = []
+        self.elapsed = 0.0
+
+    def percentile(self, percent):
+        """Percentil da latência por palpite, em milissegundos"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        position = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+        return ordered[position] * 1000
+
+    def __str__(self):
+        elapsed = self.elapsed or 1e-9
+        return (f"sessões: {self.sessions} ({self.sessions / elapsed:.1f}/s) | "
+                f"rodadas: {self.rounds} | palpites: {self.guesses} ({self.guesses / elapsed:.0f}/s) | "
+                f"falhas: {self.failures} | latência p50/p99: "
+                f"{self.percentile(50):.2f}/{self.percentile(99):.2f} ms")
+
+
+async def _client(host, port, rounds, difficulty, report):
+    """Um jogador robô: conecta, joga rodadas e desconecta"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        await reader.readline()  # HELLO
+        for command in (f"NAME robo{id(writer)}", f"DIFF {difficulty}"):
+            writer.write(f"{command}\n".encode('utf-8'))
+            await reader.readline()
+
+        for _ in range(rounds):
+            writer.write(b"NEW\n")
+            header = (await reader.readline()).decode('utf-8').split()
+            if not header or header[0] != "ROUND":
+                raise ConnectionError(f"Resposta inesperada: {header}")
+
+            for letter in FrequencyStrategy.ORDER:
+                started = time.perf_counter()
+                writer.write(f"GUESS {letter}\n".encode('utf-8'))
+                reply = (await reader.readline()).decode('utf-8').split()
+                report.latencies.append(time.perf_counter() - started)
+                report.guesses += 1
+                if not reply or reply[0] not in ("HIT", "MISS"):
+                    continue
+
+                # HIT|MISS <padrão> <erros>/<máximo>, seguido de WIN/LOSE no fim
+                errors, maximum = map(int, reply[2].split("/"))
+                if "_" not in reply[1] or errors >= maximum:
+                    await reader.readline()
+                    break
+            report.rounds += 1
+
+        writer.write(b"QUIT\n")
+        await reader.readline()
+        report.sessions += 1
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+async def run_load(host="127.0.0.1", port=4000, clients=100, concurrency=100, rounds=3, difficulty=2):
+    """Dispara clients sessões (no máximo concurrency simultâneas)"""
+    report = LoadReport()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def guarded():
+        async with limit:
+            try:
+                await _client(host, port, rounds, difficulty, report)
+            except (ConnectionError, OSError, ValueError):
+                report.failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(guarded() for _ in range(clients)))
+    report.elapsed = time.perf_counter() - started
+    return report
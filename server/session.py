@@ -0,0 +1,170 @@
+import time
+from game.difficulty import Difficulty
+from game.engine import RoundState, validate_guess
+from game.player import Player
+from utils.display import Display
+
+
+class GameSession:
+    """Sessão de um jogador no servidor, sem nenhuma entrada ou saída
+
+    Recebe comandos em texto (uma linha por comando) e devolve as linhas de
+    resposta. O dicionário é compartilhado entre todas as sessões; cada
+    sessão tem seu próprio Player, RoundState e RandomService (palavras
+    pré-sorteadas sem repetição e dicas), como o jogo no terminal.
+
+    Protocolo (respostas em maiúsculas):
+        NAME <nome>     -> OK
+        DIFF <1-4>      -> OK <dificuldade> (vale a partir do próximo NEW)
+        NEW             -> ROUND <tamanho> <erros máximos> <padrão>
+        GUESS <letra>   -> HIT|MISS <padrão> <erros>/<máximo> [+ WIN|LOSE]
+        HINT            -> HINT <letra> <dicas restantes>
+        STATS           -> STATS score=.. games=.. won=..
+        TOP [day|week]  -> TOP <n> seguido de n linhas "<pos> <nome> <pontos>"
+        QUIT            -> BYE
+
+    Uma rodada abandonada (NEW antes do fim, QUIT ou conexão encerrada)
+    conta como derrota, com 0 pontos, nas estatísticas e no placar.
+    """
+
+    def __init__(self, shared, max_hints=2, random_service=None):
+        self.shared = shared
+        self.max_hints = max_hints
+        self.random = random_service or shared.session_random()
+        self.player = Player("Jogador")
+        self.difficulty = Difficulty.NORMAL
+        self.round = None
+        # Dificuldade da rodada atual (DIFF no meio da rodada só vale para a próxima)
+        self.round_difficulty = self.difficulty
+        self.closed = False
+        self.session_id = shared.events.new_session()
+        self.round_number = 0
+        self._started = 0.0
+
+    def handle(self, line):
+        """Processa uma linha de comando e retorna as linhas de resposta"""
+        command, _, argument = line.strip().partition(" ")
+        handler = self.COMMANDS.get(command.upper())
+        if handler is None:
+            return [f"ERR comando desconhecido: {command}"] if command else []
+        try:
+            return handler(self, argument.strip())
+        except ValueError as e:
+            return [f"ERR {e}"]
+
+    def _name(self, argument):
+        if not argument:
+            raise ValueError("Digite seu nome")
+        self.player = Player(argument[:40])
+        return ["OK"]
+
+    def _difficulty(self, argument):
+        try:
+            self.difficulty = Difficulty(int(argument))
+        except ValueError:
+            raise ValueError("Opção inválida! Escolha entre 1-4.")
+        return [f"OK {self.difficulty.name}"]
+
+    def _new_round(self, argument):
+        self.abandon()
+        self.shared.refresh_dictionary()
+        words = self.shared.words
+        if not len(words):
+            raise ValueError("Nenhuma palavra disponível no dicionário!")
+        index = self.random.next_word(self.shared.word_index, self.difficulty)
+        if index is None:
+            index = self.random.stream("palavras").randrange(len(words))
+
+        self.round_difficulty = self.difficulty
+        self.round = RoundState(words[index], self.difficulty.max_errors, self.max_hints,
+                                index, words.mask(index))
+        self.round_number += 1
+        self._started = time.monotonic()
+        self.shared.events.round_start(self.session_id, self.round_number, index, self.difficulty,
+                                       len(self.round.word), self.round.max_errors)
+        return [f"ROUND {len(self.round.word)} {self.round.max_errors} {self._pattern()}"]
+
+    def _pattern(self):
+        """Palavra mascarada vinda do cache de renderização compartilhado"""
+        state = self.round
+        return Display.render_cache.pattern(state.word, state.correct_mask)
+
+    def _require_round(self):
+        if self.round is None or self.round.is_over:
+            raise ValueError("Nenhuma rodada em andamento (use NEW)")
+        return self.round
+
+    def _guess(self, argument):
+        state = self._require_round()
+        guess = validate_guess(argument.lower(), state.used_letters)
+        hit = state.apply_guess(guess)
+        events = self.shared.events
+        events.guess(self.session_id, self.round_number, guess, hit, state.errors)
+        lines = [f"{'HIT' if hit else 'MISS'} {self._pattern()} {state.errors}/{state.max_errors}"]
+
+        if state.is_won:
+            score = state.score(self.round_difficulty)
+            self.player.add_win(score, state.errors, state.hints_used)
+            self._end_round(True, score)
+            lines.append(f"WIN {state.word} {score}")
+        elif state.is_lost:
+            self.player.add_loss(state.errors, state.hints_used)
+            self._end_round(False, 0)
+            lines.append(f"LOSE {state.word}")
+        return lines
+
+    def abandon(self):
+        """Encerra a rodada em andamento como derrota (True se havia uma)"""
+        state = self.round
+        if state is None or state.is_over:
+            return False
+        self.player.add_loss(state.errors, state.hints_used)
+        self._end_round(False, 0)
+        self.round = None
+        return True
+
+    def _end_round(self, won, score):
+        state = self.round
+        self.shared.record_round(self.player.name, won, score, state.errors, state.hints_used)
+        # Placar por rodada: cada resultado vale só para a dificuldade e o período em que saiu
+        self.shared.record_score(self.player.name, score, self.round_difficulty.name)
+        self.shared.events.round_end(self.session_id, self.round_number, won, score, state.errors,
+                                     state.hints_used, (time.monotonic() - self._started) * 1000)
+
+    def _hint(self, argument):
+        state = self._require_round()
+        if state.hints_left <= 0:
+            raise ValueError("Você já usou todas as dicas disponíveis!")
+        letter = state.take_hint(self.random.stream("dicas"))
+        if letter is None:
+            raise ValueError("Não há dicas disponíveis para esta palavra!")
+        self.shared.events.hint(self.session_id, self.round_number, letter)
+        return [f"HINT {letter} {state.hints_left}"]
+
+    def _stats(self, argument):
+        player = self.player
+        return [f"STATS score={player.score} games={player.games_played} "
+                f"won={player.games_won} win_rate={player.win_rate:.1f}"]
+
+    def _top(self, argument):
+        scores = self.shared.top_scores(10, argument.lower() or "all")
+        lines = [f"TOP {len(scores)}"]
+        for position, entry in enumerate(scores, 1):
+            lines.append(f"{position} {entry.get('player', '?')} {entry.get('score', 0)}")
+        return lines
+
+    def _quit(self, argument):
+        self.abandon()
+        self.closed = True
+        return ["BYE"]
+
+    COMMANDS = {
+        "NAME": _name,
+        "DIFF": _difficulty,
+        "NEW": _new_round,
+        "GUESS": _guess,
+        "HINT": _hint,
+        "STATS": _stats,
+        "TOP": _top,
+        "QUIT": _quit,
+    }
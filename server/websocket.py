@@ -0,0 +1,35 @@
+import asyncio
+from server.session import GameSession
+
+try:
+    import websockets
+except ImportError:  # dependência opcional
+    websockets = None
+
+
+async def serve_websocket(shared, host="127.0.0.1", port=4001):
+    """Adaptador WebSocket: cada mensagem de texto é uma linha do protocolo
+
+    Requer o pacote opcional 'websockets' (pip install websockets).
+    """
+    if websockets is None:
+        raise ImportError("Modo WebSocket requer o pacote 'websockets' (pip install websockets)")
+
+    async def handler(websocket, *args):
+        session = GameSession(shared)
+        try:
+            await websocket.send("HELLO forca 1")
+            async for message in websocket:
+                if isinstance(message, bytes):
+                    message = message.decode('utf-8', 'replace')
+                lines = session.handle(message)
+                if lines:
+                    await websocket.send("\n".join(lines))
+                if session.closed:
+                    break
+        finally:
+            # Conexão encerrada no meio da rodada: derrota, como no TCP
+            session.abandon()
+
+    async with websockets.serve(handler, host, port, max_size=4096):
+        await asyncio.Future()  # atende até o loop ser cancelado
@@ -0,0 +1,78 @@
+import multiprocessing
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from game.difficulty import Difficulty
+from game.events import (COMMONS, FILE_HEADER, LENGTH, MAGIC, PAYLOADS, ROUND_END, EventLog,
+                         read_events, summarize)
+
+
+def _write_events(path, barrier, count):
+    barrier.wait()
+    log = EventLog(path)
+    session = log.new_session()
+    for round_number in range(count):
+        log.round_start(session, round_number, round_number, Difficulty.NORMAL, 5, 6)
+    log.close()
+
+
+class EventLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "eventos.log"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_concurrent_writers_share_one_header(self):
+        writers, count = 4, 200
+        barrier = multiprocessing.Barrier(writers)
+        processes = [multiprocessing.Process(target=_write_events, args=(self.path, barrier, count))
+                     for _ in range(writers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+        self.assertEqual(sum(1 for _ in read_events(self.path)), writers * count)
+
+    def test_close_returns_when_writer_thread_died(self):
+        log = EventLog(self.path, max_pending=4)
+        # Encerra a thread de gravação e enche a fila: put(None) bloquearia para sempre
+        log._queue.put(None)
+        log._thread.join()
+        for round_number in range(10):
+            log.round_start(1, round_number, round_number, Difficulty.EASY, 4, 8)
+
+        started = time.monotonic()
+        log.close(timeout=0.2)
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(log.dropped, 10)
+
+    def test_session_ids_do_not_wrap(self):
+        log = EventLog(self.path)
+        sessions = [log.new_session() for _ in range(9000)]
+        for session in sessions[-3:]:
+            log.round_start(session, 1, 7, Difficulty.HARD, 6, 4)
+            log.round_end(session, 1, True, 100, 0, 0, 1000)
+        log.close()
+        self.assertEqual(len(set(sessions)), len(sessions))
+        self.assertIn("HARD: 3 rodadas", summarize(self.path))
+
+    def test_old_version_log_is_kept_aside(self):
+        body = COMMONS[1].pack(ROUND_END, 5, 1, 0) + PAYLOADS[ROUND_END].pack(1, 100, 0, 0, 1000)
+        self.path.write_bytes(FILE_HEADER.pack(MAGIC, 1) + LENGTH.pack(len(body)) + body)
+
+        log = EventLog(self.path)
+        log.round_end(log.new_session(), 1, False, 0, 6, 0, 500)
+        log.close()
+
+        old = [event.session for event in read_events(f"{self.path}.v1")]
+        self.assertEqual(old, [5])
+        self.assertEqual(len(list(read_events(self.path))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import mmap
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from game.difficulty import Difficulty
+from game.hot_reload import DictionaryReloader, index_words
+from game.random_service import RandomService
+from utils.word_store import WordStore
+
+
+class RewriteWhilePlayingTest(unittest.TestCase):
+    """palavras.txt reescrito no lugar enquanto uma rodada é sorteada"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "palavras.txt"
+        rng = random.Random(1)
+        self.words = ["".join(rng.choice("abcdefghij") for _ in range(rng.randint(3, 15)))
+                      for _ in range(20000)]
+        self.path.write_text("\n".join(self.words) + "\n", encoding="utf-8")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def rewrite(self, text):
+        # Mesmo inode: truncar e gravar, como um editor que salva no lugar
+        with open(self.path, "r+b") as file:
+            file.truncate(0)
+            file.write(text.encode("utf-8"))
+
+    def test_pick_after_truncate_reads_old_words(self):
+        store = WordStore(self.path, private=True)
+        index = index_words(store)
+        self.rewrite("gato\n")
+
+        service = RandomService(2)
+        for difficulty in Difficulty:
+            for _ in range(200):
+                position = service.next_word(index, difficulty)
+                if position is not None:
+                    self.assertEqual(store[position], self.words[position])
+        self.assertEqual(store[len(store) - 1], self.words[-1])
+
+    def test_reloader_swaps_after_rewrite(self):
+        store = WordStore(self.path, private=True)
+        reloader = DictionaryReloader(SimpleNamespace(filepath=self.path, filename=self.path.name),
+                                      store, index_words(store))
+        self.rewrite("gato\ncachorro\n")
+        old = reloader.current
+        self.assertEqual(old.words[len(old.words) - 1], self.words[-1])
+
+        current = reloader.rebuild()
+        self.assertIsNone(reloader.last_error)
+        self.assertTrue(current.full)
+        self.assertEqual(list(current.words), ["gato", "cachorro"])
+        self.assertTrue(current.words.private)
+        self.assertEqual(old.words[0], self.words[0])
+        reloader.close()
+
+    def test_default_store_maps_the_file(self):
+        with WordStore(self.path) as store:
+            self.assertIsInstance(store._data, mmap.mmap)
+            self.assertEqual(store[len(store) - 1], self.words[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
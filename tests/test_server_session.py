@@ -0,0 +1,143 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from game.difficulty import Difficulty
+from game.events import NullEventLog
+from game.hot_reload import index_words
+from game.random_service import RandomService
+from server.app import SharedGame
+from server.session import GameSession
+from utils.word_store import WordStore
+
+
+class _Shared:
+    """Recursos mínimos de um servidor, sem placar nem banco em data/"""
+
+    session_random = SharedGame.session_random
+
+    def __init__(self, words, seed):
+        self.words = words
+        self.word_index = index_words(words)
+        self.events = NullEventLog()
+        self.random = RandomService(seed)
+        self.sessions = 0
+        self.rounds = []
+        self.scores = []
+
+    def refresh_dictionary(self):
+        pass
+
+    def record_round(self, *args):
+        self.rounds.append(args)
+
+    def record_score(self, *args):
+        self.scores.append(args)
+
+
+class _DictionaryTest(unittest.TestCase):
+    """Dicionário temporário de 5000 palavras para as sessões"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = Path(self.directory.name) / "palavras.txt"
+        rng = random.Random(1)
+        words = {"".join(rng.choice("abcdefghijlmnoprstuv") for _ in range(rng.randint(3, 14)))
+                 for _ in range(5000)}
+        path.write_text("\n".join(sorted(words)) + "\n", encoding="utf-8")
+        self.store = WordStore(path)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+
+class SeededServerTest(_DictionaryTest):
+    """Mesma semente do servidor, mesmas palavras em cada sessão"""
+
+    def deal(self, seed, sessions=3, rounds=20):
+        shared = _Shared(self.store, seed)
+        dealt = []
+        for _ in range(sessions):
+            session = GameSession(shared)
+            words = []
+            for difficulty in "1234":
+                session.handle(f"DIFF {difficulty}")
+                for _ in range(rounds):
+                    session.handle("NEW")
+                    words.append(session.round.word)
+                    words.append(session.handle("HINT")[0])
+            dealt.append(words)
+        return dealt
+
+    def test_same_seed_deals_same_words(self):
+        first = self.deal(42)
+        self.assertEqual(first, self.deal(42))
+        # Sessões do mesmo servidor não repetem a sequência umas das outras
+        self.assertNotEqual(first[0], first[1])
+        self.assertNotEqual(first, self.deal(43))
+
+
+class AbandonedRoundTest(_DictionaryTest):
+    """Rodada abandonada conta como derrota"""
+
+    def test_new_during_round_records_loss(self):
+        shared = _Shared(self.store, 1)
+        session = GameSession(shared)
+        session.handle("NAME Ana")
+        session.handle("NEW")
+        session.handle("HINT")
+        session.handle("NEW")
+
+        self.assertEqual(session.player.games_played, 1)
+        self.assertEqual(session.player.games_won, 0)
+        self.assertEqual(session.player.total_hints_used, 1)
+        self.assertEqual(shared.rounds, [("Ana", False, 0, 0, 1)])
+        self.assertEqual(shared.scores, [("Ana", 0, "NORMAL")])
+
+    def test_quit_and_disconnect_record_loss_once(self):
+        shared = _Shared(self.store, 1)
+        session = GameSession(shared)
+        session.handle("NEW")
+        self.assertEqual(session.handle("QUIT"), ["BYE"])
+        session.abandon()  # o servidor chama de novo ao fechar a conexão
+        self.assertEqual(session.player.games_played, 1)
+        self.assertEqual(len(shared.rounds), 1)
+
+    def test_finished_round_is_not_counted_again(self):
+        shared = _Shared(self.store, 1)
+        session = GameSession(shared)
+        session.handle("NEW")
+        for letter in "abcdefghijlmnoprstuv":
+            if session.round.is_over:
+                break
+            session.handle(f"GUESS {letter}")
+        session.handle("NEW")
+        self.assertEqual(session.player.games_played, 1)
+        self.assertEqual(len(shared.rounds), 1)
+
+
+class DifficultyChangeTest(_DictionaryTest):
+    """DIFF no meio da rodada não muda a pontuação dela"""
+
+    def test_round_scored_at_its_starting_difficulty(self):
+        shared = _Shared(self.store, 1)
+        session = GameSession(shared)
+        session.handle("NAME Ana")
+        session.handle("DIFF 1")
+        session.handle("NEW")
+        word = session.round.word
+        self.assertEqual(session.handle("DIFF 4"), ["OK EXPERT"])
+        for letter in dict.fromkeys(word):
+            lines = session.handle(f"GUESS {letter}")
+
+        score = session.round.score(Difficulty.EASY)
+        self.assertEqual(lines[-1], f"WIN {word} {score}")
+        self.assertEqual(shared.scores, [("Ana", score, "EASY")])
+        # A próxima rodada já é no nível novo
+        session.handle("NEW")
+        self.assertEqual(session.round.max_errors, Difficulty.EXPERT.max_errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
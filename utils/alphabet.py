@@ -0,0 +1,73 @@
+"""Alfabeto do jogo e máscaras de bits de letras"""
+
+# Letras do português, incluindo as acentuadas, cada uma com um bit fixo.
+# A ordem é parte do formato compilado do dicionário: só acrescente no final.
+ALPHABET = "abcdefghijklmnopqrstuvwxyzáàâãéêíóôõúüç"
+
+LETTER_BITS = {letter: 1 << position for position, letter in enumerate(ALPHABET)}
+
+# Bit reservado para letras fora do alfabeto (ex.: 'ñ')
+OTHER_BIT = 1 << 63
+
+# Variantes acentuadas e a letra base: chutar 'a' revela á, à, â e ã
+ACCENT_FOLDS = {
+    "á": "a", "à": "a", "â": "a", "ã": "a", "é": "e", "ê": "e", "í": "i",
+    "ó": "o", "ô": "o", "õ": "o", "ú": "u", "ü": "u", "ç": "c",
+}
+FOLD_TABLE = str.maketrans(ACCENT_FOLDS)
+BASE_LETTERS = "".join(letter for letter in ALPHABET if letter not in ACCENT_FOLDS)
+
+# Para cada letra, os bits dela e de todas as variantes da mesma base
+GROUP_BITS = {}
+for _letter in ALPHABET:
+    _base = ACCENT_FOLDS.get(_letter, _letter)
+    GROUP_BITS[_base] = GROUP_BITS.get(_base, 0) | LETTER_BITS[_letter]
+for _letter, _base in ACCENT_FOLDS.items():
+    GROUP_BITS[_letter] = GROUP_BITS[_base]
+del _letter, _base
+
+ACCENT_BITS = sum(LETTER_BITS[letter] for letter in ACCENT_FOLDS)
+_ACCENT_TO_BASE = [(LETTER_BITS[letter], LETTER_BITS[base]) for letter, base in ACCENT_FOLDS.items()]
+
+
+def letter_bit(letter):
+    """Bit correspondente a uma letra"""
+    return LETTER_BITS.get(letter, OTHER_BIT)
+
+
+def letter_mask(word):
+    """Máscara com um bit ligado para cada letra distinta da palavra"""
+    mask = 0
+    for letter in set(word):
+        mask |= LETTER_BITS.get(letter, OTHER_BIT)
+    return mask
+
+
+def fold(text):
+    """Texto sem acentos (só as variantes do português: á -> a, ç -> c...)"""
+    return text.translate(FOLD_TABLE)
+
+
+def fold_letter(letter):
+    """Letra base de uma variante acentuada"""
+    return ACCENT_FOLDS.get(letter, letter)
+
+
+def fold_mask(mask):
+    """Máscara com os bits acentuados trocados pelos da letra base"""
+    if not mask & ACCENT_BITS:
+        return mask
+    for accent_bit, base_bit in _ACCENT_TO_BASE:
+        if mask & accent_bit:
+            mask = (mask & ~accent_bit) | base_bit
+    return mask
+
+
+def mask_letters(mask):
+    """Letras do alfabeto presentes em uma máscara"""
+    return {letter for letter, bit in LETTER_BITS.items() if mask & bit}
+
+
+def mask_size(mask):
+    """Número de bits ligados na máscara"""
+    return bin(mask).count("1")
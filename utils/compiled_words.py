@@ -0,0 +1,173 @@
+import mmap
+import os
+import struct
+from array import array
+from utils.alphabet import letter_mask
+from utils.word_store import WordStore
+
+# Formato compilado (little-endian, seções alinhadas em 8 bytes):
+#   cabeçalho   -> mágica, versão, nº de palavras, nº de baldes, tamanho do blob
+#   diretório   -> por balde: tamanho da palavra, primeira palavra, quantidade
+#   offsets     -> (nº de palavras + 1) x uint64, início de cada palavra no blob
+#   máscaras    -> nº de palavras x uint64, bits das letras de cada palavra
+#   blob        -> palavras em UTF-8 concatenadas, ordenadas por tamanho
+MAGIC = b"FORCABIN"
+VERSION = 1
+HEADER = struct.Struct("<8sHxxIIQ4x")
+BUCKET = struct.Struct("<HxxII")
+
+
+def _align(size):
+    return (size + 7) & ~7
+
+
+def encode_words(store):
+    """Gera a imagem binária compilada de um WordStore"""
+    # Ordena por tamanho para que cada balde seja uma faixa contígua
+    order = sorted(range(len(store)), key=store.lengths.__getitem__)
+
+    buckets = []
+    offsets = array('Q', [0])
+    masks = array('Q')
+    blob = bytearray()
+    for index in order:
+        word = store[index]
+        length = store.lengths[index]
+        if buckets and buckets[-1][0] == length:
+            buckets[-1][2] += 1
+        else:
+            buckets.append([length, len(masks), 1])
+
+        blob += word.encode('utf-8')
+        offsets.append(len(blob))
+        masks.append(letter_mask(word))
+
+    directory = b"".join(BUCKET.pack(*bucket) for bucket in buckets)
+    return b"".join((
+        HEADER.pack(MAGIC, VERSION, len(masks), len(buckets), len(blob)),
+        directory,
+        b"\0" * (_align(len(directory)) - len(directory)),
+        offsets.tobytes(),
+        masks.tobytes(),
+        blob,
+    ))
+
+
+def compile_words(source, output):
+    """Compila um arquivo de palavras em texto para o formato binário
+
+    Retorna o número de palavras compiladas.
+    """
+    with WordStore(source) as store:
+        image = encode_words(store)
+        count = len(store)
+
+    # Escrita atômica: outros processos nunca veem um arquivo pela metade
+    temp_path = f"{output}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(image)
+    os.replace(temp_path, output)
+
+    return count
+
+
+class PackedWords:
+    """Leitura de uma imagem compilada em qualquer buffer (mmap, memória compartilhada)
+
+    Só o cabeçalho e o diretório de baldes são lidos ao abrir; offsets,
+    máscaras e palavras são acessados direto no buffer.
+    """
+
+    def _parse(self, buffer):
+        """Lê cabeçalho e diretório e cria as visões sobre o buffer"""
+        self._buffer = buffer
+        magic, version, count, bucket_count, blob_size = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Dicionário compilado inválido: {self.filepath}")
+
+        position = HEADER.size
+        self.buckets = {}
+        for _ in range(bucket_count):
+            length, first, total = BUCKET.unpack_from(buffer, position)
+            self.buckets[length] = range(first, first + total)
+            position += BUCKET.size
+        position = HEADER.size + _align(BUCKET.size * bucket_count)
+
+        view = memoryview(buffer)
+        offsets_end = position + 8 * (count + 1)
+        masks_end = offsets_end + 8 * count
+        if len(view) < masks_end + blob_size:
+            view.release()
+            raise ValueError(f"Dicionário compilado truncado: {self.filepath}")
+        self.offsets = view[position:offsets_end].cast('Q')
+        self.masks = view[offsets_end:masks_end].cast('Q')
+        self._blob = view[masks_end:masks_end + blob_size]
+        view.release()
+
+    def _release_views(self):
+        for name in ("offsets", "masks", "_blob"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._buffer = None
+
+    def length_buckets(self):
+        """Faixas de índices de palavras por tamanho"""
+        return self.buckets
+
+    def mask(self, index):
+        """Máscara de letras pré-calculada da palavra"""
+        return self.masks[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.masks)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return str(self._blob[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class CompiledWordStore(PackedWords):
+    """Dicionário no formato compilado, mapeado em memória
+
+    As páginas do mmap ficam no cache do sistema, compartilhado entre
+    processos que abrem o mesmo arquivo.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.invalid_count = 0
+        self._map = None
+        self._file = open(filepath, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._parse(self._map)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Libera as visões, o mapeamento e o arquivo"""
+        self._release_views()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __repr__(self):
+        return f"CompiledWordStore('{self.filepath}', words={len(self)})"
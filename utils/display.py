@@ -1,6 +1,9 @@
-import os
 import sys
 from typing import List, Set
+from utils.alphabet import ALPHABET
+from utils.renderer import FrameRenderer
+from utils.render_cache import RenderCache
+from utils.profiler import timed
 
 class Colors:
     """Códigos ANSI para cores no terminal"""
@@ -102,10 +105,28 @@ class Display:
         """
     ]
     
+    # Estágios e glifos coloridos pré-renderizados uma única vez
+    STAGE_LINES = [stage.split("\n") for stage in STAGES]
+    REVEALED_GLYPHS = {letter: f"{Colors.GREEN}{letter.upper()}{Colors.RESET}" for letter in ALPHABET}
+    USED_GLYPHS = {letter: f"{Colors.YELLOW}{letter.upper()}{Colors.RESET}" for letter in ALPHABET}
+    HIDDEN_GLYPH = f"{Colors.GRAY}_{Colors.RESET}"
+    MESSAGE_COLORS = {
+        "error": Colors.RED,
+        "success": Colors.GREEN,
+        "warning": Colors.YELLOW,
+        "info": Colors.BLUE,
+        "hint": Colors.MAGENTA,
+        "menu": Colors.CYAN
+    }
+    
+    # Renderizador de quadros (redesenha só as linhas alteradas em um TTY)
+    renderer = FrameRenderer()
+    _status = []
+    
     @classmethod
     def clear_screen(cls):
-        """Limpa a tela de forma cross-platform"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Limpa a tela de forma cross-platform (ANSI, sem processo externo)"""
+        cls.renderer.clear()
     
     @classmethod
     def show_welcome(cls):
@@ -121,34 +142,52 @@ class Display:
         print(f"  • {Colors.GREEN}Estatísticas detalhadas{Colors.RESET}")
         print(f"{Colors.MAGENTA}{'='*60}{Colors.RESET}\n")
     
+    @classmethod
+    def title_lines(cls, title: str) -> List[str]:
+        """Linhas de um título formatado"""
+        return ["", f"{Colors.CYAN}{Colors.BOLD}=== {title} ==={Colors.RESET}", ""]
+    
     @classmethod
     def show_title(cls, title: str):
         """Exibe um título formatado"""
-        print(f"\n{Colors.CYAN}{Colors.BOLD}=== {title} ==={Colors.RESET}\n")
+        print("\n".join(cls.title_lines(title)))
+    
+    @classmethod
+    def message_line(cls, message: str, msg_type: str = "info") -> str:
+        """Mensagem colorida baseada no tipo"""
+        color = cls.MESSAGE_COLORS.get(msg_type, Colors.WHITE)
+        return f"{color}{message}{Colors.RESET}"
     
     @classmethod
     def show_message(cls, message: str, msg_type: str = "info"):
         """Exibe uma mensagem colorida baseada no tipo"""
-        colors = {
-            "error": Colors.RED,
-            "success": Colors.GREEN,
-            "warning": Colors.YELLOW,
-            "info": Colors.BLUE,
-            "hint": Colors.MAGENTA,
-            "menu": Colors.CYAN
-        }
-        color = colors.get(msg_type, Colors.WHITE)
-        print(f"{color}{message}{Colors.RESET}")
+        print(cls.message_line(message, msg_type))
     
     @classmethod
-    def show_game_state(cls, word: str, correct_letters: Set[str], used_letters: Set[str], 
-                       errors: int, max_errors: int):
-        """Exibe o estado completo do jogo"""
-        cls.show_hangman(errors)
-        cls.show_word(word, correct_letters)
-        cls.show_used_letters(used_letters)
-        
-        # Barra de progresso
+    def show_status(cls, message: str, msg_type: str = "info"):
+        """Mensagem da rodada: vai para o próximo quadro em um TTY,
+        ou é exibida na hora em saída de texto puro"""
+        if cls.renderer.is_tty:
+            cls._status.append(cls.message_line(message, msg_type))
+        else:
+            cls.show_message(message, msg_type)
+    
+    @classmethod
+    def game_state_lines(cls, word: str, correct_letters: Set[str], used_letters: Set[str],
+                         errors: int, max_errors: int) -> List[str]:
+        """Linhas do estado completo do jogo"""
+        hangman, status = cls.gauge_lines(errors, max_errors)
+        lines = hangman
+        lines.append(cls.word_line(word, correct_letters))
+        lines.append("")
+        if used_letters:
+            lines.append(cls.used_letters_line(used_letters))
+        lines.extend(status)
+        return lines
+    
+    @classmethod
+    def gauge_lines(cls, errors: int, max_errors: int):
+        """Linhas da forca e da barra de progresso para (erros, máximo)"""
         progress = errors / max_errors
         if progress < 0.33:
             color = Colors.GREEN
@@ -158,8 +197,40 @@ class Display:
             color = Colors.RED
             
         bar = "█" * int(progress * 20) + "░" * (20 - int(progress * 20))
-        print(f"\nErros: {color}{errors}/{max_errors}{Colors.RESET}")
-        print(f"Progresso: [{color}{bar}{Colors.RESET}]")
+        status = [
+            "",
+            f"Erros: {color}{errors}/{max_errors}{Colors.RESET}",
+            f"Progresso: [{color}{bar}{Colors.RESET}]"
+        ]
+        return cls.hangman_lines(errors), status
+    
+    @classmethod
+    @timed("show_game_state")
+    def show_game_state(cls, word: str, correct_letters: Set[str], used_letters: Set[str], 
+                       errors: int, max_errors: int):
+        """Exibe o estado completo do jogo"""
+        print("\n".join(cls.game_state_lines(word, correct_letters, used_letters, errors, max_errors)))
+    
+    @classmethod
+    @timed("render_round")
+    def render_round(cls, header: List[str], state):
+        """Desenha o quadro da rodada (cabeçalho, estado e mensagens pendentes)
+
+        As partes do estado vêm do render_cache, indexadas pelas máscaras
+        de letras do RoundState.
+        """
+        lines = header + cls.render_cache.state_lines(state.word, state.correct_mask, state.used_mask,
+                                                      state.errors, state.max_errors)
+        if cls._status:
+            lines.append("")
+            lines.extend(cls._status)
+            cls._status = []
+        cls.renderer.render(lines)
+    
+    @classmethod
+    def hangman_lines(cls, errors: int) -> List[str]:
+        """Linhas do estágio atual da forca"""
+        return list(cls.STAGE_LINES[min(errors, len(cls.STAGES) - 1)])
     
     @classmethod
     def show_hangman(cls, errors: int):
@@ -167,26 +238,37 @@ class Display:
         stage = min(errors, len(cls.STAGES) - 1)
         print(cls.STAGES[stage])
     
+    @classmethod
+    def word_line(cls, word: str, correct_letters: Set[str]) -> str:
+        """Palavra com letras descobertas coloridas"""
+        revealed = cls.REVEALED_GLYPHS
+        hidden = cls.HIDDEN_GLYPH
+        display_word = [
+            (revealed.get(letter) or f"{Colors.GREEN}{letter.upper()}{Colors.RESET}")
+            if letter in correct_letters else hidden
+            for letter in word
+        ]
+        return f"{Colors.BOLD}Palavra:{Colors.RESET} {' '.join(display_word)}"
+    
     @classmethod
     def show_word(cls, word: str, correct_letters: Set[str]):
         """Exibe a palavra com letras descobertas coloridas"""
-        display_word = []
-        for letter in word:
-            if letter in correct_letters:
-                display_word.append(f"{Colors.GREEN}{letter.upper()}{Colors.RESET}")
-            else:
-                display_word.append(f"{Colors.GRAY}_{Colors.RESET}")
-        
-        print(f"{Colors.BOLD}Palavra:{Colors.RESET} {' '.join(display_word)}")
+        print(cls.word_line(word, correct_letters))
         print()
     
+    @classmethod
+    def used_letters_line(cls, used_letters: Set[str]) -> str:
+        """Letras já utilizadas, em ordem"""
+        used = cls.USED_GLYPHS
+        colored_letters = [used.get(letter) or f"{Colors.YELLOW}{letter.upper()}{Colors.RESET}"
+                           for letter in sorted(used_letters)]
+        return f"{Colors.BOLD}Letras usadas:{Colors.RESET} {', '.join(colored_letters)}"
+    
     @classmethod
     def show_used_letters(cls, used_letters: Set[str]):
         """Exibe letras já utilizadas"""
         if used_letters:
-            sorted_letters = sorted(used_letters)
-            colored_letters = [f"{Colors.YELLOW}{letter.upper()}{Colors.RESET}" for letter in sorted_letters]
-            print(f"{Colors.BOLD}Letras usadas:{Colors.RESET} {', '.join(colored_letters)}")
+            print(cls.used_letters_line(used_letters))
     
     @classmethod
     def show_victory(cls, word: str, score: int):
@@ -206,11 +288,12 @@ class Display:
         print(f"{Colors.RED}{'💀'*20}{Colors.RESET}")
     
     @classmethod
-    def show_leaderboard(cls, scores: List[str]):
-        """Exibe o placar formatado"""
-        cls.show_title("PLACAR GERAL - TOP 10")
-        for i, score in enumerate(scores[-10:], 1):
-            print(f"{Colors.YELLOW}{i:2d}.{Colors.RESET} {score}")
+    def show_leaderboard(cls, scores: List[dict], title: str = "PLACAR GERAL - TOP 10"):
+        """Exibe o placar formatado (scores já ordenados do maior para o menor)"""
+        cls.show_title(title)
+        for i, entry in enumerate(scores[:10], 1):
+            print(f"{Colors.YELLOW}{i:2d}.{Colors.RESET} {entry.get('player', '?'):<20} "
+                  f"{Colors.BOLD}{entry.get('score', 0):>6}{Colors.RESET} pts  {entry.get('date', '')}")
     
     @classmethod
     def get_input(cls, prompt: str, required: bool = False):
@@ -236,4 +319,8 @@ class Display:
             elif response in ['n', 'não', 'nao', 'no']:
                 return False
             else:
-                cls.show_message("Por favor, responda com 's' ou 'n'", "error")
\ No newline at end of file
+                cls.show_message("Por favor, responda com 's' ou 'n'", "error")
+
+
+# Cache de renderização compartilhado pelo terminal e pelos front-ends de rede
+Display.render_cache = RenderCache(Display)
\ No newline at end of file
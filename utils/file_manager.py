@@ -1,7 +1,12 @@
 import os
-import json
 from pathlib import Path
 from datetime import datetime
+from utils.word_store import WordStore
+from utils.profiler import timed
+
+# Memória compartilhada (multiprocessing), dicionário compilado e placar
+# são importados só quando usados: a maioria das execuções não precisa de
+# todos, e o tempo até a tela de boas-vindas conta
 
 class FileManager:
     """Gerencia operações de arquivo com tratamento robusto de erros"""
@@ -10,6 +15,8 @@ class FileManager:
         self.filename = filename
         self.data_dir = Path(__file__).parent.parent / "data"
         self.filepath = self.data_dir / filename
+        self.compiled_path = self.filepath.with_suffix(".bin")
+        self._scoreboard = None
         
         # Garante que o diretório data existe
         self._ensure_data_directory()
@@ -23,73 +30,100 @@ class FileManager:
         except Exception as e:
             raise Exception(f"Erro ao criar diretório: {e}")
     
-    def read_words(self) -> list:
-        """Lê palavras do arquivo com tratamento robusto"""
+    def _compiled_is_fresh(self) -> bool:
+        """Indica se o dicionário compilado existe e é mais novo que o texto"""
+        if not self.compiled_path.exists():
+            return False
+        if not self.filepath.exists():
+            return True
+        return self.compiled_path.stat().st_mtime_ns >= self.filepath.stat().st_mtime_ns
+    
+    @timed("read_words")
+    def read_words(self, shared_name=None, private=False):
+        """Carrega as palavras, preferindo o dicionário compilado quando atualizado
+        
+        Com shared_name, conecta ao dicionário já carregado em memória
+        compartilhada por um processo lançador. private copia o texto em vez
+        de mapeá-lo (recarga a quente; ver WordStore).
+        """
         try:
+            if shared_name:
+                from utils.shared_dictionary import SharedWordStore
+                return SharedWordStore.attach(shared_name)
+            
+            if self._compiled_is_fresh():
+                from utils.compiled_words import CompiledWordStore
+                return CompiledWordStore(self.compiled_path)
+            
             if not self.filepath.exists():
                 raise FileNotFoundError(f"Arquivo de palavras não encontrado: {self.filename}")
             
-            with open(self.filepath, 'r', encoding='utf-8') as file:
-                words = [line.strip().lower() for line in file if line.strip()]
+            # Validação e tabela de offsets em uma única passada pelo arquivo
+            words = WordStore(self.filepath, private)
             
-            if not words:
+            if not len(words) and not words.invalid_count:
+                words.close()
                 raise ValueError(f"Arquivo de palavras vazio: {self.filename}")
             
-            # Filtra palavras válidas
-            valid_words = [word for word in words if word.isalpha()]
-            
-            if len(valid_words) != len(words):
-                print(f"⚠️  Aviso: {len(words) - len(valid_words)} palavras inválidas removidas")
+            if words.invalid_count:
+                print(f"⚠️  Aviso: {words.invalid_count} palavras inválidas removidas")
             
-            return valid_words
+            return words
             
         except UnicodeDecodeError:
             raise UnicodeDecodeError("Erro de codificação no arquivo de palavras. Use UTF-8.")
         except Exception as e:
             raise Exception(f"Erro ao ler palavras: {e}")
     
-    def save_score(self, player_name: str, score: int):
-        """Salva pontuação no arquivo de placar com timestamp"""
-        score_file = self.data_dir / "placar.json"
+    def compile_words(self) -> int:
+        """Gera o dicionário compilado (.bin) a partir do arquivo de texto"""
+        if not self.filepath.exists():
+            raise FileNotFoundError(f"Arquivo de palavras não encontrado: {self.filename}")
         
+        from utils.compiled_words import compile_words
         try:
-            scores = self.read_scores()
-            
-            # Adiciona nova pontuação
-            new_score = {
-                "player": player_name,
-                "score": score,
-                "timestamp": datetime.now().isoformat(),
-                "date": datetime.now().strftime("%d/%m/%Y %H:%M")
-            }
-            scores.append(new_score)
-            
-            # Ordena por score (decrescente)
-            scores.sort(key=lambda x: x["score"], reverse=True)
-            
-            # Mantém apenas top 100
-            scores = scores[:100]
-            
-            with open(score_file, 'w', encoding='utf-8') as file:
-                json.dump(scores, file, ensure_ascii=False, indent=2)
-                
+            return compile_words(self.filepath, self.compiled_path)
+        except Exception as e:
+            raise Exception(f"Erro ao compilar palavras: {e}")
+    
+    @property
+    def scoreboard(self):
+        """Placar compartilhado do diretório data (aberto sob demanda)"""
+        if self._scoreboard is None:
+            from utils.scoreboard import Scoreboard
+            self._scoreboard = Scoreboard(self.data_dir)
+        return self._scoreboard
+    
+    @timed("save_score")
+    def save_score(self, player_name: str, score: int, difficulty: str = None):
+        """Registra a pontuação no log do placar com timestamp"""
+        try:
+            self.scoreboard.add(player_name, score, difficulty)
         except Exception as e:
             print(f"⚠️  Aviso: Não foi possível salvar a pontuação: {e}")
     
     def read_scores(self) -> list:
-        """Lê o placar do arquivo JSON"""
-        score_file = self.data_dir / "placar.json"
-        
-        if not score_file.exists():
+        """Lê o top 100 do placar, ordenado por pontuação"""
+        try:
+            return self.scoreboard.top()
+        except Exception as e:
+            print(f"⚠️  Aviso: Não foi possível ler o placar: {e}")
             return []
-        
+    
+    def read_leaderboard(self, window: str = "all", difficulty: str = None, limit: int = 10) -> list:
+        """Ranking por jogador (janela "day", "week" ou "all"), sem reler o placar"""
         try:
-            with open(score_file, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            # Fallback para formato antigo ou cria novo
+            return self.scoreboard.ranking(window, difficulty, limit)
+        except Exception as e:
+            print(f"⚠️  Aviso: Não foi possível ler o placar: {e}")
             return []
     
+    def close(self):
+        """Fecha o placar, sincronizando registros pendentes"""
+        if self._scoreboard is not None:
+            self._scoreboard.close()
+            self._scoreboard = None
+    
     def backup_words(self):
         """Cria backup do arquivo de palavras"""
         try:
@@ -0,0 +1,151 @@
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Constantes do inotify (linux/inotify.h)
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT = struct.Struct("iIII")  # wd, mask, cookie, tamanho do nome
+
+
+def _inotify():
+    """Funções inotify da libc via ctypes, ou None fora do Linux"""
+    if not sys.platform.startswith("linux"):
+        return None
+    # Importado só ao iniciar o observador (ctypes.util traz o subprocess)
+    import ctypes
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class FileWatcher:
+    """Observa um arquivo em uma thread e chama callback() quando ele muda
+
+    No Linux usa inotify (via ctypes) no diretório do arquivo, o que
+    também pega substituições por rename; em outros sistemas, ou se o
+    inotify falhar, verifica tamanho/mtime/inode a cada interval segundos.
+    Mudanças seguidas são agrupadas: o callback só roda depois que o
+    arquivo fica debounce segundos sem mudar.
+    """
+
+    def __init__(self, path, callback, interval=1.0, debounce=0.3):
+        self.path = Path(path)
+        self.callback = callback
+        self.interval = interval
+        self.debounce = debounce
+        self.mode = None
+        self.changes = 0
+        self._signature = self._stat()
+        self._stop = threading.Event()
+        self._thread = None
+        self._fd = None
+
+    def _stat(self):
+        try:
+            info = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return info.st_ino, info.st_size, info.st_mtime_ns
+
+    def start(self):
+        self._fd = self._open_inotify()
+        self.mode = "inotify" if self._fd is not None else "polling"
+        self._thread = threading.Thread(target=self._run, name="observador", daemon=True)
+        self._thread.start()
+        return self
+
+    def _open_inotify(self):
+        libc = _inotify()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        directory = os.fsencode(self.path.parent)
+        if libc.inotify_add_watch(fd, directory, WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _inotify_touched(self, timeout):
+        """Espera eventos do inotify; True se algum for do arquivo observado"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        name = os.fsencode(self.path.name)
+        position = 0
+        touched = False
+        while position + EVENT.size <= len(data):
+            _, _, _, size = EVENT.unpack_from(data, position)
+            start = position + EVENT.size
+            if data[start:start + size].rstrip(b"\0") == name:
+                touched = True
+            position = start + size
+        return touched
+
+    def _run(self):
+        next_check = 0.0
+        while not self._stop.is_set():
+            if self._fd is not None:
+                # Eventos de outros arquivos do diretório (placar.log,
+                # eventos.log...) não levam ao stat; sem eventos do arquivo, ele
+                # roda a cada interval segundos (cobre eventos perdidos)
+                touched = self._inotify_touched(self.interval)
+                if not touched and time.monotonic() < next_check:
+                    continue
+            else:
+                self._stop.wait(self.interval)
+
+            next_check = time.monotonic() + self.interval
+            signature = self._stat()
+            if signature == self._signature or signature is None:
+                continue
+
+            # Espera o arquivo parar de mudar (escrita em várias partes)
+            while not self._stop.wait(self.debounce):
+                settled = self._stat()
+                if settled == signature:
+                    break
+                signature = settled
+            if self._stop.is_set():
+                break
+
+            self._signature = signature
+            self.changes += 1
+            try:
+                self.callback()
+            except Exception:
+                pass  # o callback registra os próprios erros; o observador continua
+
+    def stop(self):
+        """Encerra a thread e libera o inotify"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __repr__(self):
+        return f"FileWatcher('{self.path}', mode={self.mode})"
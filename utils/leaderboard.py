@@ -0,0 +1,140 @@
+import heapq
+from datetime import datetime
+
+ALL_TIME = "all"
+DAY = "day"
+WEEK = "week"
+WINDOWS = (ALL_TIME, DAY, WEEK)
+
+
+def window_key(window, moment):
+    """Período ao qual o instante pertence (dia, semana ISO ou sempre o mesmo)"""
+    if window == DAY:
+        return moment.date()
+    if window == WEEK:
+        return tuple(moment.isocalendar())[:2]
+    return None
+
+
+def record_time(record):
+    try:
+        return datetime.fromisoformat(record.get("timestamp", ""))
+    except (TypeError, ValueError):
+        return datetime.min
+
+
+class TopBoard:
+    """Top-K com no máximo uma entrada por jogador (o melhor resultado)
+
+    Itens são tuplas (pontos, -sequência, registro), então empates mantêm
+    o resultado mais antigo. O heap mínimo guarda o corte do top-K; uma
+    melhora de um jogador já presente deixa o item antigo no heap como
+    obsoleto, descartado quando chega ao topo (remoção preguiçosa). Cada
+    oferta custa O(log K) amortizado.
+    """
+
+    __slots__ = ("k", "period", "_heap", "_best")
+
+    def __init__(self, k, period=None):
+        self.k = k
+        self.period = period
+        self._heap = []
+        self._best = {}
+
+    @staticmethod
+    def _key(item):
+        return str(item[2].get("player", "")).lower()
+
+    def _is_current(self, item):
+        return self._best.get(self._key(item)) is item
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+
+    def offer(self, item):
+        """Considera um resultado; retorna True se ele entrou no top"""
+        key = self._key(item)
+        current = self._best.get(key)
+        if current is not None and current >= item:
+            return False
+        if current is None and len(self._best) >= self.k:
+            self._drop_stale()
+            if item <= self._heap[0]:
+                return False
+            evicted = heapq.heappop(self._heap)
+            del self._best[self._key(evicted)]
+
+        self._best[key] = item
+        heapq.heappush(self._heap, item)
+        if len(self._heap) > 2 * self.k:
+            # Muitos obsoletos acumulados: reconstrói só com os atuais
+            self._heap = list(self._best.values())
+            heapq.heapify(self._heap)
+        return True
+
+    def items(self):
+        """Itens atuais, do maior para o menor"""
+        return sorted(self._best.values(), reverse=True)
+
+    def __len__(self):
+        return len(self._best)
+
+
+class Leaderboard:
+    """Placares incrementais por janela de tempo e por dificuldade
+
+    Mantém um TopBoard para cada combinação de janela (dia, semana,
+    sempre) e dificuldade (None = geral). Cada resultado é oferecido a
+    seis quadros em O(log K) cada; consultas leem só a memória, sem tocar
+    no arquivo do placar. Quadros de dia/semana são trocados quando chega
+    um resultado de um novo período.
+    """
+
+    def __init__(self, top_k=100):
+        self.top_k = top_k
+        self._boards = {}
+
+    def _board(self, window, difficulty, period):
+        """Quadro atual da combinação; um período mais novo substitui o antigo"""
+        key = (window, difficulty)
+        board = self._boards.get(key)
+        if board is None or (window != ALL_TIME and period > board.period):
+            board = self._boards[key] = TopBoard(self.top_k, period)
+        return board
+
+    def add(self, item):
+        """Oferece um item (pontos, -sequência, registro) a todos os quadros"""
+        record = item[2]
+        moment = record_time(record)
+        difficulty = record.get("difficulty")
+        difficulties = (None,) if difficulty is None else (None, difficulty)
+        for window in WINDOWS:
+            period = window_key(window, moment)
+            for board_difficulty in difficulties:
+                board = self._board(window, board_difficulty, period)
+                if board.period == period:
+                    board.offer(item)
+
+    def top(self, window=ALL_TIME, difficulty=None, limit=10, now=None):
+        """Registros do quadro pedido, do maior para o menor"""
+        if window not in WINDOWS:
+            raise ValueError(f"Janela inválida: {window} (use {', '.join(WINDOWS)})")
+        board = self._boards.get((window, difficulty))
+        if board is None:
+            return []
+        if window != ALL_TIME and board.period != window_key(window, now or datetime.now()):
+            return []
+        return [record for _, _, record in board.items()[:limit]]
+
+    def items(self):
+        """Todos os itens presentes em algum quadro, sem repetição"""
+        unique = {}
+        for board in self._boards.values():
+            for item in board._best.values():
+                unique[item[1]] = item
+        return sorted(unique.values(), reverse=True)
+
+    def clear(self):
+        self._boards.clear()
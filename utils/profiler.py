@@ -0,0 +1,195 @@
+import time
+from bisect import bisect_left
+from functools import wraps
+
+# Limites dos baldes de latência, em milissegundos
+BUCKETS_MS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class Histogram:
+    """Histograma de latências em baldes fixos (contagem, soma e máximo)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def observe(self, ms):
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+        self.buckets[bisect_left(BUCKETS_MS, ms)] += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """Limite superior do balde que contém o percentil (aproximado)"""
+        if not self.count:
+            return 0.0
+        target = self.count * percent / 100
+        seen = 0
+        for position, amount in enumerate(self.buckets):
+            seen += amount
+            if seen >= target:
+                return min(BUCKETS_MS[position], self.max) if position < len(BUCKETS_MS) else self.max
+        return self.max
+
+
+class _Span:
+    """Mede o tempo de um bloco with e registra no histograma do profiler"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.observe(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """Instrumentação dos pontos quentes do jogo
+
+    Desligado por padrão: span() devolve um contexto vazio e as funções
+    marcadas com @timed só verificam a flag enabled. Ligado (--profile),
+    guarda histogramas de latência por etapa e contadores, que podem ser
+    impressos, exportados no formato texto do Prometheus ou complementados
+    por um cProfile do processo inteiro.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans = {}
+        self.counters = {}
+        self.gauges = {}
+        self._cprofile = None
+        self._started = None
+
+    def enable(self, cprofile=False):
+        """Liga a coleta (e o cProfile, se pedido)"""
+        self.enabled = True
+        self._started = time.perf_counter()
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def disable(self):
+        """Desliga a coleta, mantendo o que já foi medido"""
+        self.enabled = False
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    def span(self, name):
+        """Contexto que mede o bloco: with PROFILER.span("etapa"): ..."""
+        return _Span(self, name) if self.enabled else _NULL_SPAN
+
+    def observe(self, name, ms):
+        histogram = self.spans.get(name)
+        if histogram is None:
+            histogram = self.spans[name] = Histogram()
+        histogram.observe(ms)
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name, value):
+        if self.enabled:
+            self.gauges[name] = value
+
+    def summary(self):
+        """Tabela de etapas, contadores e medidores para o terminal"""
+        lines = ["📈 Perfil de execução"]
+        if self._started is not None:
+            lines.append(f"   Tempo total: {time.perf_counter() - self._started:.2f}s")
+        if self.spans:
+            lines.append(f"   {'etapa':<18}{'chamadas':>9}{'média ms':>10}{'p99 ms':>9}"
+                         f"{'máx ms':>9}{'total ms':>10}")
+            for name, histogram in sorted(self.spans.items(), key=lambda item: -item[1].total):
+                lines.append(f"   {name:<18}{histogram.count:>9}{histogram.mean:>10.3f}"
+                             f"{histogram.percentile(99):>9.2f}{histogram.max:>9.2f}"
+                             f"{histogram.total:>10.1f}")
+        for name, value in sorted({**self.counters, **self.gauges}.items()):
+            lines.append(f"   {name}: {value}")
+        return "\n".join(lines)
+
+    def prometheus(self, prefix="forca"):
+        """Métricas no formato de exposição em texto do Prometheus"""
+        lines = []
+        if self.spans:
+            metric = f"{prefix}_span_seconds"
+            lines.append(f"# HELP {metric} Duração das etapas instrumentadas")
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in sorted(self.spans.items()):
+                cumulative = 0
+                for limit, amount in zip(BUCKETS_MS, histogram.buckets):
+                    cumulative += amount
+                    lines.append(f'{metric}_bucket{{span="{name}",le="{limit / 1000:g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{span="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum{{span="{name}"}} {histogram.total / 1000:.9f}')
+                lines.append(f'{metric}_count{{span="{name}"}} {histogram.count}')
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        for name, value in sorted(self.gauges.items()):
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(self.prometheus())
+
+    def write_pstats(self, path):
+        """Grava o cProfile (abrir com python -m pstats ARQUIVO)"""
+        if self._cprofile is None:
+            raise ValueError("cProfile não foi ativado")
+        self._cprofile.dump_stats(path)
+
+    def reset(self):
+        self.spans.clear()
+        self.counters.clear()
+        self.gauges.clear()
+
+
+PROFILER = Profiler()
+
+
+def timed(name):
+    """Decorador que mede cada chamada como a etapa name quando o profiler está ligado"""
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                PROFILER.observe(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
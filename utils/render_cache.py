@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from utils.alphabet import LETTER_BITS, OTHER_BIT, mask_letters
+
+
+class LRUCache:
+    """Cache com limite de entradas e contadores de acertos/falhas"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key, build):
+        """Valor da chave, calculado por build() em caso de falha"""
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = self._data[key] = build()
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"LRUCache({len(self)}/{self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+
+class RenderCache:
+    """Cache de renderização do estado da rodada
+
+    As partes do quadro são guardadas prontas: palavra mascarada por
+    (palavra, máscara de acertos), letras usadas por máscara, forca e
+    barra de progresso por (erros, máximo). A chave usa a própria palavra
+    (o hash fica guardado na string), não o id: depois de uma recarga do
+    dicionário o mesmo id pode apontar para outra palavra. O texto vem do
+    formatter (a classe Display), então o terminal e os front-ends de rede
+    compartilham o mesmo cache e o mesmo visual. As linhas de resposta do
+    servidor também ficam guardadas já codificadas em bytes.
+    """
+
+    def __init__(self, formatter, maxsize=4096):
+        self.formatter = formatter
+        self.words = LRUCache(maxsize)
+        self.patterns = LRUCache(maxsize)
+        self.used = LRUCache(maxsize)
+        self.gauges = LRUCache(256)
+        self.encoded = LRUCache(maxsize)
+
+    @staticmethod
+    def _shown(letter, correct_mask):
+        return LETTER_BITS.get(letter, OTHER_BIT) & correct_mask
+
+    def word_line(self, word, correct_mask):
+        """Linha colorida da palavra com as letras descobertas"""
+        key = (word, correct_mask)
+        return self.words.get(key, lambda: self.formatter.word_line(
+            word, {letter for letter in word if self._shown(letter, correct_mask)}))
+
+    def pattern(self, word, correct_mask, hidden="_"):
+        """Palavra mascarada em texto puro (para protocolos de rede)"""
+        key = (word, correct_mask, hidden)
+        return self.patterns.get(key, lambda: "".join(
+            letter if self._shown(letter, correct_mask) else hidden for letter in word))
+
+    def line_bytes(self, line):
+        """Linha de resposta em UTF-8 com a quebra de linha, pronta para o socket"""
+        return self.encoded.get(line, lambda: (line + "\n").encode('utf-8'))
+
+    def used_letters_line(self, used_mask):
+        """Linha colorida das letras usadas ('' se nenhuma)"""
+        return self.used.get(used_mask, lambda: self.formatter.used_letters_line(
+            mask_letters(used_mask)) if used_mask else "")
+
+    def gauge_lines(self, errors, max_errors):
+        """Forca e barra de progresso para (erros, máximo)"""
+        return self.gauges.get((errors, max_errors),
+                               lambda: tuple(self.formatter.gauge_lines(errors, max_errors)))
+
+    def state_lines(self, word, correct_mask, used_mask, errors, max_errors):
+        """Linhas do estado completo, no mesmo formato de Display.game_state_lines"""
+        hangman, status = self.gauge_lines(errors, max_errors)
+        lines = list(hangman)
+        lines.append(self.word_line(word, correct_mask))
+        lines.append("")
+        used = self.used_letters_line(used_mask)
+        if used:
+            lines.append(used)
+        lines.extend(status)
+        return lines
+
+    def stats(self):
+        """Contadores de acertos e falhas de cada cache"""
+        return {
+            name: {"entries": len(cache), "hits": cache.hits, "misses": cache.misses}
+            for name, cache in (("words", self.words), ("patterns", self.patterns),
+                                ("used", self.used), ("gauges", self.gauges),
+                                ("encoded", self.encoded))
+        }
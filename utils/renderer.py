@@ -0,0 +1,74 @@
+import os
+import shutil
+import sys
+
+CURSOR_HOME = "\033[H"
+CLEAR_SCREEN = "\033[2J"
+CLEAR_LINE = "\033[K"
+CLEAR_BELOW = "\033[J"
+
+
+def move_to(row):
+    """Sequência ANSI para posicionar o cursor no início da linha row (1-based)"""
+    return f"\033[{row};1H"
+
+
+class FrameRenderer:
+    """Desenha quadros no terminal reescrevendo só as linhas alteradas
+
+    Guarda o quadro anterior; em um TTY cada novo quadro vira uma única
+    escrita com movimentos de cursor ANSI apenas para as linhas que mudaram.
+    Quando a saída não é um terminal (pipe, arquivo), cai para texto puro:
+    o quadro inteiro é escrito de uma vez, sem sequências de cursor.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.previous = None
+        try:
+            self.is_tty = self.stream.isatty()
+        except (AttributeError, ValueError):
+            self.is_tty = False
+        self.frames = 0
+        self.lines_written = 0
+
+    def clear(self):
+        """Limpa a tela e força o próximo quadro a ser desenhado por inteiro"""
+        self.previous = None
+        if self.is_tty and os.name != 'nt':
+            self.stream.write(CURSOR_HOME + CLEAR_SCREEN)
+            self.stream.flush()
+        elif self.is_tty:
+            os.system('cls')
+
+    def invalidate(self):
+        """Esquece o quadro anterior (algo foi escrito fora do renderizador)"""
+        self.previous = None
+
+    def render(self, lines):
+        """Desenha o quadro: lista de linhas já formatadas (com cores)"""
+        self.frames += 1
+        if not self.is_tty or os.name == 'nt' or len(lines) >= shutil.get_terminal_size().lines:
+            # Saída de texto puro (ou quadro maior que a tela: cursor absoluto não serve)
+            self.previous = None
+            self.lines_written += len(lines)
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+            return
+
+        previous = self.previous
+        chunks = []
+        if previous is None:
+            chunks.append(CURSOR_HOME + CLEAR_SCREEN)
+            previous = []
+
+        for row, line in enumerate(lines, 1):
+            if row > len(previous) or previous[row - 1] != line:
+                chunks.append(move_to(row) + line + CLEAR_LINE)
+                self.lines_written += 1
+
+        # Cursor logo abaixo do quadro, apagando o que sobrou (prompt antigo etc.)
+        chunks.append(move_to(len(lines) + 1) + CLEAR_BELOW)
+        self.stream.write("".join(chunks))
+        self.stream.flush()
+        self.previous = list(lines)
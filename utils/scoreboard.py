@@ -0,0 +1,286 @@
+import heapq
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from utils.leaderboard import ALL_TIME, Leaderboard
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem travas entre processos
+    fcntl = None
+
+
+class _FileLock:
+    """Trava de arquivo entre processos (flock), no-op onde não existe"""
+
+    def __init__(self, path):
+        self.path = path
+        self._handle = None
+
+    def acquire(self, shared=False):
+        self._handle = open(self.path, 'a')
+        if fcntl is not None:
+            fcntl.flock(self._handle, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        return self
+
+    def release(self):
+        if self._handle is not None:
+            if fcntl is not None:
+                fcntl.flock(self._handle, fcntl.LOCK_UN)
+            self._handle.close()
+            self._handle = None
+
+    def shared(self):
+        return self.acquire(shared=True)
+
+    def __enter__(self):
+        if self._handle is None:
+            self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class Scoreboard:
+    """Placar com log de registros só-de-acréscimo e snapshot compactado
+
+    Cada resultado é acrescentado como uma linha JSON em placar.log, sob
+    trava de arquivo (vários processos podem jogar ao mesmo tempo). O top-K
+    fica em um heap em memória, então consultar o placar custa O(K) e não
+    exige reler o arquivo inteiro. De tempos em tempos o log é compactado
+    no snapshot placar.json, que mantém o formato antigo (lista ordenada).
+
+    Em paralelo, o Leaderboard mantém rankings com o melhor resultado de
+    cada jogador por janela (dia, semana, sempre) e por dificuldade; a
+    compactação preserva todo registro presente em algum desses rankings.
+    """
+
+    SNAPSHOT = "placar.json"
+    LOG = "placar.log"
+    LOCK = "placar.lock"
+    LEGACY = "placar.txt"
+
+    def __init__(self, data_dir, top_k=100, fsync_every=8, compact_every=500):
+        self.data_dir = Path(data_dir)
+        self.snapshot_path = self.data_dir / self.SNAPSHOT
+        self.log_path = self.data_dir / self.LOG
+        self.legacy_path = self.data_dir / self.LEGACY
+        self.lock = _FileLock(self.data_dir / self.LOCK)
+        self.top_k = top_k
+        self.fsync_every = fsync_every
+        self.compact_every = compact_every
+
+        self._heap = []
+        self._sequence = 0
+        self.leaderboard = Leaderboard(top_k)
+        self._log = None
+        self._log_inode = None
+        self._log_offset = 0
+        self._log_records = 0
+        self._unsynced = 0
+
+        with self.lock:
+            self._migrate_legacy()
+            self._reload()
+
+    # ------------------------------------------------------------------
+    # Estado em memória
+    # ------------------------------------------------------------------
+
+    def _push(self, record):
+        """Insere um registro no heap top-K (empates: mantém o mais antigo)"""
+        self._sequence += 1
+        item = (record.get("score", 0), -self._sequence, record)
+        self.leaderboard.add(item)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, item)
+        elif item > self._heap[0]:
+            heapq.heapreplace(self._heap, item)
+
+    def _read_snapshot(self):
+        """Lê o snapshot JSON (formato antigo de placar.json)"""
+        if not self.snapshot_path.exists():
+            return []
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as file:
+                scores = json.load(file)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return []
+        return scores if isinstance(scores, list) else []
+
+    def _reload(self):
+        """Reconstrói o heap a partir do snapshot e do log atual"""
+        self._heap = []
+        self._sequence = 0
+        self.leaderboard.clear()
+        for record in self._read_snapshot():
+            self._push(record)
+
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self.log_path, 'a+b')
+        self._log_inode = os.fstat(self._log.fileno()).st_ino
+        self._log_offset = 0
+        self._log_records = 0
+        self._catch_up()
+
+    def _catch_up(self):
+        """Aplica ao heap os registros acrescentados ao log desde a última leitura"""
+        try:
+            if os.stat(self.log_path).st_ino != self._log_inode:
+                # Log foi compactado por outro processo
+                self._reload()
+                return
+        except FileNotFoundError:
+            self._reload()
+            return
+
+        self._log.seek(self._log_offset)
+        data = self._log.read()
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return
+
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue  # linha corrompida: ignora
+            self._push(record)
+            self._log_records += 1
+        self._log_offset += end
+
+    # ------------------------------------------------------------------
+    # Operações públicas
+    # ------------------------------------------------------------------
+
+    def add(self, player_name, score, difficulty=None):
+        """Registra um resultado no log e no top-K em memória"""
+        now = datetime.now()
+        record = {
+            "player": player_name,
+            "score": score,
+            "timestamp": now.isoformat(),
+            "date": now.strftime("%d/%m/%Y %H:%M")
+        }
+        if difficulty is not None:
+            record["difficulty"] = difficulty
+        self._append(record)
+        return record
+
+    def _append(self, record):
+        """Acrescenta um registro ao log sob trava exclusiva"""
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+        with self.lock:
+            self._catch_up()
+            self._log.seek(0, os.SEEK_END)
+            self._log.write(line)
+            self._log.flush()
+            self._log_offset = self._log.tell()
+            self._log_records += 1
+            self._push(record)
+
+            # fsync em lote: um a cada fsync_every registros
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                os.fsync(self._log.fileno())
+                self._unsynced = 0
+
+            if self._log_records >= self.compact_every:
+                self._compact()
+
+    def top(self):
+        """Retorna o top-K ordenado por pontuação (decrescente)"""
+        with self.lock.shared():
+            self._catch_up()
+        return [record for _, _, record in sorted(self._heap, reverse=True)]
+
+    def ranking(self, window=ALL_TIME, difficulty=None, limit=10):
+        """Melhor resultado de cada jogador na janela/dificuldade (só memória)"""
+        return self.leaderboard.top(window, difficulty, limit)
+
+    def compact(self):
+        """Grava o top-K no snapshot e recomeça o log"""
+        with self.lock:
+            self._catch_up()
+            self._compact()
+
+    def _compact(self):
+        """Compactação propriamente dita (chamar com a trava exclusiva)"""
+        items = {item[1]: item for item in self._heap}
+        items.update((item[1], item) for item in self.leaderboard.items())
+        scores = [record for _, _, record in sorted(items.values(), reverse=True)]
+
+        temp_path = self.snapshot_path.with_suffix(".json.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(scores, file, ensure_ascii=False, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        # Log novo (outro inode): os demais processos detectam e recarregam
+        temp_log = self.log_path.with_suffix(".log.tmp")
+        open(temp_log, 'wb').close()
+        os.replace(temp_log, self.log_path)
+        self._reload()
+        self._unsynced = 0
+
+    def _migrate_legacy(self):
+        """Importa o placar.txt antigo ("Nome: pontos") para o log
+
+        O formato antigo não tem data por linha, então linhas repetidas
+        (mesmo nome e pontos) são indistinguíveis e entram uma só vez.
+        """
+        if not self.legacy_path.exists():
+            return
+
+        modified = datetime.fromtimestamp(self.legacy_path.stat().st_mtime)
+        lines = []
+        seen = set()
+        try:
+            with open(self.legacy_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    name, separator, points = line.rpartition(":")
+                    if not separator or not name.strip():
+                        continue
+                    try:
+                        score = int(points.strip())
+                    except ValueError:
+                        continue
+                    key = (name.strip(), score)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    record = {
+                        "player": key[0],
+                        "score": score,
+                        "timestamp": modified.isoformat(),
+                        "date": modified.strftime("%d/%m/%Y %H:%M")
+                    }
+                    lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+        except UnicodeDecodeError:
+            print(f"⚠️  Aviso: Não foi possível migrar {self.LEGACY}")
+            return
+
+        with open(self.log_path, 'ab') as log:
+            log.write("".join(lines).encode('utf-8'))
+            log.flush()
+            os.fsync(log.fileno())
+        os.replace(self.legacy_path, self.legacy_path.with_suffix(".txt.migrado"))
+
+    def close(self):
+        """Sincroniza registros pendentes e fecha o log"""
+        if self._log is not None:
+            if self._unsynced:
+                os.fsync(self._log.fileno())
+                self._unsynced = 0
+            self._log.close()
+            self._log = None
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __repr__(self):
+        return f"Scoreboard('{self.data_dir}', top_k={self.top_k})"
@@ -0,0 +1,86 @@
+import struct
+from multiprocessing import shared_memory
+from pathlib import Path
+from utils.compiled_words import CompiledWordStore, PackedWords, encode_words
+
+# Segmento: tamanho do caminho de origem (uint64), caminho em UTF-8,
+# alinhamento em 8 bytes e a imagem no formato compilado
+PREFIX = struct.Struct("<Q")
+DEFAULT_NAME = "forca-palavras"
+
+
+def _attach(name):
+    """Abre um segmento existente sem registrá-lo para remoção neste processo"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: o resource_tracker removeria o segmento ao sair
+        from multiprocessing import resource_tracker
+        segment = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+class SharedWordStore(PackedWords):
+    """Dicionário em memória compartilhada (multiprocessing.shared_memory)
+
+    Um processo lançador carrega o dicionário uma vez com create(); os
+    processos de jogo usam attach() e leem o mesmo segmento, somente
+    leitura, sem analisar arquivo nenhum. A memória não cresce com o
+    número de processos.
+    """
+
+    def __init__(self, segment, owner=False):
+        self._segment = segment
+        self.owner = owner
+        self.name = segment.name
+        self.invalid_count = 0
+
+        buffer = segment.buf.toreadonly()
+        (path_size,) = PREFIX.unpack_from(buffer, 0)
+        start = PREFIX.size + path_size
+        self.filepath = Path(str(buffer[PREFIX.size:start], 'utf-8'))
+        image_start = (start + 7) & ~7
+        self._view = buffer
+        self._image = buffer[image_start:]
+        self._parse(self._image)
+
+    @classmethod
+    def create(cls, words, name=DEFAULT_NAME):
+        """Copia um WordStore/CompiledWordStore para um novo segmento"""
+        if isinstance(words, CompiledWordStore):
+            with open(words.filepath, 'rb') as file:
+                image = file.read()
+        else:
+            image = encode_words(words)
+
+        path = str(words.filepath).encode('utf-8')
+        image_start = (PREFIX.size + len(path) + 7) & ~7
+        segment = shared_memory.SharedMemory(name=name, create=True, size=image_start + len(image))
+        segment.buf[:PREFIX.size] = PREFIX.pack(len(path))
+        segment.buf[PREFIX.size:PREFIX.size + len(path)] = path
+        segment.buf[image_start:image_start + len(image)] = image
+        return cls(segment, owner=True)
+
+    @classmethod
+    def attach(cls, name=DEFAULT_NAME):
+        """Conecta a um segmento criado por outro processo"""
+        try:
+            return cls(_attach(name))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Dicionário compartilhado não encontrado: {name}")
+
+    def close(self):
+        """Desconecta do segmento (e o remove, se este processo o criou)"""
+        if self._segment is None:
+            return
+        self._release_views()
+        self._image.release()
+        self._view.release()
+        self._segment.close()
+        if self.owner:
+            self._segment.unlink()
+        self._segment = None
+
+    def __repr__(self):
+        return f"SharedWordStore('{self.name}', words={len(self)})"
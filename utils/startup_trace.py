@@ -0,0 +1,164 @@
+import sys
+import threading
+import time
+
+
+class _TimedLoader:
+    """Embrulha o carregador de um módulo para medir a execução dele"""
+
+    def __init__(self, loader, trace):
+        self._loader = loader
+        self._trace = trace
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with _ImportFrame(self._trace, module.__name__):
+            self._loader.exec_module(module)
+        # Depois de executado, o módulo volta a apontar para o carregador original
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+
+class _TimingFinder:
+    """Localizador no início de sys.meta_path que delega aos demais"""
+
+    def __init__(self, trace):
+        self.trace = trace
+
+    def find_spec(self, name, path=None, target=None):
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self.trace)
+        return spec
+
+
+class _ImportFrame:
+    """Importação em andamento: o tempo próprio exclui as importações aninhadas"""
+
+    __slots__ = ("trace", "name", "start", "children")
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.children = 0.0
+        self.trace._stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        total = (time.perf_counter() - self.start) * 1000
+        stack = self.trace._stack
+        stack.pop()
+        if stack:
+            stack[-1].children += total
+        self.trace.imports.append((self.name, total - self.children, total, len(stack)))
+        return False
+
+
+class _Phase:
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.trace.phases.append((self.name, (time.perf_counter() - self.start) * 1000))
+        return False
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class StartupTrace:
+    """Tempo de importação de cada módulo e das etapas até o jogo ficar pronto
+
+    Desligado por padrão (phase() e mark() só verificam a flag). install()
+    põe um localizador no início de sys.meta_path que mede a execução de
+    cada módulo importado dali em diante, com tempo próprio e acumulado
+    como no python -X importtime; só a thread principal é medida. phase()
+    mede etapas da inicialização e mark() anota instantes desde o início.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.imports = []
+        self.phases = []
+        self.marks = []
+        self._stack = []
+        self._finder = None
+        self._started = None
+
+    def install(self):
+        """Liga o rastreamento (chame antes das importações a medir)"""
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+        self.enabled = True
+        self._started = time.perf_counter()
+
+    def uninstall(self):
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+        self.enabled = False
+
+    def phase(self, name):
+        """Contexto que mede uma etapa: with TRACE.phase("dicionário"): ..."""
+        return _Phase(self, name) if self.enabled else _NULL_PHASE
+
+    def mark(self, name):
+        """Anota o instante (desde install) em que algo ficou pronto"""
+        if self.enabled:
+            self.marks.append((name, (time.perf_counter() - self._started) * 1000))
+
+    def report(self, limit=15):
+        """Tabela de importações mais lentas, etapas e marcos para o terminal"""
+        lines = ["🚀 Inicialização"]
+        if self.imports:
+            total = sum(own for _, own, _, _ in self.imports)
+            lines.append(f"   Importações: {len(self.imports)} módulos, {total:.1f} ms")
+            lines.append(f"   {'módulo':<40}{'próprio ms':>11}{'acumulado ms':>14}")
+            slowest = sorted(self.imports, key=lambda item: -item[2])[:limit]
+            for name, own, accumulated, depth in slowest:
+                lines.append(f"   {'  ' * min(depth, 4) + name:<40}{own:>11.2f}{accumulated:>14.2f}")
+        for name, ms in self.phases:
+            lines.append(f"   {name:<40}{ms:>11.2f} ms")
+        for name, ms in self.marks:
+            lines.append(f"   {name:<40}{'em':>11} {ms:.1f} ms")
+        return "\n".join(lines)
+
+
+TRACE = StartupTrace()
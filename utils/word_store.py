@@ -0,0 +1,181 @@
+import mmap
+import unicodedata
+import zlib
+from array import array
+from utils.alphabet import letter_mask
+
+
+class WordStore:
+    """Dicionário de palavras mapeado em memória com acesso aleatório
+
+    O arquivo é lido com mmap e validado em uma única passada, que guarda
+    apenas uma tabela de offsets (início e tamanho em bytes de cada palavra
+    válida) e o tamanho em letras de cada palavra. As palavras são
+    decodificadas sob demanda, então o custo em memória é o da tabela,
+    não o das strings.
+
+    Com private=True (só na recarga a quente, --watch) o arquivo é lido
+    para uma cópia própria em vez de mapeado: se palavras.txt for
+    reescrito ou truncado no lugar, um mmap leria páginas que deixaram de
+    existir e o processo morreria com SIGBUS antes da troca de versão.
+
+    Acentos em forma decomposta (NFD, comum em arquivos vindos do macOS)
+    são normalizados para NFC; needs_nfc indica que o arquivo tem alguma
+    palavra assim, e só então a leitura paga a normalização.
+    """
+
+    def __init__(self, filepath, private=False):
+        self.filepath = filepath
+        self.private = private
+        self.offsets = array('Q')
+        self.sizes = array('H')
+        self.lengths = array('H')
+        self.invalid_count = 0
+        self.needs_nfc = False
+        self.scanned_size = 0
+        self.complete_words = 0
+        self._complete_invalid = 0
+        self._prefix_crc = None
+        self._file = None
+        self._data = None
+        self._open()
+
+    @classmethod
+    def appended(cls, previous):
+        """Novo WordStore do mesmo arquivo reaproveitando a tabela de previous
+
+        Só os bytes acrescentados depois da última linha completa de
+        previous são validados. Retorna None se o conteúdo já lido mudou
+        (o arquivo não foi apenas acrescido) e é preciso recarregar tudo.
+        """
+        store = cls.__new__(cls)
+        store.filepath = previous.filepath
+        store.private = previous.private
+        words = previous.complete_words
+        store.offsets = previous.offsets[:words]
+        store.sizes = previous.sizes[:words]
+        store.lengths = previous.lengths[:words]
+        store.invalid_count = previous._complete_invalid
+        store.needs_nfc = previous.needs_nfc
+        store.scanned_size = store.complete_words = store._complete_invalid = 0
+        store._prefix_crc = None
+        store._file = None
+        store._map_file()
+
+        crc = previous.prefix_crc()
+        if len(store._data) < previous.scanned_size or store._crc(0, previous.scanned_size) != crc:
+            store.close()
+            return None
+        store._scan(previous.scanned_size)
+        store._prefix_crc = store._crc(previous.scanned_size, store.scanned_size, crc)
+        return store
+
+    def _crc(self, start, end, crc=0):
+        if self._data is None or start >= end:
+            return crc
+        with memoryview(self._data) as view:
+            return zlib.crc32(view[start:end], crc)
+
+    def prefix_crc(self):
+        """CRC32 das linhas completas, calculado uma vez (base de appended())
+
+        Guardado à parte para que appended() compare só o CRC, sem manter
+        duas cópias do prefixo lado a lado.
+        """
+        if self._prefix_crc is None:
+            self._prefix_crc = self._crc(0, self.scanned_size)
+        return self._prefix_crc
+
+    def _map_file(self):
+        """Mapeia o arquivo (ou copia seus bytes, se private)"""
+        if self.private:
+            with open(self.filepath, 'rb') as file:
+                self._data = file.read()
+            return
+        self._file = open(self.filepath, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Arquivo vazio não pode ser mapeado
+            self._data = b""
+
+    def _open(self):
+        """Mapeia o arquivo e constrói a tabela de offsets"""
+        self._map_file()
+        self._scan()
+
+    def _scan(self, start=0):
+        """Valida as linhas (não vazias, apenas letras) em uma única passada
+
+        Guarda até onde as linhas terminadas em quebra de linha foram lidas
+        (scanned_size), para que appended() continue dali.
+        """
+        data = self._data
+        end = len(data)
+        while start < end:
+            newline = data.find(b'\n', start)
+            if newline == -1:
+                # Última linha sem quebra: pode ainda estar sendo escrita
+                self.scanned_size = start
+                self.complete_words = len(self.offsets)
+                self._complete_invalid = self.invalid_count
+                newline = end
+
+            raw = data[start:newline]
+            stripped = raw.strip()
+            if stripped:
+                word = stripped.decode('utf-8').lower()
+                if not word.isascii() and not unicodedata.is_normalized("NFC", word):
+                    word = unicodedata.normalize("NFC", word)
+                    self.needs_nfc = True
+                if word.isalpha():
+                    self.offsets.append(start + len(raw) - len(raw.lstrip()))
+                    self.sizes.append(len(stripped))
+                    self.lengths.append(len(word))
+                else:
+                    self.invalid_count += 1
+
+            start = newline + 1
+
+        if start == end:
+            self.scanned_size = end
+            self.complete_words = len(self.offsets)
+            self._complete_invalid = self.invalid_count
+
+    def mask(self, index):
+        """Máscara de letras da palavra (calculada sob demanda)"""
+        return letter_mask(self[index])
+
+    def close(self):
+        """Libera o mapeamento (ou a cópia) e o arquivo"""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start = self.offsets[index]
+        word = self._data[start:start + self.sizes[index]].decode('utf-8').lower()
+        if self.needs_nfc:
+            return unicodedata.normalize("NFC", word)
+        return word
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self):
+        return f"WordStore('{self.filepath}', words={len(self)})"